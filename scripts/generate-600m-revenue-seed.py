@@ -18,12 +18,53 @@
 - 客户分布：菜市场600家，商超60家，批发商24家（总计684家）
 - 订单总量：约40,032单/年
 - 时间范围：2025-01-01 至 2025-12-31
+
+用法：
+  python generate-600m-revenue-seed.py --output /tmp/seed.sql
+  python generate-600m-revenue-seed.py --help                      # 全部参数
+单文件SQL输出默认走产物缓存：按 参数+源码 哈希复用已生成的产物（gzip 存于 ~/.cache/qianzhang-seed，
+可用 --cache-dir 指定，CI 中指向跨任务保留的缓存目录即可复用），总大小超过 --cache-size（默认 2GB）
+按最近使用时间淘汰；--no-cache 强制重新生成。
 """
 
+import argparse
+import copy
+import os
 import random
+import shlex
+import tempfile
+import sys
 import datetime
 
-random.seed(42)
+from seedgen.bom import BOM_CONFIG, derive_demand, generate_bom, write_demand_csv
+from seedgen.cache import DEFAULT_CACHE_DIR, ArtifactCache, cache_key, source_files
+from seedgen.customer_size import CUSTOMER_SIZE_CONFIG, CustomerSizeModel
+from seedgen.delta import DeltaCapture, write_delta
+from seedgen.demand import DEMAND_CONFIG, DemandModel
+from seedgen.formats import DATE_COMPACT, DATE_STR, DATETIME_STR, TIMES, compile_row_encoder, month_dates
+from seedgen.growth import GROWTH_CONFIG, GrowthModel
+from seedgen.ingest import IngestOutput
+from seedgen.inventory import (DAILY_BALANCE_COLUMNS, DAILY_BALANCE_DDL, INVENTORY_COLUMNS, INVENTORY_CONFIG,
+                               INVENTORY_LOG_COLUMNS, InventoryLedger)
+from seedgen.leads import (ACTIVITY_COLUMNS, LEAD_COLUMNS, LEADS_CONFIG, LEADS_DDL, STATUS_HISTORY_COLUMNS,
+                           LeadFunnel)
+from seedgen.metrics import MeteredOutput, ProgressMetrics
+from seedgen.mutations import MUTATION_CONFIG, MutationStream, TokenBucket
+from seedgen.payloads import (CUSTOMER_PAYLOAD_COLUMNS, ORDER_ITEM_PAYLOAD_COLUMNS, ORDER_PAYLOAD_COLUMNS, PAYLOAD_CONFIG,
+                              PayloadGenerator, configure_payloads)
+from seedgen.registry import CustomerRegistry, customer_contact, customer_name, sample_customers
+from seedgen.sampling import SAMPLER_METHODS, make_sampler, uniform
+from seedgen.scenarios import SCENARIOS, describe, deviations, scenario_baseline, scenario_defaults, scenario_label
+from seedgen.sales_org import (ORGANIZATION_COLUMNS, OWNER_HISTORY_COLUMNS, OWNER_HISTORY_DDL, SALES_ORG_CONFIG,
+                               SALES_TARGET_COLUMNS, USER_COLUMNS, SalesOrganization)
+from seedgen.shadow import ReseedPlan
+from seedgen.shards import SHARD_FUNCTIONS, ShardedOutput, expand_keys, shard_paths
+from seedgen.split import SplitOutput
+from seedgen.stats import DistributionReport
+from seedgen.sql import SqlOutput, append_inserts
+from seedgen.tenants import TENANT_CONFIG, TenantModel
+from seedgen.verify import ExpectationRecorder
+
 
 START_DATE = datetime.date(2025, 1, 1)
 END_DATE = datetime.date(2025, 12, 31)
@@ -78,20 +119,63 @@ DRIVERS = [
 INSPECTORS = ['质检员-王刚', '质检员-李明', '质检员-张华', '质检员-赵强']
 RAW_MATERIALS = ['东北非转基因大豆', '本地有机大豆', '进口优质大豆']
 
+# 分类分布权重表（由 seedgen.sampling 预建抽样器）
+ORDER_STATUS_WEIGHTS = [('FULFILLED', 80), ('APPROVED', 15), ('PENDING_REVIEW', 5)]
+PRODUCTS_PER_ORDER_WEIGHTS = uniform([1, 2, 3])
+QUALITY_RESULT_WEIGHTS = [('PASS', 95), ('FAIL', 5)]
+
+DEFAULT_OUTPUT_FILE = '/home/ubuntu/ops-frontend/scripts/seed-600m-revenue.sql'
+DEFAULT_SEED = 42
+
+CUSTOMER_COLUMNS = ['id', 'org_id', 'name', 'customer_code', 'category', 'contact', 'phone', 'address', 'created_at', 'updated_at']
+ORDER_COLUMNS = ['id', 'org_id', 'order_no', 'customer_id', 'total_amount', 'status', 'order_date', 'created_by', 'created_at', 'updated_at']
+ORDER_ITEM_COLUMNS = ['id', 'order_id', 'product_id', 'product_name', 'sku', 'unit_price', 'quantity', 'subtotal', 'created_at', 'updated_at']
+PRODUCTION_PLAN_COLUMNS = ['id', 'batch_no', 'product_name', 'planned_quantity', 'actual_quantity', 'raw_material', 'raw_material_batch', 'production_date', 'expiry_date', 'quality_inspector', 'quality_result', 'created_at', 'updated_at']
+DELIVERY_RECORD_COLUMNS = ['id', 'order_id', 'driver_id', 'driver_name', 'vehicle_no', 'departure_time', 'arrival_time', 'temperature', 'status', 'created_at', 'updated_at']
+
+# 行编码器：每列一个类型字符（n 数值，s 字符串，q 需转义的字符串），启动时编译一次
+CUSTOMER_ROW = compile_row_encoder(CUSTOMER_COLUMNS, 'nnssssssss')
+ORDER_ROW = compile_row_encoder(ORDER_COLUMNS, 'nnsnnssnss')
+ORDER_ITEM_ROW = compile_row_encoder(ORDER_ITEM_COLUMNS, 'nnnqsnnnss')
+PRODUCTION_PLAN_ROW = compile_row_encoder(PRODUCTION_PLAN_COLUMNS, 'nsqnnssssssss')
+DELIVERY_RECORD_ROW = compile_row_encoder(DELIVERY_RECORD_COLUMNS, 'nnnssssnsss')
+# 宽行模式（--payloads）：文本列为预转义的 SQL 字面量（或 NULL）
+CUSTOMER_WIDE_ROW = compile_row_encoder(CUSTOMER_COLUMNS + CUSTOMER_PAYLOAD_COLUMNS, 'nnsssssnssn')
+ORDER_WIDE_ROW = compile_row_encoder(ORDER_COLUMNS + ORDER_PAYLOAD_COLUMNS, 'nnsnnssnssnnnnn')
+ORDER_ITEM_WIDE_ROW = compile_row_encoder(ORDER_ITEM_COLUMNS + ORDER_ITEM_PAYLOAD_COLUMNS, 'nnnqsnnnssn')
+
+# 单年内订单类数据超过该行数即先行输出，限制内存占用
+ORDER_FLUSH_ROWS = 200000
+# 客户数据按块输出（500 的整数倍，INSERT 分批与一次性输出相同）
+CUSTOMER_FLUSH_ROWS = 100000
+
+def generate_customer_row(customer_id, category, created_at, org_id=ORG_ID, payloads=None):
+    """返回 customers VALUES 元组；名称、联系人由 id 与类别现算"""
+    customer_code = f"C{customer_id:06d}"
+    phone = f"138{random.randint(10000000, 99999999)}"
+    if payloads:
+        address, remark = payloads.customer(customer_id)
+        return CUSTOMER_WIDE_ROW(customer_id, org_id, customer_name(customer_id, category), customer_code, category,
+                                 customer_contact(customer_id, category), phone, address, created_at, created_at, remark)
+    address = f"地址{customer_id}"
+    return CUSTOMER_ROW(customer_id, org_id, customer_name(customer_id, category), customer_code, category,
+                        customer_contact(customer_id, category), phone, address, created_at, created_at)
+
+def skip_customer_row(payloads=None):
+    """样本外客户：消耗与 generate_customer_row 相同的随机数，不格式化整行"""
+    random.randint(10000000, 99999999)
+    if payloads:
+        payloads.skip_customer()
+
 def generate_order_no(date, order_id):
-    return f"ORD-{date.strftime('%Y%m%d')}-{order_id:06d}"
+    return f"ORD-{DATE_COMPACT[date]}-{order_id:06d}"
 
 def generate_batch_no(date, sequence):
-    return f"QZ{date.strftime('%Y%m%d')}{sequence:04d}"
+    return f"QZ{DATE_COMPACT[date]}{sequence:04d}"
 
 def random_date_in_month(year, month):
-    if month == 12:
-        next_month = datetime.date(year + 1, 1, 1)
-    else:
-        next_month = datetime.date(year, month + 1, 1)
-    days_in_month = (next_month - datetime.date(year, month, 1)).days
-    random_day = random.randint(1, days_in_month)
-    return datetime.date(year, month, random_day)
+    dates = month_dates(year, month)
+    return dates[random.randint(1, len(dates)) - 1]
 
 def generate_order_amount_fen(category):
     config = CUSTOMER_CONFIG[category]
@@ -101,67 +185,340 @@ def generate_order_amount_fen(category):
     return max(50000, int(round(amount)))  # 最低500元=50000分
 
 
-def main():
+def stage_config(config, args, **overrides):
+    """阶段配置：各阶段的独立种子随 --seed 平移（默认种子下与 CONFIG 相同），有分类抽样的阶段随 --sampler"""
+    if 'sampler' in config:
+        overrides.setdefault('sampler', args.sampler)
+    return dict(config, seed=config['seed'] + args.seed - DEFAULT_SEED, **overrides)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='生成6亿年营收的SQL种子数据')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE, help='SQL输出文件路径')
+    parser.add_argument('--scenario', choices=list(SCENARIOS),
+                        help='按命名场景生成（固定种子、规模、分布与启用的阶段），显式给出的参数仍然优先')
+    parser.add_argument('--list-scenarios', action='store_true', help='列出命名场景及其参数后退出')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='随机种子（各阶段的独立种子随之平移）')
+    parser.add_argument('--bom', action='store_true',
+                        help='同时生成物料主档(materials)、多层BOM(bom_items)和MRP需求文件')
+    parser.add_argument('--bom-finished-goods', type=int, default=BOM_CONFIG['finished_goods'],
+                        help='成品数（超出PRODUCTS的部分为派生规格）')
+    parser.add_argument('--bom-depth', type=int, default=BOM_CONFIG['depth'], help='BOM层数')
+    parser.add_argument('--bom-width', type=int, default=BOM_CONFIG['width'], help='每个节点的最大子件数')
+    parser.add_argument('--bom-raw-materials', type=int, default=BOM_CONFIG['raw_materials'], help='原料池大小')
+    parser.add_argument('--inventory', action='store_true',
+                        help='同时生成库存主表、出入库流水(inventory_log)和日终结存快照')
+    parser.add_argument('--inventory-count-interval', type=int, default=INVENTORY_CONFIG['count_interval_days'],
+                        help='盘点周期（天）')
+    parser.add_argument('--sales-org', action='store_true',
+                        help='生成多层销售组织（大区/团队/战区/代表）和客户归属变更，订单created_by按归属代表填写')
+    parser.add_argument('--org-regions', type=int, default=SALES_ORG_CONFIG['regions'], help='大区数')
+    parser.add_argument('--org-teams-per-region', type=int, default=SALES_ORG_CONFIG['teams_per_region'],
+                        help='每个大区的团队数')
+    parser.add_argument('--org-span', type=int, default=SALES_ORG_CONFIG['reps_per_team'],
+                        help='每个经理管理的代表数（span of control）')
+    parser.add_argument('--org-transfer-rate', type=float, default=SALES_ORG_CONFIG['transfer_rate'],
+                        help='每个客户每年的归属转移概率')
+    parser.add_argument('--leads', action='store_true',
+                        help='生成线索、跟进记录和状态流转，部分线索转化为生成的客户（客户created_at取转化日期）')
+    parser.add_argument('--leads-total', type=int, default=LEADS_CONFIG['total'],
+                        help='线索总数（默认按 客户数×来源占比÷转化率 推导）')
+    parser.add_argument('--leads-conversion-rate', type=float, default=LEADS_CONFIG['conversion_rate'],
+                        help='线索转化率')
+    parser.add_argument('--demand-model', action='store_true',
+                        help='订单日期按季节/星期/春节/促销权重抽样，下单时刻按客户类型日内分布抽样')
+    parser.add_argument('--customer-size-dist', choices=['pareto', 'lognormal'],
+                        help='客户规模长尾分布（默认不启用，同类客户规模一致）')
+    parser.add_argument('--customer-size-shape', type=float,
+                        help='分布形状参数：pareto为alpha（默认%(pareto)s），lognormal为sigma（默认%(lognormal)s）' % {
+                            'pareto': CUSTOMER_SIZE_CONFIG['pareto_alpha'],
+                            'lognormal': CUSTOMER_SIZE_CONFIG['lognormal_sigma']})
+    parser.add_argument('--payloads', action='store_true',
+                        help='宽行模式：地址、备注、审核意见等文本列按长度分布填充中文（UTF-8多字节）')
+    parser.add_argument('--payload-scale', type=float, default=1.0, help='宽行模式下各文本列长度的放大倍数')
+    parser.add_argument('--payload-column', action='append', default=[], metavar='TABLE.COLUMN=FILL:MEDIAN:MAX',
+                        help='覆盖单列的填充率、中位长度与最大长度（字符），可重复，如 orders.remark=0.8:200:4000')
+    parser.add_argument('--mutation-stream', metavar='PATH',
+                        help='订单生命周期变更流输出（"-"为标准输出）；启用后静态SQL不再包含orders/order_items/delivery_records')
+    parser.add_argument('--mutation-rate', type=float, default=0,
+                        help='变更流输出速率（语句/秒，0为不限速）')
+    parser.add_argument('--mutation-burst', type=float, default=0,
+                        help='令牌桶容量（突发语句数，默认等于速率）')
+    parser.add_argument('--customer-scale', type=float, default=1.0,
+                        help='客户数倍率（各类客户数 × 倍率，订单量与营收随之等比放大）')
+    parser.add_argument('--sample-customers', type=float, default=1.0, metavar='FRACTION',
+                        help='按客户抽样（如0.01）：只生成样本客户及其全部订单/订单项/生产计划/配送记录，耗时与样本量成正比')
+    parser.add_argument('--tenants', type=int, default=TENANT_CONFIG['tenants'],
+                        help='租户（org_id）数：少数大租户 + 长尾小租户，客户按租户规模随机归属')
+    parser.add_argument('--tenant-large', type=int, default=TENANT_CONFIG['large_tenants'], help='头部大租户数')
+    parser.add_argument('--shards', type=int, default=1,
+                        help='按customer_id分片输出的分片数（客户拥有的行路由到各分片文件，其余数据复制到每个分片）')
+    parser.add_argument('--shard-function', default='crc32',
+                        help='分片函数：%s，或 package.module:function（f(customer_id, 分片数)）' % '/'.join(SHARD_FUNCTIONS))
+    parser.add_argument('--split-dir', metavar='DIR',
+                        help='按表/按块拆分输出到目录并生成加载清单manifest.json（用 python -m seedgen.loader 并发导入）')
+    parser.add_argument('--split-rows', type=int, default=100000, help='拆分输出时每个数据块的最大行数')
+    parser.add_argument('--ingest', metavar='DRIVER:DSN',
+                        help='直接写入数据库（任意DB-API 2.0驱动），如 sqlite3:/tmp/seed.db 或 '
+                             'pymysql:host=127.0.0.1,user=root,password=xxx,database=qianzhang_sales')
+    parser.add_argument('--ingest-workers', type=int, default=4, help='入库连接数（消费者线程数）')
+    parser.add_argument('--ingest-queue', type=int, default=64, help='批次队列容量（满时生成端阻塞）')
+    parser.add_argument('--shadow', action='store_true',
+                        help='影子表重灌：写入 *_shadow（CREATE TABLE LIKE），最后一条多表 RENAME TABLE 原子切换，代替 DELETE FROM')
+    parser.add_argument('--delta-from', metavar='OLD_ARGS',
+                        help='差异模式：按引号内的旧参数和当前参数各生成一次，按主键比较，--output 只写入 INSERT/UPDATE/DELETE 差异，'
+                             '如 --delta-from="--customer-size-dist pareto"（以--开头的值需用=连接）')
+    parser.add_argument('--years', type=int, default=1,
+                        help='生成年数（从%s年起逐年输出，第2年起模拟客户获客/流失、调价和业务量增长）' % START_DATE.year)
+    parser.add_argument('--volume-growth', type=float, default=GROWTH_CONFIG['volume_growth'], help='年度业务量增长率')
+    parser.add_argument('--price-inflation', type=float, default=GROWTH_CONFIG['price_inflation'], help='年度调价幅度')
+    parser.add_argument('--acquisition-rate', type=float, default=GROWTH_CONFIG['acquisition_rate'],
+                        help='年度新增客户占年初在册客户的比例')
+    parser.add_argument('--churn-rate', type=float, default=GROWTH_CONFIG['churn_rate'], help='年度客户流失率')
+    parser.add_argument('--sampler', choices=SAMPLER_METHODS, default='legacy',
+                        help='分类分布抽样方式：legacy 与原写法逐位一致（默认），alias 为 Walker 别名表（每次抽样与类别数无关，输出不同）')
+    parser.add_argument('--stats-report', metavar='PATH',
+                        help='生成过程中单遍统计分布（类别/月份/代表合计、订单金额与每单商品数P50/P95/P99、状态与质检占比），写出JSON')
+    parser.add_argument('--expectations', metavar='PATH',
+                        help='写出导入后校验用的期望文件（按主键区间的行数与顺序无关摘要、关键列合计），用 python -m seedgen.verify 校验')
+    parser.add_argument('--expectations-range', type=int, default=10000, help='期望文件的主键区间大小')
+    parser.add_argument('--metrics-textfile', metavar='PATH',
+                        help='进度指标写入 node-exporter textfile collector 文件（Prometheus 文本格式，如 /var/lib/node_exporter/textfile/seed.prom）')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT', help='在本地端口提供 /metrics 进度指标')
+    parser.add_argument('--metrics-interval', type=float, default=10, help='textfile 指标刷新间隔（秒）')
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help='不使用产物缓存（默认按 参数+源码 哈希复用已生成的单文件SQL）')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='产物缓存目录')
+    parser.add_argument('--cache-size', type=float, default=2, help='产物缓存上限（GB，超出按最近使用时间淘汰）')
+    # 场景参数作为默认值，命令行显式给出的参数覆盖场景值
+    known, _ = parser.parse_known_args(argv)
+    if known.list_scenarios:
+        print('\n'.join(describe()))
+        parser.exit()
+    if known.scenario:
+        parser.set_defaults(**scenario_defaults(known.scenario))
+    args = parser.parse_args(argv)
+    if args.scenario:
+        # 偏离检查的基准：未给出任何参数时的取值（解析器默认值 + 场景值）
+        args.scenario_baseline = scenario_baseline(vars(parser.parse_args([])), args.scenario)
+    if sum(1 for mode in (args.split_dir, args.shards > 1, args.ingest, args.delta_from) if mode) > 1:
+        parser.error('--split-dir、--shards、--ingest、--delta-from 只能选择一个')
+    if args.delta_from and (args.shadow or args.mutation_stream):
+        parser.error('--delta-from 不能与 --shadow / --mutation-stream 同时使用')
+    if args.shards > 1 and args.mutation_stream:
+        parser.error('--shards 不能与 --mutation-stream 同时使用（变更流是单一的有序语句流，不按 customer_id 分片）')
+    if args.shadow and args.mutation_stream:
+        parser.error('--shadow 不能与 --mutation-stream 同时使用（切换时订单类影子表尚未由变更流写入）')
+    if args.shadow and args.ingest and args.ingest.startswith('sqlite3:'):
+        parser.error('--shadow 依赖 MySQL 的 CREATE TABLE LIKE / RENAME TABLE，不支持 sqlite3')
+    if not 0 < args.sample_customers <= 1:
+        parser.error('--sample-customers 取值范围为 (0, 1]')
+    try:
+        configure_payloads(PAYLOAD_CONFIG, args.payload_scale, args.payload_column)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def generate(args, output=None):
+    """按 args 生成一次种子数据；传入 output 时写入该输出端（差异模式的比对捕获）"""
+    # 每次生成都从相同的随机数状态开始（差异模式在同一进程内生成两次）
+    random.seed(args.seed)
+    stream_out = sys.stdout
+    if args.mutation_stream == '-':
+        # 标准输出留给变更流，进度信息改走标准错误
+        sys.stdout = sys.stderr
     print("开始生成6亿营收种子数据SQL（v3 - 对齐NestJS Entity）...")
-    
-    output = []
+    scenario = scenario_label(args)
+    if scenario:
+        print(f"场景：{scenario}")
+        for key, expected, actual in deviations(args):
+            print(f"   [偏离场景] {key}：场景值 {expected}，实际 {actual}")
+
+    years = [START_DATE.year + k for k in range(args.years)]
+    end_date = datetime.date(years[-1], 12, 31)
+    growth = None
+    if args.years > 1:
+        growth = GrowthModel(stage_config(GROWTH_CONFIG, args,
+                                          volume_growth=args.volume_growth,
+                                          price_inflation=args.price_inflation,
+                                          acquisition_rate=args.acquisition_rate,
+                                          churn_rate=args.churn_rate))
+
+    # 边生成边写文件：订单类数据按年（及每年内按块）输出后即释放
+    output_file = args.output
+    sharded = args.shards > 1
+    captured = output is not None
+    if sharded and not captured:
+        output = ShardedOutput(shard_paths(output_file, args.shards), args.shard_function)
+    elif args.split_dir and not captured:
+        output = SplitOutput(args.split_dir, args.split_rows)
+    elif args.ingest and not captured:
+        output = IngestOutput(args.ingest, args.ingest_workers, args.ingest_queue)
+    elif not captured:
+        output = SqlOutput(open(output_file, 'w', encoding='utf-8'))
+    recorder = None
+    if args.expectations:
+        output = recorder = ExpectationRecorder(output, args.expectations_range)
+    metrics = None
+    if args.metrics_textfile or args.metrics_port is not None:
+        run_label = os.path.basename(os.path.normpath(args.split_dir or args.ingest or output_file))
+        metrics = ProgressMetrics(run_label, args.metrics_textfile, args.metrics_port, args.metrics_interval)
+        output = MeteredOutput(output, metrics)
     output.append("-- ============================================")
     output.append("-- 6亿年营收种子数据SQL脚本（v3 - 对齐NestJS Entity）")
     output.append(f"-- 生成时间：{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if scenario:
+        output.append(f"-- 场景：{scenario}")
+    if args.sample_customers < 1:
+        output.append(f"-- 客户抽样：{args.sample_customers:.2%}（样本客户及其完整订单历史）")
     output.append("-- 注意：表由NestJS TypeORM synchronize创建，此脚本只做数据填充")
     output.append("-- ============================================")
     output.append("")
     
+    if args.inventory:
+        output.append("-- 创建日终结存快照表（如果不存在）")
+        output.append(DAILY_BALANCE_DDL)
+    if args.sales_org:
+        output.append("-- 创建客户归属历史表（如果不存在）")
+        output.append(OWNER_HISTORY_DDL)
+    if args.leads:
+        output.append("-- 创建线索状态流转/跟进记录表（如果不存在）")
+        output.append(LEADS_DDL)
+
     # ========== 清理旧数据 ==========
-    output.append("-- 清理旧数据（保留表结构）")
+    plan = ReseedPlan(shadow=args.shadow)
+    target = plan.target
+    plan.delete('order_items')
+    plan.delete('orders')
+    plan.delete('customers')
+    plan.delete('production_plans')
+    plan.delete('delivery_records')
+    if args.bom:
+        plan.delete('bom_items')
+        plan.delete('materials')
+    if args.inventory:
+        plan.delete('inventory_log')
+        plan.delete('inventory_daily_balance')
+        plan.delete('inventory')
+    if args.sales_org:
+        org_config = stage_config(SALES_ORG_CONFIG, args,
+                                  regions=args.org_regions,
+                                  teams_per_region=args.org_teams_per_region,
+                                  reps_per_team=args.org_span,
+                                  transfer_rate=args.org_transfer_rate)
+        id_offset = org_config['id_offset']
+        plan.delete('customer_owner_history')
+        plan.delete('sales_targets', f"sales_rep_id >= {id_offset}")
+        plan.delete('users', f"id >= {id_offset}")
+        plan.delete('organizations', f"id >= {id_offset}")
+    if args.tenants > 1:
+        tenant_config = stage_config(TENANT_CONFIG, args, tenants=args.tenants, large_tenants=args.tenant_large)
+        plan.delete('users', f"id >= {tenant_config['id_offset']}")
+        plan.delete('organizations', f"id >= {tenant_config['id_offset']}")
+    if args.leads:
+        plan.delete('lead_activities')
+        plan.delete('lead_status_history')
+        plan.delete('leads')
+    if args.shadow:
+        output.append("-- 创建影子表（LIKE 在线表，含索引），数据写入影子表，最后原子切换")
+    else:
+        output.append("-- 清理旧数据（保留表结构）")
     output.append("SET FOREIGN_KEY_CHECKS = 0;")
-    output.append("DELETE FROM order_items;")
-    output.append("DELETE FROM orders;")
-    output.append("DELETE FROM customers;")
-    output.append("DELETE FROM production_plans;")
-    output.append("DELETE FROM delivery_records;")
+    for statement in plan.cleanup_statements():
+        output.append(statement)
     output.append("SET FOREIGN_KEY_CHECKS = 1;")
     output.append("")
     
     # ========== 生成客户数据 ==========
     # NestJS customers表结构: id, org_id, name, customer_code, category, contact, phone, address, remark, created_at, updated_at
+    sales_org = None
+    if args.sales_org:
+        print("生成销售组织...")
+        sales_org = SalesOrganization(org_config)
+
+    customer_counts = {category: max(1, int(round(config['count'] * args.customer_scale)))
+                       for category, config in CUSTOMER_CONFIG.items()}
+    # 客户抽样：每类按 id 的种子哈希取固定比例（样本之间嵌套），样本外客户不进入在册表，不生成订单
+    sampled = None
+    if args.sample_customers < 1:
+        sampled = set()
+        first_id = 1
+        for count in customer_counts.values():
+            sampled |= sample_customers(range(first_id, first_id + count), args.sample_customers, args.seed)
+            first_id += count
+    skipped_customers = sum(customer_counts.values()) - len(sampled) if sampled is not None else 0
+    tenants = None
+    if args.tenants > 1:
+        tenants = TenantModel(ORG_ID, SALES_REPS, sum(customer_counts.values()), tenant_config)
+
+    funnel = None
+    lead_conversions = {}
+    if args.leads:
+        rep_ids = list(sales_org.reps) if sales_org else [r['id'] for r in SALES_REPS]
+        funnel = LeadFunnel(START_DATE, end_date, rep_ids,
+                            stage_config(LEADS_CONFIG, args, total=args.leads_total,
+                                         conversion_rate=args.leads_conversion_rate))
+        lead_conversions = funnel.plan_conversions(sum(customer_counts.values()))
+        if sampled is not None:
+            lead_conversions = funnel.restrict(sampled, args.sample_customers)
+
+    size_model = None
+    customer_revenue = {}
+    if args.customer_size_dist:
+        size_config = stage_config(CUSTOMER_SIZE_CONFIG, args, distribution=args.customer_size_dist)
+        if args.customer_size_shape:
+            shape_key = 'pareto_alpha' if args.customer_size_dist == 'pareto' else 'lognormal_sigma'
+            size_config[shape_key] = args.customer_size_shape
+        size_model = CustomerSizeModel(size_config)
+
+    payloads = None
+    customer_columns = CUSTOMER_COLUMNS
+    if args.payloads:
+        print("生成宽行文本负载...")
+        payloads = PayloadGenerator(stage_config(
+            configure_payloads(PAYLOAD_CONFIG, args.payload_scale, args.payload_column), args))
+        customer_columns = CUSTOMER_COLUMNS + CUSTOMER_PAYLOAD_COLUMNS
+
     print("生成客户数据...")
     customer_values = []
+    customer_keys = []
+    # 在册客户（按id升序）：代表在首次生成订单时选定，since/churn 为获客/流失日期（多年模式）
+    registry = CustomerRegistry(CUSTOMER_CONFIG)
+    report = DistributionReport() if args.stats_report else None
+
+    def write_customers():
+        append_inserts(output, target('customers'), customer_columns, customer_values, 500,
+                       keys=customer_keys if sharded else None)
+        customer_values.clear()
+        customer_keys.clear()
+
+    total_customers = sum(customer_counts.values()) - skipped_customers
+    output.append(f"-- 插入客户数据（{total_customers}家）")
     customer_id = 1
-    customer_map = {}
-    
-    for category, config in CUSTOMER_CONFIG.items():
-        for i in range(config['count']):
-            if category == 'WET_MARKET':
-                name = f"菜市场-{customer_id:04d}"
-                contact = f"摊主{customer_id}"
-            elif category == 'SUPERMARKET':
-                name = f"商超-{customer_id:04d}"
-                contact = f"采购经理{customer_id}"
+    for category, count in customer_counts.items():
+        size_factors = size_model.factors(count, category) if size_model else None
+        for i in range(count):
+            created_at = DATETIME_STR[START_DATE]
+            if customer_id in lead_conversions:
+                # 转化时间精确到秒、几乎各不相同，直接格式化，不进 DATETIME_STR 查表（查表只用于取值很少的日期）
+                created_at = lead_conversions[customer_id].strftime('%Y-%m-%d %H:%M:%S')
+            org_id = tenants.pick() if tenants else ORG_ID
+            # 样本外的客户照常消耗随机数（随机数流不变，样本客户行与全量数据一致），只是不格式化、不写出
+            if sampled is None or customer_id in sampled:
+                frequency, amount_factor = size_factors[i] if size_factors else (1.0, 1.0)
+                customer_values.append(generate_customer_row(customer_id, category, created_at, org_id, payloads))
+                customer_keys.append(customer_id)
+                registry.add(customer_id, category, org_id, None, frequency, amount_factor)
+                if report:
+                    report.add_customer(category)
             else:
-                name = f"批发商-{customer_id:04d}"
-                contact = f"负责人{customer_id}"
-            
-            customer_code = f"C{customer_id:06d}"
-            phone = f"138{random.randint(10000000, 99999999)}"
-            address = f"地址{customer_id}"
-            created_at = START_DATE.strftime('%Y-%m-%d %H:%M:%S')
-            
-            customer_values.append(
-                f"({customer_id}, {ORG_ID}, '{name}', '{customer_code}', '{category}', '{contact}', '{phone}', '{address}', '{created_at}', '{created_at}')"
-            )
-            customer_map[customer_id] = (name, category)
+                skip_customer_row(payloads)
             customer_id += 1
-    
-    total_customers = customer_id - 1
-    
-    output.append(f"-- 插入客户数据（{total_customers}家）")
-    batch_size = 500
-    for i in range(0, len(customer_values), batch_size):
-        batch = customer_values[i:i+batch_size]
-        output.append("INSERT INTO customers (id, org_id, name, customer_code, category, contact, phone, address, created_at, updated_at) VALUES")
-        output.append(",\n".join(batch) + ";")
-        output.append("")
+            if len(customer_values) >= CUSTOMER_FLUSH_ROWS:
+                write_customers()
+    write_customers()
+    next_customer_id = customer_id
     
     # ========== 生成订单和订单项数据 ==========
     # NestJS orders表: id, org_id, order_no, customer_id, total_amount(int/分), status, order_date, 
@@ -170,6 +527,18 @@ def main():
     # NestJS order_items表: id, order_id, product_id, product_name, sku, unit_price(int/分), 
     #   quantity, subtotal(int/分), remark, created_at, updated_at
     print("生成订单和订单项数据...")
+    draw_rep = make_sampler(uniform(SALES_REPS), args.sampler).draw
+    product_count_sampler = make_sampler(PRODUCTS_PER_ORDER_WEIGHTS, args.sampler)
+    status_sampler = make_sampler(ORDER_STATUS_WEIGHTS, args.sampler)
+    # alias 模式按客户月批量抽取每单商品数与状态（draw_many）；legacy 逐单抽取，保持与原输出逐位一致
+    batch_draws = args.sampler == 'alias'
+    draw_raw_material = make_sampler(uniform(RAW_MATERIALS), args.sampler).draw
+    draw_inspector = make_sampler(uniform(INSPECTORS), args.sampler).draw
+    draw_quality_result = make_sampler(QUALITY_RESULT_WEIGHTS, args.sampler).draw
+    draw_driver = make_sampler(uniform(DRIVERS), args.sampler).draw
+    order_row, order_columns = (ORDER_WIDE_ROW, ORDER_COLUMNS + ORDER_PAYLOAD_COLUMNS) if payloads else (ORDER_ROW, ORDER_COLUMNS)
+    item_row, item_columns = ((ORDER_ITEM_WIDE_ROW, ORDER_ITEM_COLUMNS + ORDER_ITEM_PAYLOAD_COLUMNS) if payloads
+                              else (ORDER_ITEM_ROW, ORDER_ITEM_COLUMNS))
     order_values = []
     item_values = []
     production_plan_values = []
@@ -182,21 +551,125 @@ def main():
     dr_id = 1
     total_revenue_fen = 0
     monthly_revenue = {}
+    yearly_revenue = {}
+    product_month_qty = {}  # (product_id, 'YYYY-MM') → 订单数量合计，用于MRP需求
+    acquired_customers = churned_customers = 0
     
     # 用于production_plans去重
     used_batch_nos = set()
-    
-    customer_id = 1
-    for category, config in CUSTOMER_CONFIG.items():
-        for _ in range(config['count']):
-            sales_rep = random.choice(SALES_REPS)
+
+    stream = None
+    if args.mutation_stream:
+        # 变更流边生成边输出：每年订单生成完毕即写出水位线之前的各天
+        bucket = TokenBucket(args.mutation_rate, args.mutation_burst) if args.mutation_rate > 0 else None
+        stream_file = stream_out if args.mutation_stream == '-' else open(args.mutation_stream, 'w', encoding='utf-8')
+        stream = MutationStream(stage_config(MUTATION_CONFIG, args), stream_file, bucket)
+        print(f"输出订单生命周期变更流：{args.mutation_stream}" + (f"（限速 {args.mutation_rate:g} 语句/秒）" if bucket else ""))
+
+    demand = DemandModel(stage_config(DEMAND_CONFIG, args)) if args.demand_model else None
+    hourly_orders = {}  # 'YYYY-MM-DD HH' → 订单数，用于峰值小时指数
+
+    ledger = None
+    inventory_log_count = balance_count = 0
+    if args.inventory:
+        ledger = InventoryLedger(PRODUCTS, stage_config(INVENTORY_CONFIG, args, count_interval_days=args.inventory_count_interval))
+
+    # 分片输出时记录每个客户结束时各表的累计行数，用于把行路由到客户所在分片
+    customer_spans = []
+
+    def write_order_blocks(label):
+        """输出并清空已生成的订单/订单项/生产计划/配送记录（变更流模式下订单类数据由变更流写出）"""
+        def keys(field):
+            return expand_keys(customer_spans, field) if sharded else None
+
+        if not stream:
+            output.append(f"-- 插入订单数据（{label}{len(order_values)}笔）")
+            append_inserts(output, target('orders'), order_columns, order_values, 1000, keys(1))
+            output.append(f"-- 插入订单项数据（{label}{len(item_values)}条）")
+            append_inserts(output, target('order_items'), item_columns, item_values, 2000, keys(2))
+        output.append(f"-- 插入生产计划数据（{label}{len(production_plan_values)}条）")
+        append_inserts(output, target('production_plans'), PRODUCTION_PLAN_COLUMNS, production_plan_values, 1000, keys(3))
+        if not stream:
+            output.append(f"-- 插入配送记录数据（{label}{len(delivery_record_values)}条）")
+            append_inserts(output, target('delivery_records'), DELIVERY_RECORD_COLUMNS, delivery_record_values, 1000, keys(4))
+        customer_spans.clear()
+        order_values.clear()
+        item_values.clear()
+        production_plan_values.clear()
+        delivery_record_values.clear()
+
+    for year_index, year in enumerate(years):
+        year_label = f"{year}年，" if growth else ""
+        year_products = growth.products_for_year(PRODUCTS, year_index) if growth else PRODUCTS
+        year_amount_factor = growth.amount_factor(year_index) if growth else 1.0
+        if ledger and year_index:
+            ledger.update_prices(year_products)
+
+        if growth and year_index:
+            print(f"生成{year}年客户增减...")
+            for n in range(len(registry)):
+                registry.set_churn(n, growth.churn_date(year))
+            # 各类新增数按年初在册数计算（获客、规模、租户各用独立随机数流，先算日期不改变抽样结果）
+            acquisitions = {category: growth.acquisitions(year, registry.count(category)) for category in CUSTOMER_CONFIG}
+            new_count = sum(len(dates) for dates in acquisitions.values())
+            output.append(f"-- 插入{year}年新增客户数据（{new_count}家）")
+            for category, dates in acquisitions.items():
+                size_factors = size_model.factors(len(dates), category) if size_model and dates else None
+                for n, since in enumerate(dates):
+                    created_at = DATETIME_STR[since]
+                    org_id = tenants.pick() if tenants else ORG_ID
+                    customer_values.append(generate_customer_row(next_customer_id, category, created_at, org_id, payloads))
+                    customer_keys.append(next_customer_id)
+                    frequency, amount_factor = size_factors[n] if size_factors else (1.0, 1.0)
+                    registry.add(next_customer_id, category, org_id, since, frequency, amount_factor)
+                    if report:
+                        report.add_customer(category)
+                    next_customer_id += 1
+                    if len(customer_values) >= CUSTOMER_FLUSH_ROWS:
+                        write_customers()
+            write_customers()
+            acquired_customers += new_count
+
+        if growth:
+            print(f"生成{year}年订单数据...")
+        for n in range(len(registry)):
+            category = registry.category(n)
+            config = CUSTOMER_CONFIG[category]
+            customer_id = registry.ids[n]
+            org_id = registry.org_ids[n]
+            # 销售组织只覆盖 ORG_ID 租户，其他租户的订单由各自的代表创建
+            use_sales_org = sales_org and org_id == ORG_ID
+            since, churn = registry.dates(n)
+            rep_id = registry.reps[n]
+            if not rep_id:
+                rep_id = draw_rep(random)['id']
+                if org_id != ORG_ID:
+                    rep_id = tenants.pick_rep(org_id)
+                registry.reps[n] = rep_id
+                if use_sales_org:
+                    sales_org.assign_customer(customer_id, since or START_DATE, end_date)
+            frequency, amount_factor = registry.frequency[n], registry.amount_factor[n]
+            if metrics:
+                metrics.set_progress((year_index + n / len(registry)) / len(years))
             
             for month in range(1, 13):
                 orders_in_month = config['orders_per_month']
+                if size_model:
+                    orders_in_month = size_model.orders_in_month(orders_in_month, frequency)
+                if batch_draws:
+                    product_counts = product_count_sampler.draw_many(random, orders_in_month)
+                    statuses = status_sampler.draw_many(random, orders_in_month)
                 
-                for _ in range(orders_in_month):
-                    order_date = random_date_in_month(2025, month)
-                    order_date_str = order_date.strftime('%Y-%m-%d')
+                for k in range(orders_in_month):
+                    if demand:
+                        # 从全年日权重表抽样，客户年订单总数不变
+                        order_date, order_date_str = demand.sample_date(random, year)
+                    else:
+                        order_date = random_date_in_month(year, month)
+                        order_date_str = DATE_STR[order_date]
+                    if (since and order_date < since) or (churn and order_date > churn):
+                        continue
+                    month_key = order_date_str[:7]
                     
                     if order_date_str not in batch_sequence:
                         batch_sequence[order_date_str] = 1
@@ -207,9 +680,13 @@ def main():
                     order_no = generate_order_no(order_date, order_id)
                     
                     target_amount_fen = generate_order_amount_fen(category)
+                    if size_model:
+                        target_amount_fen = int(target_amount_fen * amount_factor)
+                    if year_index:
+                        target_amount_fen = int(target_amount_fen * year_amount_factor)
                     
-                    num_products = random.randint(1, 3)
-                    selected_products = random.sample(PRODUCTS, num_products)
+                    num_products = product_counts[k] if batch_draws else product_count_sampler.draw(random)
+                    selected_products = random.sample(year_products, num_products)
                     
                     total_amount_fen = 0
                     order_items = []
@@ -219,6 +696,8 @@ def main():
                         quantity = max(10, quantity)
                         subtotal_fen = quantity * product['unit_price_fen']
                         total_amount_fen += subtotal_fen
+                        pm_key = (product['id'], month_key)
+                        product_month_qty[pm_key] = product_month_qty.get(pm_key, 0) + quantity
                         
                         order_items.append({
                             'product_id': product['id'],
@@ -230,32 +709,43 @@ def main():
                         })
                     
                     total_revenue_fen += total_amount_fen
+                    if size_model:
+                        customer_revenue[customer_id] = customer_revenue.get(customer_id, 0) + total_amount_fen
                     
-                    month_key = f"2025-{month:02d}"
                     monthly_revenue[month_key] = monthly_revenue.get(month_key, 0) + total_amount_fen
+                    yearly_revenue[year] = yearly_revenue.get(year, 0) + total_amount_fen
                     
-                    r = random.random()
-                    if r < 0.80:
-                        status = 'FULFILLED'
-                    elif r < 0.95:
-                        status = 'APPROVED'
-                    else:
-                        status = 'PENDING_REVIEW'
+                    status = statuses[k] if batch_draws else status_sampler.draw(random)
                     
-                    created_at = f"{order_date_str} {random.randint(8, 17):02d}:{random.randint(0, 59):02d}:00"
+                    if demand:
+                        created_at = f"{order_date_str} {demand.sample_time(random, category)}"
+                        hour_key = created_at[:13]
+                        hourly_orders[hour_key] = hourly_orders.get(hour_key, 0) + 1
+                    else:
+                        created_at = f"{order_date_str} {TIMES[random.randint(8, 17)][random.randint(0, 59)]}"
+
+                    if use_sales_org:
+                        created_by = sales_org.owner_at(customer_id, order_date)
+                        sales_org.record_order(created_by, month_key, total_amount_fen)
+                    else:
+                        created_by = rep_id
+                    if report:
+                        report.add_order(category, month_key, created_by, total_amount_fen, len(order_items), status)
                     
                     # orders INSERT: id, org_id, order_no, customer_id, total_amount, status, order_date, created_by, created_at, updated_at
-                    order_values.append(
-                        f"({order_id}, {ORG_ID}, '{order_no}', {customer_id}, {total_amount_fen}, '{status}', '{order_date_str}', {sales_rep['id']}, '{created_at}', '{created_at}')"
-                    )
+                    order_text = payloads.order(customer_id, status, created_at) if payloads else ()
+                    order_values.append(order_row(order_id, org_id, order_no, customer_id, total_amount_fen, status,
+                                                  order_date_str, created_by, created_at, created_at, *order_text))
                     
                     # order_items INSERT: id, order_id, product_id, product_name, sku, unit_price, quantity, subtotal, created_at, updated_at
+                    item_rows = []
                     for item in order_items:
-                        pname = item['product_name'].replace("'", "\\'")
-                        item_values.append(
-                            f"({item_id}, {order_id}, {item['product_id']}, '{pname}', '{item['sku']}', {item['unit_price_fen']}, {item['quantity']}, {item['subtotal_fen']}, '{created_at}', '{created_at}')"
-                        )
+                        item_rows.append(item_row(item_id, order_id, item['product_id'], item['product_name'], item['sku'],
+                                                  item['unit_price_fen'], item['quantity'], item['subtotal_fen'],
+                                                  created_at, created_at, *(payloads.item() if payloads else ())))
                         item_id += 1
+                    item_values.extend(item_rows)
+                    delivery_row = None
                     
                     # 为FULFILLED订单生成production_plan和delivery_record
                     if status == 'FULFILLED' and batch_no not in used_batch_nos:
@@ -270,70 +760,164 @@ def main():
                             deviation = random.uniform(-0.02, 0.02)
                             actual_qty = int(planned_qty * (1 + deviation))
                         
-                        raw_mat = random.choice(RAW_MATERIALS)
-                        raw_batch = f"DL{order_date.strftime('%Y%m%d')}{random.randint(1,99):02d}"
+                        raw_mat = draw_raw_material(random)
+                        raw_batch = f"DL{DATE_COMPACT[order_date]}{random.randint(1,99):02d}"
                         expiry = order_date + datetime.timedelta(days=random.randint(30, 90))
-                        inspector = random.choice(INSPECTORS)
-                        qr = 'PASS' if random.random() < 0.95 else 'FAIL'
+                        inspector = draw_inspector(random)
+                        qr = draw_quality_result(random)
+                        if report:
+                            report.add_quality_result(qr)
                         
-                        production_plan_values.append(
-                            f"({pp_id}, '{batch_no}', '{product['name']}', {planned_qty}, {actual_qty}, '{raw_mat}', '{raw_batch}', '{order_date_str}', '{expiry.strftime('%Y-%m-%d')}', '{inspector}', '{qr}', '{created_at}', '{created_at}')"
-                        )
+                        production_plan_values.append(PRODUCTION_PLAN_ROW(
+                            pp_id, batch_no, product['name'], planned_qty, actual_qty, raw_mat, raw_batch,
+                            order_date_str, DATE_STR[expiry], inspector, qr, created_at, created_at))
                         pp_id += 1
                         
                         # delivery_record
-                        driver = random.choice(DRIVERS)
+                        driver = draw_driver(random)
                         dep_hour = random.randint(4, 8)
-                        dep_time = f"{order_date_str} {dep_hour:02d}:{random.randint(0,59):02d}:00"
-                        arr_time = f"{order_date_str} {dep_hour + random.randint(1,4):02d}:{random.randint(0,59):02d}:00"
+                        dep_time = f"{order_date_str} {TIMES[dep_hour][random.randint(0, 59)]}"
+                        arr_time = f"{order_date_str} {TIMES[dep_hour + random.randint(1, 4)][random.randint(0, 59)]}"
                         temp = round(random.uniform(2.0, 8.0), 1)
                         
-                        delivery_record_values.append(
-                            f"({dr_id}, {order_id}, {driver['id']}, '{driver['name']}', '{driver['vehicle']}', '{dep_time}', '{arr_time}', {temp}, 'DELIVERED', '{created_at}', '{created_at}')"
-                        )
+                        delivery_row = DELIVERY_RECORD_ROW(dr_id, order_id, driver['id'], driver['name'], driver['vehicle'],
+                                                           dep_time, arr_time, temp, 'DELIVERED', created_at, created_at)
+                        delivery_record_values.append(delivery_row)
                         dr_id += 1
+
+                        if ledger:
+                            ledger.add_receipt(order_date_str, product['id'], actual_qty, batch_no)
+                            for item in order_items:
+                                ledger.add_outbound(order_date_str, dep_time, item['product_id'], item['quantity'], order_id, order_no)
+
+                    if stream:
+                        stream.add_order(order_id, org_id, order_no, customer_id, total_amount_fen, order_date_str,
+                                         created_by, created_at, item_rows, item_columns, status,
+                                         delivery_row, DELIVERY_RECORD_COLUMNS,
+                                         # 审核三列不随 INSERT 写入，审核意见在审核 UPDATE 中与审核人、审核时间一起写入
+                                         extra=list(zip(ORDER_PAYLOAD_COLUMNS, order_text))[:2],
+                                         review_comment=order_text[4] if order_text else None)
                     
                     order_id += 1
-            
-            customer_id += 1
-    
+
+            if sharded:
+                customer_spans.append((customer_id, len(order_values), len(item_values),
+                                       len(production_plan_values), len(delivery_record_values)))
+            if len(order_values) >= ORDER_FLUSH_ROWS:
+                write_order_blocks(year_label)
+
+        write_order_blocks(year_label)
+        if stream:
+            # 次年订单的事件不早于次年1月1日，此前各天的事件已经齐全
+            stream.advance(datetime.date(year + 1, 1, 1))
+        # 批次号带日期，跨年不会重复，年末即可释放
+        batch_sequence.clear()
+        used_batch_nos.clear()
+        if growth:
+            churned_customers += registry.drop_churned()
+
+        # 库存流水逐年输出，账面余额跨年延续
+        if ledger:
+            inventory_log_values, balance_values = ledger.flush(START_DATE, datetime.date(year, 12, 31))
+            inventory_log_count += len(inventory_log_values)
+            balance_count += len(balance_values)
+            output.append(f"-- 插入库存流水数据（{year_label}{len(inventory_log_values)}条）")
+            append_inserts(output, target('inventory_log'), INVENTORY_LOG_COLUMNS, inventory_log_values, 2000)
+            output.append(f"-- 插入日终结存快照数据（{year_label}{len(balance_values)}条）")
+            append_inserts(output, target('inventory_daily_balance'), DAILY_BALANCE_COLUMNS, balance_values, 2000)
+            inventory_log_values = balance_values = None
+
+    total_customers = next_customer_id - 1 - skipped_customers
     total_orders = order_id - 1
     total_items = item_id - 1
     total_pp = pp_id - 1
     total_dr = dr_id - 1
     
-    # 分批INSERT订单
-    output.append(f"-- 插入订单数据（{total_orders}笔）")
-    for i in range(0, len(order_values), 1000):
-        batch = order_values[i:i+1000]
-        output.append("INSERT INTO orders (id, org_id, order_no, customer_id, total_amount, status, order_date, created_by, created_at, updated_at) VALUES")
-        output.append(",\n".join(batch) + ";")
+    if stream:
+        stream_written = stream.close()
+        if stream_file is not stream_out:
+            stream_file.close()
+        output.append(f"-- 订单（{total_orders}笔）、订单项（{total_items}条）、配送记录（{total_dr}条）由变更流 {args.mutation_stream} 回放写入")
         output.append("")
     
-    # 分批INSERT订单项
-    output.append(f"-- 插入订单项数据（{total_items}条）")
-    for i in range(0, len(item_values), 2000):
-        batch = item_values[i:i+2000]
-        output.append("INSERT INTO order_items (id, order_id, product_id, product_name, sku, unit_price, quantity, subtotal, created_at, updated_at) VALUES")
-        output.append(",\n".join(batch) + ";")
-        output.append("")
-    
-    # 分批INSERT production_plans
-    output.append(f"-- 插入生产计划数据（{total_pp}条）")
-    for i in range(0, len(production_plan_values), 1000):
-        batch = production_plan_values[i:i+1000]
-        output.append("INSERT INTO production_plans (id, batch_no, product_name, planned_quantity, actual_quantity, raw_material, raw_material_batch, production_date, expiry_date, quality_inspector, quality_result, created_at, updated_at) VALUES")
-        output.append(",\n".join(batch) + ";")
-        output.append("")
-    
-    # 分批INSERT delivery_records
-    output.append(f"-- 插入配送记录数据（{total_dr}条）")
-    for i in range(0, len(delivery_record_values), 1000):
-        batch = delivery_record_values[i:i+1000]
-        output.append("INSERT INTO delivery_records (id, order_id, driver_id, driver_name, vehicle_no, departure_time, arrival_time, temperature, status, created_at, updated_at) VALUES")
-        output.append(",\n".join(batch) + ";")
+    # ========== 物料主档 / 多层BOM（可选） ==========
+    demand_file = None
+    if args.bom:
+        print("生成物料主档和多层BOM数据...")
+        bom_config = stage_config(BOM_CONFIG, args,
+                                  finished_goods=args.bom_finished_goods,
+                                  depth=args.bom_depth,
+                                  width=args.bom_width,
+                                  raw_materials=args.bom_raw_materials)
+        bom_created_at = START_DATE.strftime('%Y-%m-%d %H:%M:%S')
+        finished_goods, material_values, bom_values = generate_bom(PRODUCTS, bom_created_at, bom_config)
+
+        output.append(f"-- 插入物料主档数据（{len(material_values)}条）")
+        append_inserts(output, target('materials'),
+                       ['id', 'material_code', 'material_name', 'unit', 'stock_qty', 'safety_stock', 'unit_cost', 'created_at', 'updated_at'],
+                       material_values, 1000)
+        output.append(f"-- 插入BOM数据（{len(bom_values)}条，成品{len(finished_goods)}个，{bom_config['depth']}层）")
+        append_inserts(output, target('bom_items'),
+                       ['id', 'product_code', 'product_name', 'material_id', 'material_name', 'qty_per_unit', 'unit', 'waste_rate', 'is_active', 'created_at'],
+                       bom_values, 2000)
+
+        demand_rows = derive_demand(finished_goods, product_month_qty)
+        demand_file = os.path.splitext(args.output)[0] + '-mrp-demand.csv'
+        write_demand_csv(demand_file, demand_rows)
+
+    # ========== 库存流水 / 日终结存（可选） ==========
+    if ledger:
+        inventory_values = ledger.inventory_values(START_DATE, end_date)
+        output.append(f"-- 插入库存主表数据（{len(inventory_values)}条）")
+        append_inserts(output, target('inventory'), INVENTORY_COLUMNS, inventory_values, 1000)
+
+    # ========== 销售组织 / 客户归属 / 销售目标（可选） ==========
+    if sales_org:
+        org_created_at = START_DATE.strftime('%Y-%m-%d %H:%M:%S')
+        org_values = sales_org.organization_values(org_created_at)
+        user_values = sales_org.user_values(org_created_at)
+        owner_history_values = sales_org.owner_history_values(org_created_at)
+        periods = [f"{year}-{month:02d}" for year in years for month in range(1, 13)]
+        target_values = sales_org.sales_target_values(periods, org_created_at)
+        output.append(f"-- 插入销售组织数据（{len(org_values)}个组织节点）")
+        append_inserts(output, target('organizations'), ORGANIZATION_COLUMNS, org_values, 1000)
+        output.append(f"-- 插入销售人员数据（{len(user_values)}人，代表{len(sales_org.reps)}人）")
+        append_inserts(output, target('users'), USER_COLUMNS, user_values, 1000)
+        output.append(f"-- 插入客户归属历史（{len(owner_history_values)}条）")
+        append_inserts(output, target('customer_owner_history'), OWNER_HISTORY_COLUMNS, owner_history_values, 2000,
+                       keys=sales_org.owner_history_keys() if sharded else None)
+        output.append(f"-- 插入销售目标数据（{len(target_values)}条）")
+        append_inserts(output, target('sales_targets'), SALES_TARGET_COLUMNS, target_values, 2000)
+
+    # ========== 多租户组织 / 销售代表（可选） ==========
+    if tenants:
+        tenant_created_at = START_DATE.strftime('%Y-%m-%d %H:%M:%S')
+        tenant_org_values = tenants.organization_values(tenant_created_at)
+        tenant_user_values = tenants.user_values(tenant_created_at)
+        output.append(f"-- 插入租户组织数据（{len(tenant_org_values)}个，另有ORG_ID={ORG_ID}）")
+        append_inserts(output, target('organizations'), ORGANIZATION_COLUMNS, tenant_org_values, 1000)
+        output.append(f"-- 插入租户销售代表数据（{len(tenant_user_values)}人）")
+        append_inserts(output, target('users'), USER_COLUMNS, tenant_user_values, 1000)
+
+    # ========== 线索漏斗（可选） ==========
+    if funnel:
+        print("生成线索和跟进数据...")
+        lead_values, lead_history_values, lead_activity_values = funnel.build(registry.name)
+        output.append(f"-- 插入线索数据（{len(lead_values)}条，转化{len(lead_conversions)}条）")
+        append_inserts(output, target('leads'), LEAD_COLUMNS, lead_values, 2000)
+        output.append(f"-- 插入线索状态流转（{len(lead_history_values)}条）")
+        append_inserts(output, target('lead_status_history'), STATUS_HISTORY_COLUMNS, lead_history_values, 2000)
+        output.append(f"-- 插入线索跟进记录（{len(lead_activity_values)}条）")
+        append_inserts(output, target('lead_activities'), ACTIVITY_COLUMNS, lead_activity_values, 2000)
+
+    # ========== 影子表切换（可选） ==========
+    swap_statements = plan.swap_statements()
+    if swap_statements:
+        output.append("-- 原子切换：在线表 → *_old，影子表 → 在线表，然后删除旧表")
+        for statement in swap_statements:
+            output.append(statement)
         output.append("")
-    
+
     # ========== 统计验证查询 ==========
     output.append("-- 验证查询")
     output.append("SELECT '客户总数' AS metric, COUNT(*) AS value FROM customers;")
@@ -343,29 +927,190 @@ def main():
     output.append("SELECT '生产计划数' AS metric, COUNT(*) AS value FROM production_plans;")
     output.append("SELECT '配送记录数' AS metric, COUNT(*) AS value FROM delivery_records;")
     output.append("SELECT '得率异动(偏差>2%)' AS metric, COUNT(*) AS value FROM production_plans WHERE ABS(actual_quantity - planned_quantity) / planned_quantity > 0.02;")
+    if args.bom:
+        output.append("SELECT '物料主档数' AS metric, COUNT(*) AS value FROM materials;")
+        output.append("SELECT 'BOM行数' AS metric, COUNT(*) AS value FROM bom_items;")
+    if ledger:
+        output.append("SELECT '库存流水数' AS metric, COUNT(*) AS value FROM inventory_log;")
+        output.append("SELECT '库存流水与主表不一致' AS metric, COUNT(*) AS value FROM inventory i WHERE i.total_stock <> (SELECT COALESCE(SUM(l.quantity), 0) FROM inventory_log l WHERE l.inventory_id = i.id);")
     
-    # 写入文件
-    output_file = '/home/ubuntu/ops-frontend/scripts/seed-600m-revenue.sql'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("\n".join(output))
+    output.close()
+    if metrics:
+        metrics.finish()
+        metrics.close()
+    if recorder:
+        recorder.write(args.expectations, {
+            'generator': os.path.basename(__file__),
+            'args': ' '.join(shlex.quote(a) for a in sys.argv[1:]),
+        })
+    if report:
+        report.write(args.stats_report, {
+            'generator': os.path.basename(__file__),
+            'args': ' '.join(shlex.quote(a) for a in sys.argv[1:]),
+            'scenario': scenario,
+            'years': years,
+            'customers': total_customers,
+            'sample_customers': args.sample_customers,
+            'orders': order_id - 1,
+            'revenue_fen': total_revenue_fen,
+        })
+    if sharded:
+        shard_map_file, shard_customer_file = output.write_map(output_file)
+    if args.split_dir:
+        output_file = output.write_manifest()
     
     total_revenue_yuan = total_revenue_fen / 100
     print(f"\n{'='*60}")
-    print(f"SQL文件生成完成：{output_file}")
+    if args.ingest:
+        print(f"直接入库完成：{args.ingest}")
+    elif captured:
+        print("数据生成完成（输出到差异比对）")
+    else:
+        print(f"SQL文件生成完成：{output_file}" + (f"（{args.shards}个分片，分片函数 {args.shard_function}）" if sharded else ""))
     print(f"{'='*60}")
     print(f"统计信息：")
     print(f"   客户总数：{total_customers}")
+    if sampled is not None:
+        print(f"   客户抽样：{args.sample_customers:.2%}（期初{len(sampled) + skipped_customers}家中抽取{len(sampled)}家）")
     print(f"   订单总数：{total_orders}")
     print(f"   订单项总数：{total_items}")
     print(f"   生产计划数：{total_pp}")
     print(f"   配送记录数：{total_dr}")
+    if args.bom:
+        print(f"   物料主档数：{len(material_values)}")
+        print(f"   BOM行数：{len(bom_values)}")
+        print(f"   MRP需求文件：{demand_file}（{len(demand_rows)}行）")
+    if sales_org:
+        print(f"   销售代表数：{len(sales_org.reps)}")
+        print(f"   客户归属变更：{len(owner_history_values) - len(sales_org.owners)}")
+    if tenants:
+        tenant_customers = {}
+        for org_id in registry.org_ids:
+            tenant_customers[org_id] = tenant_customers.get(org_id, 0) + 1
+        print(f"   租户数：{len(tenants.tenants)}（有客户的{len(tenant_customers)}个）")
+        print(f"   最大租户客户占比（期末在册）：{max(tenant_customers.values()) / len(registry):.1%}")
+    if funnel:
+        print(f"   线索总数：{len(lead_values)}（转化{len(lead_conversions)}）")
+        print(f"   跟进记录数：{len(lead_activity_values)}")
+    if ledger:
+        print(f"   库存流水数：{inventory_log_count}")
+        print(f"   日终结存数：{balance_count}")
+    if growth:
+        print(f"   新增客户：{acquired_customers}，流失客户：{churned_customers}")
+        for year in years:
+            print(f"   {year}年营收：¥{yearly_revenue.get(year, 0)/100:,.2f}")
     print(f"   年营收总额：¥{total_revenue_yuan:,.2f}")
-    print(f"   月均营收：¥{total_revenue_yuan/12:,.2f}")
+    print(f"   月均营收：¥{total_revenue_yuan/(12 * len(years)):,.2f}")
+    if size_model:
+        ranked = sorted(customer_revenue.values(), reverse=True)
+        top = ranked[:max(1, len(ranked) // 100)]
+        print(f"   Top 1%客户营收占比：{sum(top) / total_revenue_fen:.1%}")
+        print(f"   最大/中位客户营收比：{ranked[0] / ranked[len(ranked) // 2]:.1f}x")
+    if demand:
+        hours_in_period = ((end_date - START_DATE).days + 1) * 24
+        print(f"   峰值日指数（理论）：{demand.peak_day_index(years[0]):.2f}")
+        print(f"   峰值小时指数：{max(hourly_orders.values()) / (total_orders / hours_in_period):.2f}")
+    if payloads:
+        print(f"   宽行文本负载（UTF-8字节，不含引号）：")
+        for line in payloads.report():
+            print(f"      {line}")
+    if report:
+        print(f"   统计报告：{args.stats_report}")
+    if recorder:
+        print(f"   校验期望文件：{args.expectations}（导入后 python -m seedgen.verify {args.expectations} --db DRIVER:DSN）")
     print(f"\n月度营收分布：")
     for month_key in sorted(monthly_revenue.keys()):
         print(f"   {month_key}: ¥{monthly_revenue[month_key]/100:,.2f}")
-    print(f"\n导入命令：")
-    print(f"   mysql -u root -p qianzhang_sales < {output_file}")
+    if args.ingest:
+        print(f"\n入库吞吐：")
+        for line in output.report():
+            print(f"   {line}")
+    elif sharded:
+        print(f"\n导入命令：")
+        for n, path in enumerate(output.paths):
+            rows = output.routed_rows[n]
+            print(f"   mysql -u root -p qianzhang_sales_{n:02d} < {path}  # 客户{rows.get(target('customers'), 0)}，订单{rows.get(target('orders'), 0)}")
+        print(f"   分片映射：{shard_map_file}，{shard_customer_file}")
+    elif args.split_dir:
+        print(f"\n导入命令：")
+        print(f"   cd {os.path.dirname(os.path.abspath(__file__))} && python -m seedgen.loader {output_file} --workers 8 --client 'mysql -u root -p qianzhang_sales'")
+        print(f"   （{len(output.files)}个数据块，--fake 可在不连接数据库时验证调度）")
+    elif not captured:
+        print(f"\n导入命令：")
+        print(f"   mysql -u root -p qianzhang_sales < {output_file}")
+
+    if stream:
+        print(f"\n订单生命周期变更流：{args.mutation_stream}")
+        print(f"   语句总数：{stream_written}")
+        for op, count in stream.counts.items():
+            print(f"   {op}：{count}行")
+
+def run_delta(args):
+    """差异模式：旧参数、新参数各生成一次，按主键归并比较后只输出变化的行"""
+    old_args = parse_args(shlex.split(args.delta_from))
+    new_args = copy.copy(args)
+    new_args.delta_from = None
+    with tempfile.TemporaryDirectory(prefix='seed-delta-') as tmp:
+        print(f"[差异模式] 按旧参数生成：{args.delta_from or '（默认参数）'}")
+        old = DeltaCapture(os.path.join(tmp, 'old'))
+        generate(old_args, old)
+        print(f"\n[差异模式] 按新参数生成")
+        new = DeltaCapture(os.path.join(tmp, 'new'))
+        generate(new_args, new)
+        header = [
+            "-- ============================================",
+            "-- 种子数据差异重灌（只包含变化的行，在已灌好旧数据的库上执行）",
+            f"-- 旧参数：{args.delta_from or '（默认参数）'}",
+            f"-- 新参数：{' '.join(shlex.quote(a) for a in sys.argv[1:])}",
+            "-- ============================================",
+        ]
+        result = write_delta(old, new, args.output, header)
+
+    print(f"\n{'='*60}")
+    print(f"差异SQL生成完成：{args.output}")
+    print(f"{'='*60}")
+    changed = 0
+    for table, stats in result.items():
+        changed += sum(stats.values())
+        print(f"   {table}: 插入{stats['insert']}，更新{stats['update']}，删除{stats['delete']}")
+    unchanged = sum(s['rows'] for s in new.tables.values()) - sum(r['insert'] + r['update'] for r in result.values())
+    print(f"   变化行合计：{changed}（未变化{unchanged}行）")
+
+
+def cacheable(args):
+    """只缓存单文件SQL输出（--no-cache 时不读写缓存）；分片/拆分/入库/差异/变更流与BOM需求文件有额外产物，不缓存"""
+    return args.cache and not (args.shards > 1 or args.split_dir or args.ingest or args.delta_from is not None
+                               or args.mutation_stream or args.bom or args.stats_report or args.expectations)
+
+
+def run_cached(args):
+    """按 参数+源码 哈希查找缓存产物，命中则直接解压，否则生成后存入缓存"""
+    cache = ArtifactCache(args.cache_dir, int(args.cache_size * 1024 ** 3))
+    key = cache_key(args, source_files(__file__))
+    path = cache.fetch(key, args.output)
+    if path:
+        print(f"命中产物缓存：{path}")
+        print(f"SQL文件已写出：{args.output}（{os.path.getsize(args.output):,}字节，--no-cache 可强制重新生成）")
+        print(f"\n导入命令：")
+        print(f"   mysql -u root -p qianzhang_sales < {args.output}")
+        return
+    generate(args)
+    meta = {'key': key, 'args': {k: v for k, v in vars(args).items() if k not in ('cache_dir', 'cache_size', 'scenario_baseline')},
+            'created_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'size': os.path.getsize(args.output)}
+    path, evicted = cache.store(key, args.output, meta)
+    print(f"\n已存入产物缓存：{path}（{os.path.getsize(path):,}字节" + (f"，淘汰{evicted}个旧产物" if evicted else "") + "）")
+
+
+def main():
+    args = parse_args()
+    if args.delta_from is not None:
+        run_delta(args)
+    elif cacheable(args):
+        run_cached(args)
+    else:
+        generate(args)
+
 
 if __name__ == '__main__':
     main()
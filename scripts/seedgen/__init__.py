@@ -0,0 +1,6 @@
+"""
+种子数据生成器的可选阶段（stage）模块
+
+generate-600m-revenue-seed.py 负责客户/订单/订单项/生产计划/配送记录主流程，
+这里放按需启用的扩展阶段，每个阶段使用独立的随机数流，不影响主流程数据的可复现性。
+"""
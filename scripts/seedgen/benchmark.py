@@ -0,0 +1,110 @@
+"""
+订单行序列化基准：逐行 strftime + 多字段 f-string（旧） vs 查表 + 预编译行编码器（新）
+
+  python -m seedgen.benchmark --scale 100     # 约 400 万笔订单（基准 40,032 笔/年 × 倍率）
+
+按生成器的取值方式抽取随机数（日期、时分、金额、状态等），分别用两种方式格式化订单、订单项、配送记录行，
+输出每种方式的序列化耗时及其占「抽样 + 序列化」总耗时的比例。按块处理，内存占用与倍率无关。
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+from .formats import DATE_COMPACT, DATE_STR, TIMES, compile_row_encoder, month_dates
+
+BASE_ORDERS = 40032
+CHUNK = 100000
+STATUSES = ('FULFILLED', 'APPROVED', 'PENDING_REVIEW')
+
+ORDER_ROW = compile_row_encoder(['id', 'org_id', 'order_no', 'customer_id', 'total_amount', 'status', 'order_date',
+                                 'created_by', 'created_at', 'updated_at'], 'nnsnnssnss')
+ITEM_ROW = compile_row_encoder(['id', 'order_id', 'product_id', 'product_name', 'sku', 'unit_price', 'quantity',
+                                'subtotal', 'created_at', 'updated_at'], 'nnnqsnnnss')
+DELIVERY_ROW = compile_row_encoder(['id', 'order_id', 'driver_id', 'driver_name', 'vehicle_no', 'departure_time',
+                                    'arrival_time', 'temperature', 'status', 'created_at', 'updated_at'], 'nnnssssnsss')
+
+
+def draw(rng, start_id, count, year):
+    """与生成器相同方式抽样，返回原始值元组列表"""
+    rows = []
+    for order_id in range(start_id, start_id + count):
+        month = rng.randint(1, 12)
+        days = month_dates(year, month)
+        rows.append((order_id, days[rng.randint(1, len(days)) - 1], rng.randint(8, 17), rng.randint(0, 59),
+                     max(50000, int(rng.gauss(360000, 108000))), STATUSES[rng.random() >= 0.8],
+                     rng.randint(4, 8), rng.randint(1, 4), rng.randint(0, 59), rng.randint(0, 59),
+                     round(rng.uniform(2.0, 8.0), 1)))
+    return rows
+
+
+def format_legacy(rows):
+    out = []
+    for order_id, order_date, hour, minute, amount, status, dep_hour, travel, dep_min, arr_min, temp in rows:
+        order_date_str = order_date.strftime('%Y-%m-%d')
+        order_no = f"ORD-{order_date.strftime('%Y%m%d')}-{order_id:06d}"
+        created_at = f"{order_date_str} {hour:02d}:{minute:02d}:00"
+        out.append(f"({order_id}, 1, '{order_no}', {order_id % 684 + 1}, {amount}, '{status}', '{order_date_str}', 1, '{created_at}', '{created_at}')")
+        pname = '普通千张'.replace("'", "\\'")
+        out.append(f"({order_id}, {order_id}, 1, '{pname}', 'QZ-PT-001', 850, {amount // 850}, {amount // 850 * 850}, '{created_at}', '{created_at}')")
+        dep_time = f"{order_date_str} {dep_hour:02d}:{dep_min:02d}:00"
+        arr_time = f"{order_date_str} {dep_hour + travel:02d}:{arr_min:02d}:00"
+        out.append(f"({order_id}, {order_id}, 101, '司机刘一', '沪A12345', '{dep_time}', '{arr_time}', {temp}, 'DELIVERED', '{created_at}', '{created_at}')")
+    return out
+
+
+def format_tables(rows):
+    out = []
+    append = out.append
+    for order_id, order_date, hour, minute, amount, status, dep_hour, travel, dep_min, arr_min, temp in rows:
+        order_date_str = DATE_STR[order_date]
+        order_no = f"ORD-{DATE_COMPACT[order_date]}-{order_id:06d}"
+        created_at = f"{order_date_str} {TIMES[hour][minute]}"
+        append(ORDER_ROW(order_id, 1, order_no, order_id % 684 + 1, amount, status, order_date_str, 1, created_at, created_at))
+        append(ITEM_ROW(order_id, order_id, 1, '普通千张', 'QZ-PT-001', 850, amount // 850, amount // 850 * 850,
+                        created_at, created_at))
+        dep_time = f"{order_date_str} {TIMES[dep_hour][dep_min]}"
+        arr_time = f"{order_date_str} {TIMES[dep_hour + travel][arr_min]}"
+        append(DELIVERY_ROW(order_id, order_id, 101, '司机刘一', '沪A12345', dep_time, arr_time, temp, 'DELIVERED',
+                            created_at, created_at))
+    return out
+
+
+def run(scale, seed=42):
+    total = int(BASE_ORDERS * scale)
+    rng = random.Random(seed)
+    timings = {'draw': 0.0, 'legacy': 0.0, 'tables': 0.0}
+    for start in range(1, total + 1, CHUNK):
+        count = min(CHUNK, total + 1 - start)
+        t0 = time.perf_counter()
+        rows = draw(rng, start, count, 2025)
+        t1 = time.perf_counter()
+        legacy = format_legacy(rows)
+        t2 = time.perf_counter()
+        tables = format_tables(rows)
+        t3 = time.perf_counter()
+        if legacy != tables:
+            raise AssertionError(f"两种格式化结果不一致（订单 {start} 起的块）")
+        timings['draw'] += t1 - t0
+        timings['legacy'] += t2 - t1
+        timings['tables'] += t3 - t2
+    return total, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='订单行序列化基准')
+    parser.add_argument('--scale', type=float, default=100, help='订单量倍率（1倍 = 40,032 笔）')
+    args = parser.parse_args(argv)
+    total, timings = run(args.scale)
+    draw_seconds = timings['draw']
+    print(f"订单 {total:,} 笔（每笔 订单+订单项+配送记录 3 行），随机抽样 {draw_seconds:.2f} 秒")
+    for name, label in (('legacy', '逐行 strftime + f-string'), ('tables', '查表 + 预编译行编码器')):
+        seconds = timings[name]
+        print(f"   {label}：序列化 {seconds:.2f} 秒（{total * 3 / seconds:,.0f} 行/秒），"
+              f"占抽样+序列化 {seconds / (seconds + draw_seconds):.1%}")
+    print(f"   加速 {timings['legacy'] / timings['tables']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
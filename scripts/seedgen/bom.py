@@ -0,0 +1,171 @@
+"""
+物料主档 + 多层BOM + MRP需求生成（用于压测 server/mrp-service.ts 的 runMrp 展开）
+
+对齐 drizzle/schema.ts：
+- materials: id, material_code, material_name, unit, stock_qty, safety_stock, unit_cost, created_at, updated_at
+- bom_items: id, product_code, product_name, material_id, material_name, qty_per_unit, unit, waste_rate, is_active, created_at
+
+BOM树结构：成品 → 半成品（SF-xxxxxx，可继续展开）→ 原料（RM-xxxxxx，叶子）。
+半成品自身的BOM行以它的 material_code 作为 product_code，runMrp 可以逐层展开。
+需求按订单历史（产品 × 月份的订单数量）折算到各成品。
+"""
+
+import csv
+import random
+
+from .sampling import make_sampler, uniform
+from .sql import sql_str
+
+BOM_CONFIG = {
+    'finished_goods': 4,     # 成品数（不足 PRODUCTS 数量时按 PRODUCTS 计，多出部分为派生规格）
+    'depth': 3,              # BOM层数（1 = 成品直接由原料构成）
+    'width': 4,              # 每个节点的最大子件数
+    'raw_materials': 200,    # 原料池大小（所有BOM叶子共享）
+    'reuse_rate': 0.3,       # 半成品复用同层已有件的概率（共享件）
+    'sampler': 'legacy',     # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 26,              # 独立随机种子，不影响主流程数据
+}
+
+# (名称前缀, 单位, 单位成本范围-元)
+RAW_MATERIAL_KINDS = [
+    ('大豆', 'kg', (4.0, 9.0)),
+    ('凝固剂', 'kg', (10.0, 30.0)),
+    ('食用盐', 'kg', (1.5, 4.0)),
+    ('包装膜', '卷', (20.0, 60.0)),
+    ('纸箱', '个', (1.0, 3.5)),
+    ('标签', '张', (0.02, 0.1)),
+]
+
+SEMI_FINISHED_KINDS = [
+    ('豆浆', 'L'),
+    ('豆腐胚', 'kg'),
+    ('千张胚', 'kg'),
+    ('包装组件', '套'),
+]
+
+
+def build_finished_goods(products, count, rng):
+    """成品清单：PRODUCTS 本身 + 派生规格（每个派生规格挂在一个基础产品下，按权重分摊其需求）"""
+    goods = [
+        {'code': p['sku'], 'name': p['name'], 'product_id': p['id'], 'weight': 1.0}
+        for p in products
+    ]
+    for n in range(len(products) + 1, count + 1):
+        base = products[(n - 1) % len(products)]
+        goods.append({
+            'code': f"QZ-FG-{n:06d}",
+            'name': f"{base['name']}-规格{n}",
+            'product_id': base['id'],
+            'weight': round(rng.uniform(0.2, 1.0), 4),
+        })
+    return goods
+
+
+def generate_bom(products, created_at, config=BOM_CONFIG):
+    """
+    生成物料主档与BOM行
+
+    返回 (finished_goods, material_values, bom_values)，后两者为 INSERT 用的元组字符串。
+    """
+    rng = random.Random(config['seed'])
+    depth = max(1, config['depth'])
+    width = max(1, config['width'])
+    reuse_rate = config['reuse_rate']
+
+    finished_goods = build_finished_goods(products, max(config['finished_goods'], len(products)), rng)
+
+    # 原料池：id 从 1 开始连续编号
+    materials = []
+    for n in range(1, config['raw_materials'] + 1):
+        kind, unit, (cost_lo, cost_hi) = RAW_MATERIAL_KINDS[(n - 1) % len(RAW_MATERIAL_KINDS)]
+        materials.append({
+            'id': n,
+            'code': f"RM-{n:06d}",
+            'name': f"{kind}-{n:06d}",
+            'unit': unit,
+            'stock_qty': round(rng.uniform(0, 50000), 3),
+            'safety_stock': round(rng.uniform(100, 5000), 3),
+            'unit_cost': round(rng.uniform(cost_lo, cost_hi), 4),
+        })
+
+    draw_raw_material = make_sampler(uniform(materials), config['sampler']).draw
+
+    semi_by_level = {}  # level → [material]
+    semi_seq = 0
+    bom_values = []
+    bom_id = 1
+
+    # 显式栈展开，避免深层递归；栈元素：(父件编码, 父件名称, 父件所在层)
+    stack = [(g['code'], g['name'], 0) for g in reversed(finished_goods)]
+    while stack:
+        parent_code, parent_name, level = stack.pop()
+        child_level = level + 1
+        used = set()
+        for _ in range(rng.randint(1, width)):
+            if child_level >= depth:
+                material = draw_raw_material(rng)
+            else:
+                pool = semi_by_level.setdefault(child_level, [])
+                if pool and rng.random() < reuse_rate:
+                    material = pool[rng.randrange(len(pool))]
+                else:
+                    semi_seq += 1
+                    kind, unit = SEMI_FINISHED_KINDS[(semi_seq - 1) % len(SEMI_FINISHED_KINDS)]
+                    material = {
+                        'id': len(materials) + 1,
+                        'code': f"SF-{semi_seq:06d}",
+                        'name': f"{kind}-{semi_seq:06d}",
+                        'unit': unit,
+                        'stock_qty': 0,
+                        'safety_stock': round(rng.uniform(0, 500), 3),
+                        'unit_cost': round(rng.uniform(2.0, 20.0), 4),
+                    }
+                    materials.append(material)
+                    pool.append(material)
+                    stack.append((material['code'], material['name'], child_level))
+
+            if material['id'] in used:
+                continue
+            used.add(material['id'])
+
+            qty_per_unit = round(rng.uniform(0.05, 2.0), 4)
+            waste_rate = round(rng.uniform(0, 0.05), 4)
+            bom_values.append(
+                f"({bom_id}, {sql_str(parent_code)}, {sql_str(parent_name)}, {material['id']}, {sql_str(material['name'])}, {qty_per_unit}, '{material['unit']}', {waste_rate}, 1, '{created_at}')"
+            )
+            bom_id += 1
+
+    material_values = [
+        f"({m['id']}, '{m['code']}', {sql_str(m['name'])}, '{m['unit']}', {m['stock_qty']}, {m['safety_stock']}, {m['unit_cost']}, '{created_at}', '{created_at}')"
+        for m in materials
+    ]
+    return finished_goods, material_values, bom_values
+
+
+def derive_demand(finished_goods, product_month_qty):
+    """
+    按订单历史折算成品需求
+
+    product_month_qty: {(product_id, 'YYYY-MM'): 订单数量合计}
+    返回 [(product_code, product_name, period, required_qty)]，可直接作为 runMrp 的 MrpInput。
+    """
+    goods_by_product = {}
+    for g in finished_goods:
+        goods_by_product.setdefault(g['product_id'], []).append(g)
+
+    rows = []
+    for (product_id, period), qty in sorted(product_month_qty.items()):
+        goods = goods_by_product.get(product_id, [])
+        weight_total = sum(g['weight'] for g in goods)
+        for g in goods:
+            required_qty = int(round(qty * g['weight'] / weight_total))
+            if required_qty > 0:
+                rows.append((g['code'], g['name'], period, required_qty))
+    return rows
+
+
+def write_demand_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['product_code', 'product_name', 'period', 'required_qty'])
+        writer.writerows(rows)
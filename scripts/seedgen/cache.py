@@ -0,0 +1,112 @@
+"""
+生成产物的内容寻址缓存
+
+生成脚本默认读写缓存，--no-cache 跳过（缓存目录默认 ~/.cache/qianzhang-seed，上限 --cache-size GB）。
+输出只取决于生成参数（含 --seed）、脚本与 seedgen 源码（CUSTOMER_CONFIG / PRODUCTS 等常量都在脚本源码里）
+以及 Python 版本（random 的算法实现）。把这些内容做 SHA-256 得到缓存键，
+产物以 <键>.sql.gz 压缩保存在本地缓存目录：
+- 命中：解压到 --output，并刷新文件时间（LRU）
+- 未命中：正常生成后压缩写入缓存（先写临时文件再改名，并发的 CI 任务不会读到半个文件）
+- 缓存总大小超过上限时按最近使用时间淘汰最旧的产物
+
+命中缓存时文件头的「生成时间」是产物首次生成的时间。
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# 不影响输出内容的参数，不参与缓存键
+IGNORED_ARGS = ('output', 'cache', 'cache_dir', 'cache_size', 'metrics_textfile', 'metrics_port', 'metrics_interval',
+                'scenario_baseline')
+
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                 'qianzhang-seed')
+
+
+def cache_key(args, source_files):
+    """有效参数 + 源码内容 + Python 版本 → 十六进制 SHA-256"""
+    digest = hashlib.sha256()
+    effective = {k: v for k, v in sorted(vars(args).items()) if k not in IGNORED_ARGS}
+    digest.update(json.dumps(effective, sort_keys=True, default=str).encode())
+    digest.update(f"python{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    for path in sorted(source_files):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def source_files(script_path):
+    """生成脚本本身与 seedgen 包内全部模块"""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.abspath(script_path)] + glob.glob(os.path.join(package_dir, '*.py'))
+
+
+class ArtifactCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=20 * 1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.sql.gz")
+
+    def fetch(self, key, output_file):
+        """命中则解压到 output_file 并返回缓存文件路径，否则返回 None"""
+        path = self.path(key)
+        try:
+            source = gzip.open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        with source, open(output_file, 'wb') as f:
+            shutil.copyfileobj(source, f, 1024 * 1024)
+        os.utime(path)
+        return path
+
+    def store(self, key, output_file, meta=None):
+        """压缩保存 output_file，返回 (缓存文件路径, 淘汰的产物数)"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{key[:12]}-", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) as f, \
+                    open(output_file, 'rb') as source:
+                shutil.copyfileobj(source, f, 1024 * 1024)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if meta is not None:
+            with open(path[:-len('.sql.gz')] + '.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+        return path, self.evict(keep=path)
+
+    def evict(self, keep=None):
+        """按最近使用时间（文件 mtime）淘汰，直到总大小不超过上限；返回淘汰数"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.sql.gz')):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # 并发淘汰
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            for victim in (path, path[:-len('.sql.gz')] + '.json'):
+                try:
+                    os.unlink(victim)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            evicted += 1
+        return evicted
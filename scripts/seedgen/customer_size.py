@@ -0,0 +1,58 @@
+"""
+客户规模长尾分布：每个客户一个规模乘数（Pareto 或 lognormal），同类客户内部归一化
+
+规模乘数 m 拆成两部分：
+- 频次系数 f = m^share / mean(m^share)，乘到 orders_per_month 上（随机舍入）
+- 金额系数 g = m / f，乘到单笔目标金额上
+因此每类客户的订单总数期望仍为 count × orders_per_month，营收期望仍为原目标，
+但头部客户可以比中位客户大两个数量级，暴露 GROUP BY customer_id / 客户P&L / 信用检查的热点行。
+归一化常数（规模均值、频次均值）按类别在期初客户上计算一次，多年模式下第2年起新增的客户沿用同一常数，
+不在每年的小批新客户内部重新归一化（否则单个新增批发商的乘数恒为 1，类内营收随年份漂移）。
+"""
+
+import random
+
+CUSTOMER_SIZE_CONFIG = {
+    'distribution': 'pareto',  # pareto | lognormal
+    'pareto_alpha': 1.16,      # 约 80/20
+    'lognormal_sigma': 1.0,
+    'frequency_share': 0.5,    # 规模差异中体现为下单频次的比例，其余体现为单笔金额
+    'max_size': 200.0,         # 原始抽样值上限（两种分布的基准规模均约为 1），防止样本少时单个客户吞掉整类营收
+    'seed': 32,
+}
+
+
+class CustomerSizeModel:
+    def __init__(self, config=CUSTOMER_SIZE_CONFIG):
+        if config['distribution'] not in ('pareto', 'lognormal'):
+            raise ValueError(f"未知的客户规模分布：{config['distribution']}")
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.norms = {}  # 类别 → (规模均值, 频次均值)，首次调用 factors 时确定
+
+    def _draw(self):
+        if self.config['distribution'] == 'pareto':
+            return self.rng.paretovariate(self.config['pareto_alpha'])
+        return self.rng.lognormvariate(0, self.config['lognormal_sigma'])
+
+    def factors(self, count, category=None):
+        """返回 count 个 (频次系数, 金额系数)；category 的首批客户确定归一化常数，之后各批沿用"""
+        sizes = [min(self._draw(), self.config['max_size']) for _ in range(count)]
+        share = self.config['frequency_share']
+        norm = self.norms.get(category)
+        if norm is None:
+            mean_size = sum(sizes) / count
+            mean_freq = sum((m / mean_size) ** share for m in sizes) / count
+            norm = (mean_size, mean_freq)
+            if category is not None:
+                self.norms[category] = norm
+        mean_size, mean_freq = norm
+        sizes = [m / mean_size for m in sizes]
+        freq = [m ** share / mean_freq for m in sizes]
+        return [(f, m / f) for f, m in zip(freq, sizes)]
+
+    def orders_in_month(self, orders_per_month, frequency):
+        """期望为 orders_per_month × frequency 的随机舍入"""
+        expected = orders_per_month * frequency
+        whole = int(expected)
+        return whole + (1 if self.rng.random() < expected - whole else 0)
@@ -0,0 +1,164 @@
+"""
+最小差异重灌：比较新旧两套生成参数，只输出变化的行
+
+主流程在同一进程内按旧参数、新参数各生成一次（每次从相同的随机数状态开始），
+DeltaCapture 作为输出端把每张表的行按主键顺序落盘成临时文件（一行一条），
+write_delta() 按主键归并比较两份流：
+- 只在旧流中 → DELETE（先于插入执行，子表先删）
+- 只在新流中 → INSERT
+- 两边都有但内容不同 → UPDATE，只 SET 变化的列
+生成的 SQL 不含清理语句，直接在已灌好旧数据的库上执行。
+"""
+
+import os
+import shutil
+import tempfile
+
+from .sql import SqlOutput, append_inserts, split_row
+
+# 非 id 主键的表（drizzle sales_targets 以代表 + 期间唯一）
+TABLE_KEYS = {
+    'sales_targets': ('sales_rep_id', 'period'),
+}
+
+
+def _key_function(table, columns):
+    key_columns = TABLE_KEYS.get(table, ('id',))
+    if key_columns == ('id',) and columns[0] == 'id':
+        return lambda row: int(row[1:row.index(',')])
+    positions = [columns.index(c) for c in key_columns]
+
+    def key(row):
+        tokens = split_row(row)
+        return tuple(int(tokens[i]) if tokens[i].lstrip('-').isdigit() else tokens[i] for i in positions)
+    return key
+
+
+def _key_literal(key):
+    return f"({', '.join(str(v) for v in key)})" if isinstance(key, tuple) else str(key)
+
+
+class DeltaCapture:
+    """输出端：忽略普通语句，把 INSERT 的行按表落盘"""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.tables = {}  # 表 → dict(columns, path, file, key, last, sorted, rows)
+
+    def append(self, line):
+        pass
+
+    def append_replicated(self, table, columns, values, batch_size):
+        spool = self.tables.get(table)
+        if spool is None:
+            path = os.path.join(self.directory, f"{len(self.tables):03d}-{table}.rows")
+            spool = {'columns': list(columns), 'path': path, 'file': open(path, 'w', encoding='utf-8'),
+                     'key': _key_function(table, columns), 'last': None, 'sorted': True, 'rows': 0}
+            self.tables[table] = spool
+        key = spool['key']
+        write = spool['file'].write
+        last = spool['last']
+        for row in values:
+            k = key(row)
+            if last is not None and k <= last:
+                spool['sorted'] = False
+            last = k
+            # 值中的换行改写为 SQL 转义，保证一行一条
+            write(row.replace('\n', '\\n') + '\n')
+        spool['last'] = last
+        spool['rows'] += len(values)
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        self.append_replicated(table, columns, values, batch_size)
+
+    def close(self):
+        for spool in self.tables.values():
+            spool['file'].close()
+
+    def rows(self, table):
+        """按主键顺序产出 (key, row)；落盘时不是主键顺序的表在内存中排序"""
+        spool = self.tables.get(table)
+        if spool is None:
+            return iter(())
+        stream = self._read(spool)
+        if not spool['sorted']:
+            return iter(sorted(stream, key=lambda item: item[0]))
+        return stream
+
+    @staticmethod
+    def _read(spool):
+        key = spool['key']
+        with open(spool['path'], encoding='utf-8') as f:
+            for line in f:
+                row = line[:-1]
+                yield key(row), row
+
+
+def _diff_table(table, columns, old_rows, new_rows, body, stats, key_columns):
+    """归并比较一张表，INSERT/UPDATE 写入 body，返回要删除的主键列表"""
+    deletes, inserts = [], []
+    missing = object()
+    old_item = next(old_rows, missing)
+    new_item = next(new_rows, missing)
+    while old_item is not missing or new_item is not missing:
+        if new_item is missing or (old_item is not missing and old_item[0] < new_item[0]):
+            deletes.append(old_item[0])
+            old_item = next(old_rows, missing)
+        elif old_item is missing or new_item[0] < old_item[0]:
+            inserts.append(new_item[1])
+            new_item = next(new_rows, missing)
+        else:
+            if old_item[1] != new_item[1]:
+                old_tokens, new_tokens = split_row(old_item[1]), split_row(new_item[1])
+                changes = ', '.join(f"{c} = {n}" for c, o, n in zip(columns, old_tokens, new_tokens) if o != n)
+                where = ' AND '.join(f"{c} = {new_tokens[columns.index(c)]}" for c in key_columns)
+                body.append(f"UPDATE {table} SET {changes} WHERE {where};")
+                stats['update'] += 1
+            old_item = next(old_rows, missing)
+            new_item = next(new_rows, missing)
+    if inserts:
+        append_inserts(body, table, columns, inserts, 1000)
+        stats['insert'] += len(inserts)
+    stats['delete'] += len(deletes)
+    return deletes
+
+
+def write_delta(old, new, output_file, header_lines=()):
+    """比较两个 DeltaCapture，写出差异 SQL，返回 {表: {'insert', 'update', 'delete'}}"""
+    tables = list(new.tables) + [t for t in old.tables if t not in new.tables]
+    result = {}
+    deletes = {}
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as body_file:
+        body = SqlOutput(body_file)
+        for table in tables:
+            columns = (new.tables.get(table) or old.tables[table])['columns']
+            if table in old.tables and table in new.tables and old.tables[table]['columns'] != columns:
+                raise ValueError(f"{table} 新旧两次生成的列不一致，无法比较")
+            stats = {'insert': 0, 'update': 0, 'delete': 0}
+            key_columns = TABLE_KEYS.get(table, ('id',))
+            deletes[table] = _diff_table(table, columns, old.rows(table), new.rows(table), body, stats, key_columns)
+            result[table] = stats
+        body.flush()
+        body_file.seek(0)
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            out = SqlOutput(f)
+            for line in header_lines:
+                out.append(line)
+            out.append("SET FOREIGN_KEY_CHECKS = 0;")
+            # 先删除（子表在后登记，倒序删除），避免唯一键与新插入的行冲突
+            for table in reversed(tables):
+                key_columns = TABLE_KEYS.get(table, ('id',))
+                target = key_columns[0] if len(key_columns) == 1 else f"({', '.join(key_columns)})"
+                keys = deletes[table]
+                for i in range(0, len(keys), 1000):
+                    out.append(f"DELETE FROM {table} WHERE {target} IN ({', '.join(_key_literal(k) for k in keys[i:i + 1000])});")
+            out.flush()
+            if body_file.read(1):
+                body_file.seek(0)
+                f.write("\n")
+                shutil.copyfileobj(body_file, f)
+            out.append("SET FOREIGN_KEY_CHECKS = 1;")
+            out.close()
+    return result
@@ -0,0 +1,133 @@
+"""
+需求时间分布模型：年度季节曲线 × 星期系数 × 春节效应 × 促销冲量，外加按客户类型的日内时段分布
+
+默认的 random_date_in_month / 8~17点均匀时刻会把热点抹平；启用后订单日期从整年的
+日权重累积表中抽样（每个客户的年订单总数不变），下单时刻从客户类型的小时权重累积表中抽样，
+两者都是 bisect 查预计算表，并直接返回预格式化的字符串，抽样成本与分布复杂度无关。
+"""
+
+import bisect
+import datetime
+import itertools
+import math
+import random
+
+DEMAND_CONFIG = {
+    'seasonal_amplitude': 0.15,   # 年度季节波动幅度（冬季火锅季高、夏季低）
+    'seasonal_peak_doy': 15,      # 季节峰值在一年中的第几天
+    'festival_pre_days': 21,      # 春节前备货期天数
+    'festival_pre_peak': 2.2,     # 春节前最后一天的需求倍数
+    'festival_closed_days': 7,    # 春节停市天数
+    'festival_closed_factor': 0.3,
+    'festival_recovery_days': 7,
+    'festival_recovery_factor': 0.8,
+    'promotion_probability': 0.02,  # 每天出现促销冲量的概率
+    'promotion_surge': (2.0, 4.0),  # 促销日需求倍数
+    'seed': 31,
+}
+
+# 周一..周日
+WEEKDAY_MULTIPLIERS = [1.05, 0.95, 0.85, 1.0, 1.1, 1.15, 0.9]
+
+# 春节（农历正月初一）公历日期
+SPRING_FESTIVAL = {
+    2020: datetime.date(2020, 1, 25),
+    2021: datetime.date(2021, 2, 12),
+    2022: datetime.date(2022, 2, 1),
+    2023: datetime.date(2023, 1, 22),
+    2024: datetime.date(2024, 2, 10),
+    2025: datetime.date(2025, 1, 29),
+    2026: datetime.date(2026, 2, 17),
+    2027: datetime.date(2027, 2, 6),
+    2028: datetime.date(2028, 1, 26),
+    2029: datetime.date(2029, 2, 13),
+    2030: datetime.date(2030, 2, 3),
+    2031: datetime.date(2031, 1, 23),
+    2032: datetime.date(2032, 2, 11),
+    2033: datetime.date(2033, 1, 31),
+    2034: datetime.date(2034, 2, 19),
+    2035: datetime.date(2035, 2, 8),
+}
+
+# 24小时权重：菜市场凌晨进货，商超早间和午后补货，批发商夜间到清晨集中
+INTRADAY_PROFILES = {
+    'WET_MARKET':  [2, 4, 8, 16, 20, 16, 9, 5, 3, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    'SUPERMARKET': [0, 0, 0, 0, 1, 2, 5, 9, 10, 9, 6, 4, 3, 4, 6, 7, 6, 4, 3, 2, 1, 1, 0, 0],
+    'WHOLESALE_B': [6, 5, 5, 7, 9, 8, 5, 3, 2, 2, 2, 2, 1, 1, 1, 1, 2, 2, 3, 3, 4, 5, 6, 7],
+}
+DEFAULT_INTRADAY = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0]
+
+
+def festival_factor(day, config=DEMAND_CONFIG):
+    """春节效应：节前线性爬升到 festival_pre_peak，节中停市，节后逐步恢复"""
+    festival = SPRING_FESTIVAL.get(day.year)
+    factor = 1.0
+    # 跨年：12月底可能落在下一年春节的备货期
+    for candidate in (festival, SPRING_FESTIVAL.get(day.year + 1)):
+        if candidate is None:
+            continue
+        offset = (day - candidate).days
+        if -config['festival_pre_days'] <= offset < 0:
+            ramp = (config['festival_pre_days'] + offset + 1) / config['festival_pre_days']
+            factor = 1.0 + (config['festival_pre_peak'] - 1.0) * ramp
+        elif 0 <= offset < config['festival_closed_days']:
+            factor = config['festival_closed_factor']
+        elif 0 <= offset - config['festival_closed_days'] < config['festival_recovery_days']:
+            factor = config['festival_recovery_factor']
+    return factor
+
+
+class DemandModel:
+    """按年预计算日权重累积表，按客户类型预计算小时权重累积表"""
+
+    def __init__(self, config=DEMAND_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self._years = {}
+        self._hours = {}
+        self._minutes = [f"{m:02d}" for m in range(60)]
+
+    def day_weight(self, day, promotion=1.0):
+        cfg = self.config
+        doy = day.timetuple().tm_yday
+        seasonal = 1.0 + cfg['seasonal_amplitude'] * math.cos(2 * math.pi * (doy - cfg['seasonal_peak_doy']) / 365.0)
+        return seasonal * WEEKDAY_MULTIPLIERS[day.weekday()] * festival_factor(day, cfg) * promotion
+
+    def _year_table(self, year):
+        table = self._years.get(year)
+        if table is None:
+            cfg = self.config
+            days, weights = [], []
+            day = datetime.date(year, 1, 1)
+            while day.year == year:
+                promotion = 1.0
+                if self.rng.random() < cfg['promotion_probability']:
+                    promotion = self.rng.uniform(*cfg['promotion_surge'])
+                days.append(day)
+                weights.append(self.day_weight(day, promotion))
+                day += datetime.timedelta(days=1)
+            cum = list(itertools.accumulate(weights))
+            table = (days, [d.strftime('%Y-%m-%d') for d in days], cum)
+            self._years[year] = table
+        return table
+
+    def sample_date(self, rng, year):
+        """返回 (date, 'YYYY-MM-DD')"""
+        days, labels, cum = self._year_table(year)
+        i = bisect.bisect_right(cum, rng.random() * cum[-1])
+        return days[i], labels[i]
+
+    def sample_time(self, rng, category):
+        """返回 'HH:MM:00'"""
+        table = self._hours.get(category)
+        if table is None:
+            table = list(itertools.accumulate(INTRADAY_PROFILES.get(category, DEFAULT_INTRADAY)))
+            self._hours[category] = table
+        hour = bisect.bisect_right(table, rng.random() * table[-1])
+        return f"{hour:02d}:{self._minutes[int(rng.random() * 60)]}:00"
+
+    def peak_day_index(self, year):
+        """年内最高日权重 / 平均日权重（生成前的理论值）"""
+        _, _, cum = self._year_table(year)
+        daily = [cum[0]] + [b - a for a, b in zip(cum, cum[1:])]
+        return max(daily) / (cum[-1] / len(daily))
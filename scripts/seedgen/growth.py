@@ -0,0 +1,57 @@
+"""
+多年历史：客户获客/流失、年度调价与业务量增长
+
+第 1 年与单年生成完全一致；从第 2 年起每年：
+- 年初按流失率为每个在册客户抽一次流失，流失客户在流失日之后不再下单
+- 按获客率新增客户（基数为年初在册的同类客户数），created_at 为年内获客日期，获客日之前不下单
+- 产品单价按 price_inflation 复利上调，单笔目标金额按 (1 + volume_growth) × (1 + price_inflation) 复利增长
+"""
+
+import datetime
+import random
+
+GROWTH_CONFIG = {
+    'volume_growth': 0.08,     # 年度业务量（实物量）增长
+    'price_inflation': 0.03,   # 年度调价
+    'acquisition_rate': 0.15,  # 年度新增客户 / 年初在册客户
+    'churn_rate': 0.08,        # 年度客户流失率
+    'seed': 33,
+}
+
+
+def _random_day(rng, year):
+    start = datetime.date(year, 1, 1)
+    days = (datetime.date(year + 1, 1, 1) - start).days
+    return start + datetime.timedelta(days=rng.randrange(days))
+
+
+class GrowthModel:
+    def __init__(self, config=GROWTH_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+
+    def price_factor(self, year_index):
+        return (1 + self.config['price_inflation']) ** year_index
+
+    def amount_factor(self, year_index):
+        """单笔目标金额的增长倍数（量 × 价）"""
+        return (1 + self.config['volume_growth']) ** year_index * self.price_factor(year_index)
+
+    def products_for_year(self, products, year_index):
+        """返回调价后的产品列表（id/sku 不变）"""
+        if year_index == 0:
+            return products
+        factor = self.price_factor(year_index)
+        return [dict(p, unit_price_fen=int(round(p['unit_price_fen'] * factor))) for p in products]
+
+    def acquisitions(self, year, active_count):
+        """返回年内新增客户的获客日期（升序）"""
+        expected = active_count * self.config['acquisition_rate']
+        count = int(expected) + (1 if self.rng.random() < expected - int(expected) else 0)
+        return sorted(_random_day(self.rng, year) for _ in range(count))
+
+    def churn_date(self, year):
+        """返回年内流失日期，不流失时返回 None"""
+        if self.rng.random() < self.config['churn_rate']:
+            return _random_day(self.rng, year)
+        return None
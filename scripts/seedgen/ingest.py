@@ -0,0 +1,227 @@
+"""
+直接入库：生成与写库重叠执行，不再经过 SQL 文件 + mysql 客户端
+
+- 生产者：主流程（单线程，保证随机数流可复现），append_inserts 把行按批放入有界队列，队列满时阻塞（背压）
+- 消费者：N 个线程各持一个 DB-API 2.0 连接（连接池），取批次后 executemany 参数化插入并提交
+- 普通语句（清理、DDL）在生产者连接上执行，执行前先等队列排空，保证与数据的先后顺序
+- 验证 SELECT 与注释跳过，改为输出按表的吞吐计数
+
+驱动规格 DRIVER:DSN：
+- sqlite3:/tmp/seed.db（本地替身：表按列名自动建立，跳过 SET 与 MySQL DDL，不存在的表跳过 DELETE）
+- pymysql:host=127.0.0.1,port=3306,user=root,password=xxx,database=qianzhang_sales,charset=utf8mb4
+
+行在主流程中已格式化为 SQL 元组字面量，消费者线程用 parse_row() 还原为参数元组。
+"""
+
+import importlib
+import queue
+import re
+import threading
+import time
+
+_TOKEN = re.compile(r"'((?:[^'\\]|\\.)*)'|(NULL)|(-?\d+\.\d+)|(-?\d+)")
+_UNESCAPE = re.compile(r"\\(.)")
+_STOP = object()
+
+
+def parse_row(text):
+    """把 "(1, 'a\\'b', NULL, 2.5)" 还原为 (1, "a'b", None, 2.5)"""
+    row = []
+    for m in _TOKEN.finditer(text):
+        s, null, real, integer = m.groups()
+        if s is not None:
+            row.append(_UNESCAPE.sub(r"\1", s) if '\\' in s else s)
+        elif null:
+            row.append(None)
+        elif real:
+            row.append(float(real))
+        else:
+            row.append(int(integer))
+    return tuple(row)
+
+
+def parse_driver_spec(spec):
+    """'module:dsn' → (module, args, kwargs)；dsn 含 '=' 时解析为逗号分隔的关键字参数"""
+    module_name, sep, dsn = spec.partition(':')
+    if not sep:
+        raise ValueError(f"驱动规格应为 DRIVER:DSN，实际为：{spec}")
+    module = importlib.import_module(module_name)
+    if '=' not in dsn:
+        return module, (dsn,), {}
+    kwargs = {}
+    for part in dsn.split(','):
+        key, _, value = part.partition('=')
+        kwargs[key.strip()] = int(value) if value.isdigit() else value
+    return module, (), kwargs
+
+
+def placeholders(paramstyle, count):
+    if paramstyle == 'qmark':
+        return ', '.join('?' * count)
+    if paramstyle == 'numeric':
+        return ', '.join(f":{n}" for n in range(1, count + 1))
+    if paramstyle == 'named':
+        return ', '.join(f":p{n}" for n in range(count))
+    return ', '.join(['%s'] * count)  # format / pyformat
+
+
+class IngestOutput:
+    """与 SqlOutput 接口相同的输出端，把数据直接写入数据库"""
+
+    def __init__(self, spec, workers=4, queue_batches=64, batch_rows=1000):
+        self.module, self.connect_args, self.connect_kwargs = parse_driver_spec(spec)
+        self.dialect = 'sqlite' if self.module.__name__ == 'sqlite3' else 'mysql'
+        if self.dialect == 'sqlite':
+            # 多个连接写同一个库文件，写锁等待时间放宽
+            self.connect_kwargs.setdefault('timeout', 60)
+        self.batch_rows = batch_rows
+        self.queue = queue.Queue(maxsize=queue_batches)
+        self.lock = threading.Lock()
+        self.stats = {}          # 表 → [行数, 批数, 累计执行秒数]
+        self.blocked_seconds = 0.0
+        self.max_depth = 0
+        self.error = None
+        self.pending_sql = []
+        self.created_tables = set()
+        self.started = time.monotonic()
+        self.conn = self._connect()
+        self.threads = [threading.Thread(target=self._consume, name=f"ingest-{n}", daemon=True)
+                        for n in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def _connect(self):
+        conn = self.module.connect(*self.connect_args, **self.connect_kwargs)
+        if self.dialect == 'mysql':
+            cursor = conn.cursor()
+            # 多个连接并发写入父子表，会话内关闭外键检查
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            cursor.close()
+        return conn
+
+    # ---------- 消费者 ----------
+
+    def _consume(self):
+        conn = None
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+        except Exception as e:
+            self.error = self.error or e
+        try:
+            # 出错（含连接失败）后线程不退出，只排空队列：否则队列满时生产者与 close() 会永远阻塞
+            while True:
+                item = self.queue.get()
+                try:
+                    if item is _STOP:
+                        return
+                    if self.error is not None:
+                        continue
+                    table, sql, rows = item
+                    started = time.monotonic()
+                    cursor.executemany(sql, [parse_row(row) for row in rows])
+                    conn.commit()
+                    elapsed = time.monotonic() - started
+                    with self.lock:
+                        stat = self.stats.setdefault(table, [0, 0, 0.0])
+                        stat[0] += len(rows)
+                        stat[1] += 1
+                        stat[2] += elapsed
+                except Exception as e:
+                    self.error = self.error or e
+                finally:
+                    self.queue.task_done()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _check(self):
+        if self.error is not None:
+            raise RuntimeError(f"入库失败：{self.error}") from self.error
+
+    # ---------- 生产者（主流程） ----------
+
+    def append(self, line):
+        """普通语句按分号切分后在生产者连接上执行；注释与 SELECT 跳过"""
+        for text in line.split('\n'):
+            stripped = text.strip()
+            if not stripped or stripped.startswith('--'):
+                continue
+            self.pending_sql.append(text)
+            if stripped.endswith(';'):
+                statement = '\n'.join(self.pending_sql).strip().rstrip(';')
+                self.pending_sql = []
+                self._execute(statement)
+
+    def _execute(self, statement):
+        keyword = statement.split(None, 1)[0].upper()
+        if keyword == 'SELECT':
+            return
+        if self.dialect == 'sqlite':
+            if keyword in ('SET', 'CREATE'):
+                return
+            if keyword == 'DELETE' and not self._sqlite_table_exists(statement.split()[2]):
+                return
+        self.queue.join()
+        self._check()
+        cursor = self.conn.cursor()
+        cursor.execute(statement)
+        self.conn.commit()
+        cursor.close()
+
+    def _sqlite_table_exists(self, table):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        exists = cursor.fetchone() is not None
+        cursor.close()
+        return exists
+
+    def _ensure_table(self, table, columns):
+        if self.dialect != 'sqlite' or table in self.created_tables:
+            return
+        cursor = self.conn.cursor()
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+        self.conn.commit()
+        cursor.close()
+        self.created_tables.add(table)
+
+    def append_replicated(self, table, columns, values, batch_size):
+        self._ensure_table(table, columns)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders(self.module.paramstyle, len(columns))})"
+        for i in range(0, len(values), self.batch_rows):
+            self._check()
+            item = (table, sql, values[i:i + self.batch_rows])
+            try:
+                self.queue.put_nowait(item)
+            except queue.Full:
+                started = time.monotonic()
+                self.queue.put(item)
+                self.blocked_seconds += time.monotonic() - started
+            self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        self.append_replicated(table, columns, values, batch_size)
+
+    def flush(self):
+        self.queue.join()
+        self._check()
+
+    def close(self):
+        for _ in self.threads:
+            self.queue.put(_STOP)
+        for thread in self.threads:
+            thread.join()
+        self.conn.close()
+        self.elapsed = time.monotonic() - self.started
+        self._check()
+
+    def report(self):
+        """返回输出用的统计行"""
+        lines = []
+        total = 0
+        for table, (rows, batches, seconds) in self.stats.items():
+            total += rows
+            lines.append(f"{table}: {rows}行 / {batches}批，执行{seconds:.1f}秒（{rows / seconds if seconds else 0:,.0f}行/秒）")
+        lines.append(f"合计 {total}行，墙钟{self.elapsed:.1f}秒（{total / self.elapsed if self.elapsed else 0:,.0f}行/秒）")
+        lines.append(f"背压：生产者阻塞{self.blocked_seconds:.1f}秒，队列最大深度{self.max_depth}/{self.queue.maxsize}")
+        return lines
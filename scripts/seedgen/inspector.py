@@ -0,0 +1,204 @@
+"""
+种子SQL文件检查：mmap 扫描 INSERT 语句，不导入数据库、不把行读成 Python 字符串
+
+  python -m seedgen.inspector seed-600m-revenue.sql [更多文件...] [--json] [--fast]
+
+逐条定位 INSERT INTO <table> (<列>) VALUES 头（mmap.find，C 级搜索），正则直接在 mmap 上按语句起止位置匹配：
+- 行数：语句体内 "\\n(" 的个数（mmap 没有 count；切片会复制整条语句，改用编译好的正则在 mmap 上 findall）
+- 主键范围：语句首行、末行的第一列
+- 日期范围 / 营收：按列位置编译的行正则（每表每列一个，只有一个捕获组），findall 后 min/max/sum 在 C 里完成
+  （--fast 跳过，只统计行数与主键范围，金额单位只看每条语句首行）
+版本识别：文件头注释中的 vN；customers 是否有 customer_name 列（v2）；orders.total_amount 是否带小数（元 / 分）。
+"""
+
+import argparse
+import json
+import mmap
+import re
+import sys
+from decimal import Decimal
+
+HEADER = re.compile(rb"INSERT INTO `?(\w+)`? \(([^)]*)\) VALUES\s*")
+FIELD = rb"(?:'(?:[^'\\]|\\.)*'|NULL|-?\d+(?:\.\d+)?)"
+FIRST_FIELD = re.compile(rb"\(\s*(" + FIELD + rb")")
+ROW_START = re.compile(rb"\n\(")
+VERSION = re.compile(r"\b(v\d+)\b")
+
+# 每张表用于日期范围的列（按优先顺序取第一个存在的列）
+DATE_COLUMNS = ('order_date', 'production_date', 'departure_time', 'balance_date', 'changed_at', 'activity_at',
+                'effective_from', 'created_at')
+AMOUNT_TABLE, AMOUNT_COLUMN = 'orders', 'total_amount'
+# 跳过前面的列：占有量词，不回溯（字符串里的转义只有 \\x 形式，见 sql.sql_str）
+SKIP_FIELD = rb"(?:'[^'\\]*+(?:\\.[^'\\]*+)*+'|[^,'()\n]*+)"
+# 目标列是正则的最后一段，只需匹配到要捕获的部分
+DATE_FIELD = rb"(?:'(\d{4}-\d\d-\d\d)|NULL)"
+AMOUNT_FIELD = rb"(-?\d+(?:\.\d+)?)"
+
+
+def _column_pattern(columns, column, field):
+    """行首定位到 column 所在位置的正则，只有该列一个捕获组：^( F, F, ..., <field>"""
+    index = columns.index(column)
+    return re.compile(rb"^\(" + rb",\s*+".join([SKIP_FIELD] * index + [field]), re.M)
+
+
+class TableSummary:
+    def __init__(self, table, columns, fast=False):
+        self.table = table
+        self.fast = fast
+        self.columns = columns
+        self.statements = 0
+        self.rows = 0
+        self.key = columns[0]
+        self.min_key = self.max_key = None
+        self.date_column = next((c for c in DATE_COLUMNS if c in columns), None)
+        self.min_date = self.max_date = None
+        self.date_pattern = _column_pattern(columns, self.date_column, DATE_FIELD) if self.date_column else None
+        self.amount_pattern = None
+        if table == AMOUNT_TABLE and AMOUNT_COLUMN in columns:
+            self.amount_pattern = _column_pattern(columns, AMOUNT_COLUMN, AMOUNT_FIELD)
+        self.amount_total = 0      # 分
+        self.amount_decimal = False
+
+    def to_dict(self):
+        result = {'table': self.table, 'statements': self.statements, 'rows': self.rows,
+                  'key': self.key, 'key_range': [self.min_key, self.max_key]}
+        if self.date_column:
+            result['date_column'] = self.date_column
+            result['date_range'] = [self.min_date, self.max_date]
+        if self.amount_pattern is not None:
+            result['revenue_fen'] = None if self.fast else self.amount_total
+            result['amount_unit'] = '元（小数）' if self.amount_decimal else '分（整数）'
+        return result
+
+
+def _key(token):
+    token = bytes(token)
+    return int(token) if token.lstrip(b'-').isdigit() else token.strip(b"'").decode('utf-8', 'replace')
+
+
+def scan(path, fast=False):
+    """返回 {'file', 'bytes', 'header_version', 'schema_version', 'tables': [...]}"""
+    tables = {}
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return {'file': path, 'bytes': 0, 'header_version': None, 'schema_version': None, 'tables': []}
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        head = mm[:4096].decode('utf-8', 'ignore')
+        version = VERSION.search(head)
+        pos = 0
+        size = len(mm)
+        while True:
+            pos = mm.find(b"INSERT INTO ", pos)
+            if pos < 0:
+                break
+            header = HEADER.match(mm, pos)
+            if not header:
+                pos += 12
+                continue
+            table = header.group(1).decode()
+            columns = [c.strip().strip('`') for c in header.group(2).decode().split(',')]
+            body_start = header.end()
+            end = mm.find(b";\n", body_start)
+            end = size if end < 0 else end
+            summary = tables.get(table)
+            if summary is None:
+                summary = tables[table] = TableSummary(table, columns, fast)
+            summary.statements += 1
+            summary.rows += len(ROW_START.findall(mm, body_start, end)) + 1
+
+            # 首行、末行的第一列
+            first = FIRST_FIELD.match(mm, body_start, end)
+            last_start = mm.rfind(b"\n(", body_start, end) + 1
+            last = FIRST_FIELD.match(mm, last_start, end) if last_start else first
+            for m in (first, last):
+                if m:
+                    key = _key(m.group(1))
+                    if summary.min_key is None or key < summary.min_key:
+                        summary.min_key = key
+                    if summary.max_key is None or key > summary.max_key:
+                        summary.max_key = key
+
+            if summary.date_pattern is not None and not fast:
+                # 每行只取日期前 10 个字符，min/max 在 C 里完成；NULL 匹配为空串
+                dates = [d for d in summary.date_pattern.findall(mm, body_start, end) if d]
+                if dates:
+                    low, high = min(dates), max(dates)
+                    summary.min_date = low if summary.min_date is None else min(summary.min_date, low)
+                    summary.max_date = high if summary.max_date is None else max(summary.max_date, high)
+            if summary.amount_pattern is not None:
+                if fast:
+                    # 只看首行判断金额单位
+                    m = summary.amount_pattern.match(mm, body_start, end)
+                    summary.amount_decimal = summary.amount_decimal or bool(m and b'.' in m.group(1))
+                else:
+                    amounts = summary.amount_pattern.findall(mm, body_start, end)
+                    if any(b'.' in a for a in amounts):
+                        summary.amount_decimal = True
+                        summary.amount_total += int(sum(map(Decimal, map(bytes.decode, amounts))) * 100)
+                    else:
+                        summary.amount_total += sum(map(int, amounts))
+            pos = end
+    for summary in tables.values():
+        for name in ('min_date', 'max_date'):
+            value = getattr(summary, name)
+            if isinstance(value, bytes):
+                setattr(summary, name, value.decode())
+    return {
+        'file': path,
+        'bytes': size,
+        'header_version': version.group(1) if version else None,
+        'schema_version': _schema_version(tables),
+        'tables': [summary.to_dict() for summary in tables.values()],
+    }
+
+
+def _schema_version(tables):
+    customers, orders = tables.get('customers'), tables.get('orders')
+    if customers is None and orders is None:
+        return None
+    if customers is not None and 'customer_name' in customers.columns:
+        unit = '元' if orders is not None and orders.amount_decimal else '分'
+        return f"v2（customers.customer_name，金额单位{unit}）"
+    return "v3（customers.name + customer_code，金额单位分）"
+
+
+def print_report(result):
+    print(f"{result['file']}（{result['bytes']:,}字节）")
+    print(f"   文件头版本：{result['header_version'] or '未知'}")
+    print(f"   结构版本：{result['schema_version'] or '无法判断（没有 customers / orders 数据）'}")
+    for t in result['tables']:
+        line = f"   {t['table']}: {t['rows']:,}行 / {t['statements']}条INSERT，{t['key']} {t['key_range'][0]}~{t['key_range'][1]}"
+        if t.get('date_range') and t['date_range'][0]:
+            line += f"，{t['date_column']} {t['date_range'][0]}~{t['date_range'][1]}"
+        print(line)
+        if t.get('revenue_fen') is not None:
+            print(f"      营收合计：¥{t['revenue_fen'] / 100:,.2f}（文件中金额单位：{t['amount_unit']}）")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='检查种子SQL文件内容（mmap扫描，不导入数据库）')
+    parser.add_argument('files', nargs='+', help='种子SQL文件')
+    parser.add_argument('--json', action='store_true', help='输出JSON')
+    parser.add_argument('--fast', action='store_true', help='只统计行数与主键范围，不解析日期与金额')
+    args = parser.parse_args(argv)
+    results = []
+    for path in args.files:
+        try:
+            results.append(scan(path, args.fast))
+        except OSError as e:
+            print(f"无法读取 {path}：{e}", file=sys.stderr)
+            return 1
+    if args.json:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for n, result in enumerate(results):
+            if n:
+                print()
+            print_report(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+库存流水（inventory_log）+ 库存主表（inventory）+ 日终结存快照生成
+
+对齐 backend/src/modules/inventory/entities：
+- inventory: id, product_id, product_name, sku, total_stock, available_stock, reserved_stock,
+  low_stock_threshold, unit, warehouse_location, created_at, updated_at
+- inventory_log: id, inventory_id, product_id, type(IN/OUT/ADJUST), quantity, before_stock, after_stock,
+  order_id, order_no, operator_id, operator_name, remark, created_at
+
+流水只追加、按时间排序，before_stock/after_stock 逐条连续：
+1. 生产入库：production_plans.actual_quantity（夜班入库，早于当天配送出发）
+2. 销售出库：每个 FULFILLED 订单的每个订单项（配送出发时间）
+3. 定期盘点：每 count_interval_days 天按产品盘点一次，差异记 ADJUST
+出库时账面不足，先记一条"外协补货"入库，保证库存不为负。
+
+日终结存写入 inventory_daily_balance（不在 Entity 中，CREATE TABLE IF NOT EXISTS），
+用于对比"流水累加"与"快照 + 增量"两种余额查询方案。
+"""
+
+import datetime
+import random
+
+from .sql import sql_str
+
+INVENTORY_CONFIG = {
+    'count_interval_days': 7,    # 盘点周期（天）
+    'shrink_rate_max': 0.01,     # 盘亏比例上限
+    'overage_probability': 0.2,  # 盘盈概率
+    'replenish_buffer': 1.2,     # 外协补货量 = 缺口 × buffer
+    'seed': 27,
+}
+
+WAREHOUSE_KEEPERS = [
+    {'id': 201, 'name': '仓管-周明'},
+    {'id': 202, 'name': '仓管-吴婷'},
+    {'id': 203, 'name': '仓管-郑磊'},
+]
+
+DAILY_BALANCE_DDL = """
+CREATE TABLE IF NOT EXISTS inventory_daily_balance (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  inventory_id INT NOT NULL,
+  product_id INT NOT NULL,
+  balance_date DATE NOT NULL,
+  in_qty INT NOT NULL DEFAULT 0,
+  out_qty INT NOT NULL DEFAULT 0,
+  adjust_qty INT NOT NULL DEFAULT 0,
+  closing_stock INT NOT NULL DEFAULT 0,
+  stock_value_fen BIGINT NOT NULL DEFAULT 0,
+  created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE INDEX uk_product_date (product_id, balance_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+INVENTORY_COLUMNS = ['id', 'product_id', 'product_name', 'sku', 'total_stock', 'available_stock', 'reserved_stock',
+                     'low_stock_threshold', 'unit', 'warehouse_location', 'created_at', 'updated_at']
+INVENTORY_LOG_COLUMNS = ['id', 'inventory_id', 'product_id', 'type', 'quantity', 'before_stock', 'after_stock',
+                         'order_id', 'order_no', 'operator_id', 'operator_name', 'remark', 'created_at']
+DAILY_BALANCE_COLUMNS = ['id', 'inventory_id', 'product_id', 'balance_date', 'in_qty', 'out_qty', 'adjust_qty',
+                         'closing_stock', 'stock_value_fen', 'created_at']
+
+# 同一时刻先入库后出库
+_KIND_RANK = {'IN': 0, 'OUT': 1}
+
+
+class InventoryLedger:
+    """在主流程中收集出入库事件，按天排序生成连续的流水与日终快照（build 一次生成，或 flush 逐段生成）"""
+
+    def __init__(self, products, config=INVENTORY_CONFIG):
+        self.products = products
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.events = {}  # 'YYYY-MM-DD' → [(time, rank, seq, product_id, qty, order_id, order_no, remark)]
+        self.seq = 0
+        self.inventory_ids = {p['id']: n for n, p in enumerate(products, 1)}
+        self.prices = {p['id']: p['unit_price_fen'] for p in products}
+        self.stock = {p['id']: 0 for p in products}
+        self.log_id = 1
+        self.balance_id = 1
+        self.day_index = 0
+        self.next_day = None  # 下一次 flush 的起始日
+
+    def _add(self, date_str, time_str, kind, product_id, qty, order_id=None, order_no=None, remark=None):
+        self.seq += 1
+        self.events.setdefault(date_str, []).append(
+            (time_str, _KIND_RANK[kind], self.seq, product_id, qty, order_id, order_no, remark)
+        )
+
+    def add_receipt(self, date_str, product_id, qty, batch_no):
+        """生产入库：夜班 03:00 入库"""
+        self._add(date_str, f"{date_str} 03:00:00", 'IN', product_id, qty, remark=f"生产入库 批次{batch_no}")
+
+    def add_outbound(self, date_str, time_str, product_id, qty, order_id, order_no):
+        self._add(date_str, time_str, 'OUT', product_id, qty, order_id, order_no, "销售出库")
+
+    def update_prices(self, products):
+        """调价后日终结存按新单价估值"""
+        self.prices = {p['id']: p['unit_price_fen'] for p in products}
+
+    def build(self, start_date, end_date):
+        """返回 (inventory_values, log_values, balance_values)"""
+        log_values, balance_values = self.flush(start_date, end_date)
+        return self.inventory_values(start_date, end_date), log_values, balance_values
+
+    def flush(self, start_date, until_date):
+        """生成截至 until_date 的流水与日终快照（首次从 start_date 开始，之后接着上次结束的次日），
+        账面余额和 id 跨调用延续，多年生成时可逐年输出；返回 (log_values, balance_values)"""
+        rng = self.rng
+        cfg = self.config
+        inventory_ids = self.inventory_ids
+        stock = self.stock
+
+        log_values = []
+        balance_values = []
+
+        def append_log(time_str, kind, product_id, qty, order_id, order_no, operator, remark):
+            before = stock[product_id]
+            after = before + qty
+            stock[product_id] = after
+            log_values.append(
+                f"({self.log_id}, {inventory_ids[product_id]}, {product_id}, '{kind}', {qty}, {before}, {after}, "
+                f"{order_id if order_id is not None else 'NULL'}, {sql_str(order_no) if order_no else 'NULL'}, "
+                f"{operator['id']}, '{operator['name']}', {sql_str(remark)}, '{time_str}')"
+            )
+            self.log_id += 1
+
+        day = self.next_day or start_date
+        while day <= until_date:
+            date_str = day.strftime('%Y-%m-%d')
+            daily = {pid: [0, 0, 0] for pid in stock}  # in, out, adjust
+
+            for time_str, _, _, product_id, qty, order_id, order_no, remark in sorted(self.events.pop(date_str, ())):
+                operator = WAREHOUSE_KEEPERS[product_id % len(WAREHOUSE_KEEPERS)]
+                if order_id is None:
+                    append_log(time_str, 'IN', product_id, qty, None, None, operator, remark)
+                    daily[product_id][0] += qty
+                    continue
+                shortage = qty - stock[product_id]
+                if shortage > 0:
+                    replenish = int(shortage * cfg['replenish_buffer']) + 1
+                    append_log(time_str, 'IN', product_id, replenish, None, None, operator, "外协补货")
+                    daily[product_id][0] += replenish
+                append_log(time_str, 'OUT', product_id, -qty, order_id, order_no, operator, remark)
+                daily[product_id][1] += qty
+
+            # 定期盘点（当天 23:30），差异记 ADJUST
+            self.day_index += 1
+            if self.day_index % cfg['count_interval_days'] == 0:
+                for product_id, book in stock.items():
+                    if book <= 0:
+                        continue
+                    if rng.random() < cfg['overage_probability']:
+                        diff = int(book * rng.uniform(0, cfg['shrink_rate_max'] / 2))
+                    else:
+                        diff = -int(book * rng.uniform(0, cfg['shrink_rate_max']))
+                    if diff == 0:
+                        continue
+                    operator = WAREHOUSE_KEEPERS[product_id % len(WAREHOUSE_KEEPERS)]
+                    append_log(f"{date_str} 23:30:00", 'ADJUST', product_id, diff, None, None, operator,
+                               "盘盈" if diff > 0 else "盘亏")
+                    daily[product_id][2] += diff
+
+            for product_id, (in_qty, out_qty, adjust_qty) in daily.items():
+                closing = stock[product_id]
+                balance_values.append(
+                    f"({self.balance_id}, {inventory_ids[product_id]}, {product_id}, '{date_str}', {in_qty}, {out_qty}, "
+                    f"{adjust_qty}, {closing}, {closing * self.prices[product_id]}, '{date_str} 23:59:59')"
+                )
+                self.balance_id += 1
+
+            day += datetime.timedelta(days=1)
+        self.next_day = day
+        return log_values, balance_values
+
+    def inventory_values(self, start_date, end_date):
+        """库存主表：total_stock 为当前账面余额"""
+        inventory_ids = self.inventory_ids
+        stock = self.stock
+        created_at = start_date.strftime('%Y-%m-%d %H:%M:%S')
+        updated_at = end_date.strftime('%Y-%m-%d 23:59:59')
+        return [
+            f"({inventory_ids[p['id']]}, {p['id']}, '{p['name']}', '{p['sku']}', {stock[p['id']]}, {stock[p['id']]}, 0, "
+            f"1000, '件', '成品仓-{inventory_ids[p['id']]:02d}', '{created_at}', '{updated_at}')"
+            for p in self.products
+        ]
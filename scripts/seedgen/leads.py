@@ -0,0 +1,177 @@
+"""
+线索（leads）+ 跟进记录 + 状态流转生成，转化线索与生成的客户一一对应
+
+对齐 backend/src/modules/leads/entities/lead.entity.ts：
+- leads: id, company_name, contact_name, contact_phone, contact_email, source(Website/Mobile/Referral/Exhibition/Other),
+  message, status(NEW/CONTACTED/QUALIFIED/CONVERTED/LOST), assigned_to, created_at, updated_at
+另外生成（CREATE TABLE IF NOT EXISTS）：
+- lead_status_history：每次状态流转一行，CONVERTED 行带 customer_id
+- lead_activities：电话/拜访/微信/送样等跟进记录
+
+漏斗：NEW → CONTACTED → QUALIFIED → CONVERTED，任意阶段可能流失（LOST）或停留。
+转化线索的转化日期早于等于对应客户的 created_at（客户 created_at 改为转化日期），
+其余线索分布在回看窗口到 END_DATE 之间。
+"""
+
+import datetime
+import random
+
+from .sampling import make_sampler, uniform
+from .sql import sql_str
+
+LEADS_CONFIG = {
+    'conversion_rate': 0.05,       # 线索转化率（转化数 = 线索总数 × 转化率，上限为客户数）
+    'customer_coverage': 0.8,      # 来自线索的客户占比（用于推导默认线索总数）
+    'total': None,                 # 线索总数，None 时按 客户数 × coverage / conversion_rate 推导
+    'lookback_days': 365,          # START_DATE 之前的获客窗口
+    'cycle_days': (7, 120),        # 线索创建 → 转化的周期
+    'activities_per_stage': (0, 3),
+    'sampler': 'legacy',           # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 30,
+}
+
+# (来源, 权重)
+LEAD_SOURCES = [('Website', 0.35), ('Mobile', 0.25), ('Referral', 0.2), ('Exhibition', 0.12), ('Other', 0.08)]
+# 未转化线索的终态分布
+OPEN_TERMINAL_STATUS = [('NEW', 0.15), ('CONTACTED', 0.25), ('QUALIFIED', 0.15), ('LOST', 0.45)]
+FUNNEL = ['NEW', 'CONTACTED', 'QUALIFIED', 'CONVERTED']
+ACTIVITY_TYPES = [('CALL', '电话沟通'), ('VISIT', '上门拜访'), ('WECHAT', '微信跟进'), ('SAMPLE', '寄送样品'), ('QUOTE', '报价')]
+LEAD_MESSAGES = ['想了解千张批发价格', '需要每日早市配送', '超市门店采购，需要资质文件', '餐饮后厨用量，询问起订量', None]
+
+LEAD_COLUMNS = ['id', 'company_name', 'contact_name', 'contact_phone', 'contact_email', 'source', 'message', 'status',
+                'assigned_to', 'created_at', 'updated_at']
+STATUS_HISTORY_COLUMNS = ['id', 'lead_id', 'from_status', 'to_status', 'customer_id', 'changed_by', 'changed_at']
+ACTIVITY_COLUMNS = ['id', 'lead_id', 'activity_type', 'content', 'operator_id', 'activity_at']
+
+LEADS_DDL = """
+CREATE TABLE IF NOT EXISTS lead_status_history (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  lead_id INT NOT NULL,
+  from_status VARCHAR(20) DEFAULT NULL,
+  to_status VARCHAR(20) NOT NULL,
+  customer_id INT DEFAULT NULL,
+  changed_by INT DEFAULT NULL,
+  changed_at DATETIME NOT NULL,
+  INDEX idx_lead (lead_id),
+  INDEX idx_to_status_changed (to_status, changed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS lead_activities (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  lead_id INT NOT NULL,
+  activity_type VARCHAR(20) NOT NULL,
+  content VARCHAR(500) DEFAULT NULL,
+  operator_id INT DEFAULT NULL,
+  activity_at DATETIME NOT NULL,
+  INDEX idx_lead (lead_id),
+  INDEX idx_activity_at (activity_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+
+def _fmt(ts):
+    return ts.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class LeadFunnel:
+    """先 plan_conversions() 决定哪些客户来自线索及其转化时间，客户生成后再 build() 全部线索"""
+
+    def __init__(self, start_date, end_date, rep_ids, config=LEADS_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.start = datetime.datetime.combine(start_date, datetime.time(0, 0))
+        self.end = datetime.datetime.combine(end_date, datetime.time(23, 59))
+        self.rep_ids = rep_ids
+        method = config['sampler']
+        self.draw_terminal = make_sampler(OPEN_TERMINAL_STATUS, method).draw
+        self.draw_source = make_sampler(LEAD_SOURCES, method).draw
+        self.draw_rep = make_sampler(uniform(rep_ids), method).draw
+        self.draw_activity = make_sampler(uniform(ACTIVITY_TYPES), method).draw
+        self.draw_message = make_sampler(uniform(LEAD_MESSAGES), method).draw
+        self.conversions = {}  # customer_id → 转化时间
+        self.total = 0
+
+    def plan_conversions(self, total_customers):
+        """返回 {customer_id: converted_at}，调用方据此设置客户 created_at"""
+        cfg = self.config
+        rng = self.rng
+        total = cfg['total'] or int(round(total_customers * cfg['customer_coverage'] / cfg['conversion_rate']))
+        converted = min(total_customers, int(round(total * cfg['conversion_rate'])))
+        self.total = max(total, converted)
+        window = cfg['lookback_days'] * 86400
+        for customer_id in sorted(rng.sample(range(1, total_customers + 1), converted)):
+            self.conversions[customer_id] = self.start - datetime.timedelta(seconds=rng.randint(0, window))
+        return self.conversions
+
+    def restrict(self, customer_ids, fraction):
+        """客户抽样：只保留样本客户的转化，线索总数按比例缩小，不引用样本外的客户"""
+        self.conversions = {c: at for c, at in self.conversions.items() if c in customer_ids}
+        self.total = max(len(self.conversions), int(round(self.total * fraction)))
+        return self.conversions
+
+    def build(self, customer_name):
+        """customer_name(customer_id) → 客户名称；返回 (lead_values, history_values, activity_values)"""
+        cfg = self.config
+        rng = self.rng
+        lead_values, history_values, activity_values = [], [], []
+        history_id = activity_id = 1
+
+        # 转化线索与普通线索在 id 空间中交错：随机选出转化线索占用的 id
+        converted_customers = sorted(self.conversions)
+        converted_slots = dict(zip(sorted(rng.sample(range(1, self.total + 1), len(converted_customers))),
+                                   converted_customers))
+        open_start = self.start - datetime.timedelta(days=cfg['lookback_days'])
+        open_span = int((self.end - open_start).total_seconds())
+
+        for lead_id in range(1, self.total + 1):
+            customer_id = converted_slots.get(lead_id)
+            if customer_id:
+                converted_at = self.conversions[customer_id]
+                created = converted_at - datetime.timedelta(days=rng.randint(*cfg['cycle_days']), hours=rng.randint(0, 23))
+                path = FUNNEL
+                company_name = customer_name(customer_id)
+            else:
+                created = open_start + datetime.timedelta(seconds=rng.randint(0, open_span))
+                terminal = self.draw_terminal(rng)
+                if terminal == 'LOST':
+                    path = FUNNEL[:rng.randint(1, 3)] + ['LOST']
+                else:
+                    path = FUNNEL[:FUNNEL.index(terminal) + 1]
+                company_name = f"意向客户-{lead_id:07d}"
+
+            assigned_to = self.draw_rep(rng)
+            # 状态流转时间：均匀切分创建 → 终态之间的时长（转化线索终点为转化时间）
+            if customer_id:
+                stage_end = converted_at
+            else:
+                stage_end = min(self.end, created + datetime.timedelta(days=rng.randint(*cfg['cycle_days'])))
+            step = (stage_end - created) / max(1, len(path) - 1)
+
+            prev_status = None
+            changed = created
+            for n, status in enumerate(path):
+                changed = created + step * n
+                history_values.append(
+                    f"({history_id}, {lead_id}, {sql_str(prev_status) if prev_status else 'NULL'}, '{status}', "
+                    f"{customer_id if status == 'CONVERTED' else 'NULL'}, {assigned_to if n else 'NULL'}, '{_fmt(changed)}')"
+                )
+                history_id += 1
+                if n + 1 < len(path):
+                    for _ in range(rng.randint(*cfg['activities_per_stage'])):
+                        activity_type, label = self.draw_activity(rng)
+                        activity_at = changed + step * rng.random()
+                        activity_values.append(
+                            f"({activity_id}, {lead_id}, '{activity_type}', '{label}（{status}阶段）', {assigned_to}, '{_fmt(activity_at)}')"
+                        )
+                        activity_id += 1
+                prev_status = status
+
+            message = self.draw_message(rng)
+            email = f"'lead{lead_id}@example.com'" if rng.random() < 0.3 else 'NULL'
+            lead_values.append(
+                f"({lead_id}, {sql_str(company_name)}, '联系人{lead_id}', '13{lead_id % 1000000000:09d}', {email}, "
+                f"'{self.draw_source(rng)}', {sql_str(message) if message else 'NULL'}, '{path[-1]}', "
+                f"{assigned_to}, '{_fmt(created)}', '{_fmt(changed)}')"
+            )
+
+        return lead_values, history_values, activity_values
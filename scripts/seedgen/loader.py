@@ -0,0 +1,123 @@
+"""
+按 manifest.json 并发导入拆分后的种子数据
+
+  python -m seedgen.loader /data/seed-split/manifest.json --workers 8 --client "mysql -u root -pxxx qianzhang_sales"
+  python -m seedgen.loader /data/seed-split/manifest.json --workers 8 --fake   # 不连数据库，只校验调度与文件
+
+执行顺序：prelude 串行 → 数据块按表依赖并发（依赖表的全部块完成后才开始）→ epilogue 串行。
+每个数据块是一个独立的客户端会话（stdin 重定向文件），任一块失败即停止派发新块并以非零状态退出。
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def mysql_client(command):
+    """返回 run(path)：用客户端命令行导入单个文件"""
+    argv = shlex.split(command)
+
+    def run(path):
+        with open(path, 'rb') as f:
+            result = subprocess.run(argv, stdin=f, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"{os.path.basename(path)} 导入失败（退出码{result.returncode}）：{result.stderr.decode(errors='replace').strip()}")
+    return run
+
+
+def fake_client(delay_per_mb=0.0):
+    """不连接数据库：读完文件并检查语句以分号结束，可按文件大小模拟耗时"""
+    def run(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        statements = data.count(b';\n') + (1 if data.rstrip().endswith(b';') else 0)
+        if data.strip() and not statements:
+            raise RuntimeError(f"{os.path.basename(path)} 中没有完整的SQL语句")
+        if delay_per_mb:
+            time.sleep(len(data) / 1048576 * delay_per_mb)
+    return run
+
+
+def load(manifest_path, run, workers=4, log=print):
+    """按清单导入，返回 {表: 行数}"""
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    depends = {t['table']: set(t['depends_on']) for t in manifest['tables']}
+    pending = {table: [] for table in depends}
+    for entry in manifest['files']:
+        pending[entry['table']].append(entry)
+    remaining = {table: len(files) for table, files in pending.items()}
+    loaded = {}
+    started = time.monotonic()
+
+    log(f"[prelude] {manifest['prelude']}")
+    run(os.path.join(directory, manifest['prelude']))
+
+    def ready():
+        for table, files in pending.items():
+            if files and all(remaining[dep] == 0 for dep in depends[table]):
+                yield table
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        failed = None
+        while True:
+            if failed is None:
+                for table in list(ready()):
+                    while pending[table] and len(running) < workers:
+                        entry = pending[table].pop(0)
+                        running[pool.submit(run, os.path.join(directory, entry['path']))] = entry
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    # 记录后停止派发新块，等待在途的块结束
+                    failed = failed or e
+                    log(f"[失败] {entry['path']}：{e}")
+                    continue
+                remaining[entry['table']] -= 1
+                loaded[entry['table']] = loaded.get(entry['table'], 0) + entry['rows']
+                log(f"[完成] {entry['path']}（{entry['rows']}行，在途{len(running)}）")
+        if failed is not None:
+            raise failed
+        stuck = [table for table, files in pending.items() if files]
+        if stuck:
+            raise RuntimeError(f"依赖无法满足，未导入的表：{', '.join(stuck)}")
+
+    log(f"[epilogue] {manifest['epilogue']}")
+    run(os.path.join(directory, manifest['epilogue']))
+    elapsed = time.monotonic() - started
+    total = sum(loaded.values())
+    log(f"导入完成：{total}行，{elapsed:.1f}秒（{total / elapsed if elapsed else 0:,.0f}行/秒）")
+    return loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='按manifest.json并发导入拆分后的种子数据')
+    parser.add_argument('manifest', help='generate-600m-revenue-seed.py --split-dir 生成的 manifest.json')
+    parser.add_argument('--workers', type=int, default=4, help='并发客户端会话数')
+    parser.add_argument('--client', default='mysql qianzhang_sales', help='客户端命令行（从标准输入读取SQL）')
+    parser.add_argument('--fake', action='store_true', help='不连接数据库，只读取文件验证调度')
+    parser.add_argument('--fake-delay', type=float, default=0.0, help='--fake 模式下每MB模拟耗时（秒）')
+    args = parser.parse_args(argv)
+    run = fake_client(args.fake_delay) if args.fake else mysql_client(args.client)
+    try:
+        load(args.manifest, run, args.workers)
+    except (RuntimeError, OSError) as e:
+        print(f"导入中止：{e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
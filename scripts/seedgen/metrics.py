@@ -0,0 +1,205 @@
+"""
+长时间生成/入库的实时进度指标（Prometheus 文本格式）
+
+- MeteredOutput 包在任意输出端外面，按表统计生成行数、SQL 文本字节数；
+  直接入库时写入行数取入库端已提交的行数，并给出批次队列深度
+- 主流程调用 ProgressMetrics.set_progress(0..1)，结合已写入/已生成行数计算总进度与 ETA
+- 导出方式（可同时启用）：
+  - --metrics-textfile：node-exporter textfile collector 目录下的 *.prom 文件，按间隔原子替换
+  - --metrics-port：本地 HTTP 端点 /metrics，供 PodMonitor 抓取
+
+指标（前缀 seed_）：
+  seed_rows_generated_total{table}   seed_rows_written_total{table}   seed_bytes_total
+  seed_queue_depth   seed_rows_per_second   seed_progress_ratio   seed_eta_seconds
+  seed_start_time_seconds   seed_done
+标签 run 为输出文件名/目录名/入库驱动（抓取配置里的 job 标签不受影响）。
+"""
+
+import http.server
+import os
+import threading
+import time
+
+from .sql import append_inserts
+
+METRIC_HELP = [
+    ('seed_rows_generated_total', 'counter', '生成器产出的行数'),
+    ('seed_rows_written_total', 'counter', '输出端已写入的行数（直接入库为已提交行数）'),
+    ('seed_bytes_total', 'counter', '产出的 SQL 文本字节数（UTF-8）'),
+    ('seed_queue_depth', 'gauge', '入库批次队列深度'),
+    ('seed_rows_per_second', 'gauge', '最近一个导出间隔的写入速率'),
+    ('seed_progress_ratio', 'gauge', '总进度（0~1，生成进度 × 已写入占已生成比例）'),
+    ('seed_eta_seconds', 'gauge', '预计剩余秒数'),
+    ('seed_start_time_seconds', 'gauge', '开始时间（Unix 秒）'),
+    ('seed_done', 'gauge', '是否已完成'),
+]
+
+
+class ProgressMetrics:
+    def __init__(self, run='seed', textfile=None, port=None, interval=10.0):
+        self.run = run
+        self.textfile = textfile
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.generated = {}
+        self.bytes = 0
+        self.progress = 0.0
+        self.done = False
+        self.source = None       # 输出端（读取已写入行数与队列深度）
+        self.started = time.time()
+        self.last_export = 0.0
+        self.last_rows = (self.started, 0)
+        self.rate = 0.0
+        self.server = None
+        if port is not None:
+            self.server = self._serve(port)
+
+    # ---------- 采集 ----------
+
+    def add_rows(self, table, rows, nbytes):
+        with self.lock:
+            self.generated[table] = self.generated.get(table, 0) + rows
+            self.bytes += nbytes
+        self.maybe_export()
+
+    def add_bytes(self, nbytes):
+        with self.lock:
+            self.bytes += nbytes
+
+    def set_progress(self, ratio):
+        with self.lock:
+            self.progress = min(1.0, max(0.0, ratio))
+        # 进度在两次写出之间也会变化（例如一个大客户的订单尚未输出），textfile 按间隔刷新
+        self.maybe_export()
+
+    def written(self):
+        stats = getattr(self.source, 'stats', None)
+        if isinstance(stats, dict):
+            with self.source.lock:
+                return {table: stat[0] for table, stat in stats.items()}
+        with self.lock:
+            return dict(self.generated)
+
+    def queue_depth(self):
+        queue = getattr(self.source, 'queue', None)
+        return queue.qsize() if queue is not None else 0
+
+    # ---------- 导出 ----------
+
+    def render(self):
+        """HTTP 线程与生成线程都会调用：在锁内取快照，锁外格式化"""
+        now = time.time()
+        written = self.written()
+        total = sum(written.values())
+        with self.lock:
+            generated_rows = dict(self.generated)
+            nbytes, ratio, done = self.bytes, self.progress, self.done
+            last_time, last_total = self.last_rows
+            if now - last_time >= 1.0:
+                self.rate = (total - last_total) / (now - last_time)
+                self.last_rows = (now, total)
+            rate = self.rate
+        # 生成进度 × 已写入占已生成的比例：直接入库时生成端可能远远领先于写入端
+        generated = sum(generated_rows.values())
+        progress = ratio * min(1.0, total / generated) if generated else ratio
+        elapsed = now - self.started
+        eta = elapsed * (1 - progress) / progress if progress > 0 else -1
+        labels = f'run="{self.run}"'
+        values = {
+            'seed_rows_generated_total': [(f'{labels},table="{t}"', n) for t, n in sorted(generated_rows.items())],
+            'seed_rows_written_total': [(f'{labels},table="{t}"', n) for t, n in sorted(written.items())],
+            'seed_bytes_total': [(labels, nbytes)],
+            'seed_queue_depth': [(labels, self.queue_depth())],
+            'seed_rows_per_second': [(labels, round(rate, 1))],
+            'seed_progress_ratio': [(labels, round(progress, 6))],
+            'seed_eta_seconds': [(labels, 0 if done else round(eta, 1))],
+            'seed_start_time_seconds': [(labels, round(self.started, 3))],
+            'seed_done': [(labels, int(done))],
+        }
+        lines = []
+        for name, kind, help_text in METRIC_HELP:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{{{label}}} {value}" for label, value in values[name])
+        return "\n".join(lines) + "\n"
+
+    def maybe_export(self):
+        if self.textfile and time.monotonic() - self.last_export >= self.interval:
+            self.export()
+
+    def export(self):
+        self.last_export = time.monotonic()
+        if not self.textfile:
+            return
+        # textfile collector 可能随时读取：写临时文件后原子改名
+        tmp = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp, self.textfile)
+
+    def finish(self):
+        with self.lock:
+            self.progress = 1.0
+            self.done = True
+        self.export()
+
+    def close(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def _serve(self, port):
+        metrics = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(('', port), Handler)
+        threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+        return server
+
+
+class MeteredOutput:
+    """包装输出端：逐表计数后转交；被包装的输出端没有 append_routed 时按 SqlOutput 方式格式化"""
+
+    def __init__(self, output, metrics):
+        self.output = output
+        self.metrics = metrics
+        metrics.source = output
+
+    def __getattr__(self, name):
+        return getattr(self.output, name)
+
+    def append(self, line):
+        self.metrics.add_bytes(len(line.encode('utf-8')) + 1)
+        self.output.append(line)
+
+    def _count(self, table, columns, values, batch_size):
+        batches = (len(values) + batch_size - 1) // batch_size
+        # 每条语句：头部 + 换行、每行 + ",\n"（末行为 ";\n"）、空行（与 sql.append_inserts 一致）
+        header = len(f"INSERT INTO {table} ({', '.join(columns)}) VALUES".encode('utf-8')) + 2
+        nbytes = sum(len(v.encode('utf-8')) + 2 for v in values) + batches * header
+        self.metrics.add_rows(table, len(values), nbytes)
+
+    def append_replicated(self, table, columns, values, batch_size):
+        self._count(table, columns, values, batch_size)
+        append_inserts(self.output, table, columns, values, batch_size)
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        self._count(table, columns, values, batch_size)
+        append_inserts(self.output, table, columns, values, batch_size, keys)
+
+    def close(self):
+        self.output.close()
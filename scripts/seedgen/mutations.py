@@ -0,0 +1,176 @@
+"""
+订单生命周期变更流（用于压测写路径与 server/db-performance.ts 的缓存失效）
+
+静态种子里订单直接以最终状态插入；变更流模式下按时间顺序回放每个订单的生命周期：
+1. INSERT orders（PENDING_REVIEW）+ INSERT order_items
+2. UPDATE → APPROVED（reviewed_by / reviewed_at / review_comment）
+3. UPDATE → FULFILLED（fulfilled_by / fulfilled_at）+ INSERT delivery_records
+最终状态与静态种子一致（PENDING_REVIEW 订单只有第 1 步）。
+
+每条语句一行，行首注释为业务时间，可直接管道给 mysql 客户端；
+TokenBucket 控制输出速率（语句/秒），用于持续写压测。
+
+边生成边输出：事件先进内存缓冲，超过 spool_events 条即排序后溢写为临时文件中的一段有序 run；
+生成端的日期水位线越过某天（每年订单生成完毕时，水位线为次年1月1日）后，各 run 与缓冲归并，
+水位线之前的事件立即写出，之后的（跨年的审核/履行）留待下次。内存占用与溢写阈值成正比，与总事件数无关。
+"""
+
+import datetime
+import heapq
+import pickle
+import random
+import tempfile
+import time
+
+from .sampling import make_sampler, uniform
+
+MUTATION_CONFIG = {
+    'review_delay_minutes': (5, 240),    # 下单 → 审核
+    'fulfill_delay_hours': (2, 30),      # 审核 → 履行
+    'spool_events': 200000,              # 内存中缓冲的事件数上限，超出即排序溢写到临时文件
+    'sampler': 'legacy',                 # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 29,
+}
+
+REVIEWER_IDS = [11, 12, 13]
+REVIEW_COMMENTS = ['同意', '审核通过', '价格已确认', '信用额度内，通过']
+
+ORDER_INSERT_COLUMNS = ['id', 'org_id', 'order_no', 'customer_id', 'total_amount', 'status', 'order_date',
+                        'created_by', 'created_at', 'updated_at']
+
+# 同一时刻的事件顺序：先插入再审核再履行
+_INSERT, _APPROVE, _FULFILL = 0, 1, 2
+
+
+class TokenBucket:
+    """令牌桶限速：rate 为每秒令牌数（<= 0 表示不限速），capacity 为突发上限"""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity if capacity else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.last = clock()
+
+    def acquire(self, n=1):
+        """先扣令牌，不足时余额记为负数并睡足欠额；不循环重试，避免浮点误差导致反复空等"""
+        if self.rate <= 0:
+            return
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate) - n
+        self.last = now
+        if self.tokens < 0:
+            self.sleep(-self.tokens / self.rate)
+
+
+class MutationStream:
+    """收集订单生命周期事件，按业务时间顺序输出到 out；advance(水位线) 写出水位线之前的各天"""
+
+    def __init__(self, config=MUTATION_CONFIG, out=None, bucket=None):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.draw_reviewer = make_sampler(uniform(REVIEWER_IDS), config['sampler']).draw
+        self.draw_comment = make_sampler(uniform(REVIEW_COMMENTS), config['sampler']).draw
+        self.out = out
+        self.bucket = bucket
+        self.events = []  # [(timestamp, phase, order_id, statements)]，未排序
+        self.runs = []    # 溢写的有序 run：(临时文件, 事件数)
+        self.written = 0
+        self.counts = {'INSERT orders': 0, 'INSERT order_items': 0, 'UPDATE orders': 0, 'INSERT delivery_records': 0}
+
+    def _add(self, ts, phase, order_id, statements):
+        self.events.append((ts.strftime('%Y-%m-%d %H:%M:%S'), phase, order_id, statements))
+        if len(self.events) >= self.config['spool_events']:
+            self._spool()
+
+    def _spool(self):
+        """缓冲排序后写成一段 run"""
+        self.events.sort()
+        f = tempfile.TemporaryFile()
+        for event in self.events:
+            pickle.dump(event, f, pickle.HIGHEST_PROTOCOL)
+        f.seek(0)
+        self.runs.append((f, len(self.events)))
+        self.events = []
+
+    @staticmethod
+    def _read_run(f, count):
+        for _ in range(count):
+            yield pickle.load(f)
+        f.close()
+
+    def add_order(self, order_id, org_id, order_no, customer_id, total_amount_fen, order_date_str, created_by,
+                  created_at, item_rows, item_columns, final_status, delivery_row=None, delivery_columns=None,
+                  extra=(), review_comment=None):
+        """extra：追加到 INSERT orders 的 (列, SQL字面量)；review_comment：审核意见字面量（默认从 REVIEW_COMMENTS 抽取）"""
+        cfg = self.config
+        rng = self.rng
+        created = datetime.datetime.fromisoformat(created_at)
+        extra_columns = ''.join(f", {column}" for column, _ in extra)
+        extra_values = ''.join(f", {value}" for _, value in extra)
+
+        statements = [
+            f"INSERT INTO orders ({', '.join(ORDER_INSERT_COLUMNS)}{extra_columns}) VALUES "
+            f"({order_id}, {org_id}, '{order_no}', {customer_id}, {total_amount_fen}, 'PENDING_REVIEW', "
+            f"'{order_date_str}', {created_by}, '{created_at}', '{created_at}'{extra_values});",
+            f"INSERT INTO order_items ({', '.join(item_columns)}) VALUES {', '.join(item_rows)};",
+        ]
+        self._add(created, _INSERT, order_id, statements)
+        self.counts['INSERT orders'] += 1
+        self.counts['INSERT order_items'] += len(item_rows)
+        if final_status == 'PENDING_REVIEW':
+            return
+
+        reviewed = created + datetime.timedelta(minutes=rng.randint(*cfg['review_delay_minutes']))
+        reviewed_str = reviewed.strftime('%Y-%m-%d %H:%M:%S')
+        reviewer = self.draw_reviewer(rng)
+        comment = f"'{self.draw_comment(rng)}'"
+        if review_comment is not None:
+            comment = review_comment
+        self._add(reviewed, _APPROVE, order_id, [
+            f"UPDATE orders SET status = 'APPROVED', reviewed_by = {reviewer}, "
+            f"reviewed_at = '{reviewed_str}', review_comment = {comment}, "
+            f"updated_at = '{reviewed_str}' WHERE id = {order_id} AND status = 'PENDING_REVIEW';"
+        ])
+        self.counts['UPDATE orders'] += 1
+        if final_status != 'FULFILLED':
+            return
+
+        fulfilled = reviewed + datetime.timedelta(hours=rng.randint(*cfg['fulfill_delay_hours']),
+                                                  minutes=rng.randint(0, 59))
+        fulfilled_str = fulfilled.strftime('%Y-%m-%d %H:%M:%S')
+        statements = [
+            f"UPDATE orders SET status = 'FULFILLED', fulfilled_by = {created_by}, fulfilled_at = '{fulfilled_str}', "
+            f"updated_at = '{fulfilled_str}' WHERE id = {order_id} AND status = 'APPROVED';"
+        ]
+        self.counts['UPDATE orders'] += 1
+        if delivery_row:
+            statements.append(f"INSERT INTO delivery_records ({', '.join(delivery_columns)}) VALUES {delivery_row};")
+            self.counts['INSERT delivery_records'] += 1
+        self._add(fulfilled, _FULFILL, order_id, statements)
+
+    def advance(self, watermark=None):
+        """写出业务日期早于 watermark（datetime.date；None 为全部）的事件，返回累计写出的语句数"""
+        limit = watermark.isoformat() if watermark else None
+        self.events.sort()
+        runs = [self._read_run(f, count) for f, count in self.runs]
+        self.runs = []
+        pending = []
+        out, bucket = self.out, self.bucket
+        for ts_str, phase, order_id, statements in heapq.merge(self.events, *runs):
+            if limit and ts_str[:10] >= limit:
+                pending.append((ts_str, phase, order_id, statements))
+                continue
+            for statement in statements:
+                if bucket:
+                    bucket.acquire()
+                out.write(f"/* {ts_str} */ {statement}\n")
+                self.written += 1
+        self.events = pending
+        out.flush()
+        return self.written
+
+    def close(self):
+        """写出剩余全部事件，返回写出的语句总数"""
+        return self.advance(None)
@@ -0,0 +1,207 @@
+"""
+宽行文本负载：备注、地址、审核意见等 text 列按真实长度分布填充 UTF-8 中文
+
+默认种子里这些列为空或是「地址{id}」这样的占位串，行宽远小于生产环境；生产中长地址和备注
+占了数据页的大头（中文每字 3 字节，几百字的备注在 COMPACT/DYNAMIC 行格式下会溢出到外部页）。
+启用后（--payloads）按列配置：
+- fill：非 NULL 的比例
+- median / sigma：长度（字符数）服从对数正态分布，min / max 截断
+- kind：文本构造方式（address 省市区街道门牌 + 收货说明；note / review / item_note 由短语拼接）
+
+每列预先生成 pool_size 个 SQL 字面量（长度按分布抽样），逐行只做一次下标抽样，不在订单循环里拼字符串。
+非空的交货地址大多就是客户地址（same_address_rate），其余为另一个地址。
+使用独立随机数流，启用与否不影响主流程的 id、金额、日期等数据。
+"""
+
+import datetime
+import itertools
+import math
+import random
+from array import array
+
+from .mutations import MUTATION_CONFIG, REVIEWER_IDS
+from .sampling import make_sampler, uniform
+from .sql import sql_str
+
+CUSTOMER_PAYLOAD_COLUMNS = ['remark']                                  # address 列原有，改为替换取值
+# 审核三列一起填写：已审核订单都有审核人与审核时间，审核意见按 fill 抽样；待审核订单三列均为 NULL
+ORDER_PAYLOAD_COLUMNS = ['delivery_address', 'remark', 'reviewed_by', 'reviewed_at', 'review_comment']
+ORDER_ITEM_PAYLOAD_COLUMNS = ['remark']
+
+PAYLOAD_CONFIG = {
+    'pool_size': 4096,           # 每列预生成的文本数
+    'same_address_rate': 0.85,   # 交货地址与客户地址相同的比例
+    'columns': {
+        'customers.address': {'kind': 'address', 'fill': 1.0, 'median': 30, 'sigma': 0.3, 'min': 12, 'max': 120},
+        'customers.remark': {'kind': 'note', 'fill': 0.4, 'median': 40, 'sigma': 0.8, 'min': 4, 'max': 500},
+        'orders.delivery_address': {'kind': 'address', 'fill': 0.95, 'median': 32, 'sigma': 0.35, 'min': 12, 'max': 150},
+        'orders.remark': {'kind': 'note', 'fill': 0.35, 'median': 24, 'sigma': 0.9, 'min': 4, 'max': 1000},
+        'orders.review_comment': {'kind': 'review', 'fill': 0.6, 'median': 16, 'sigma': 0.7, 'min': 2, 'max': 300},
+        'order_items.remark': {'kind': 'item_note', 'fill': 0.1, 'median': 12, 'sigma': 0.6, 'min': 2, 'max': 200},
+    },
+    'sampler': 'legacy',         # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 35,
+}
+
+REGIONS = [
+    ('广东省', '深圳市', ['南山区', '福田区', '宝安区', '龙岗区', '罗湖区']),
+    ('广东省', '广州市', ['天河区', '白云区', '番禺区', '海珠区', '越秀区']),
+    ('浙江省', '杭州市', ['西湖区', '余杭区', '拱墅区', '萧山区']),
+    ('江苏省', '苏州市', ['姑苏区', '吴中区', '工业园区', '相城区']),
+    ('四川省', '成都市', ['武侯区', '锦江区', '青羊区', '成华区', '双流区']),
+    ('湖北省', '武汉市', ['江汉区', '洪山区', '武昌区', '汉阳区']),
+    ('北京市', '北京市', ['朝阳区', '海淀区', '丰台区', '大兴区']),
+    ('上海市', '上海市', ['浦东新区', '闵行区', '徐汇区', '宝山区']),
+]
+ROAD_NAMES = ['建设', '人民', '解放', '中山', '和平', '新华', '长江', '科技', '滨河', '工业', '农贸', '朝阳', '东风', '学府']
+ROAD_SUFFIXES = ['路', '大道', '街', '南路', '北路', '东路', '西路']
+PLACES = ['农副产品批发市场', '蔬菜批发中心', '冷链物流园', '生鲜超市', '社区菜市场', '商贸城', '食品产业园', '综合市场']
+ADDRESS_NOTES = [
+    '东门进，卸货区在北侧', '早上6点前送达', '到了给仓库打电话', '地下车库限高2.2米', '货梯在B座后门',
+    '周日不收货', '找门口保安登记', '冷库在市场最里面', '请勿放在门口', '需要搬运上二楼',
+]
+NOTE_PHRASES = [
+    '请于早上6点前送达', '冷链运输，全程保持0-4℃', '到货后联系仓库王经理', '发票抬头与上月一致', '老客户，价格按年度协议执行',
+    '如遇缺货可用同规格替代', '节前备货，数量较平时增加', '上次有两箱破损，请加强包装', '卸货需要叉车', '货款月结，账期30天',
+    '门店装修期间改送总仓', '请提前一天电话确认', '需附检验检疫证明', '客户要求分两批送达', '夜间收货，联系值班人员',
+]
+REVIEW_PHRASES = [
+    '同意', '审核通过', '价格已确认', '信用额度内，通过', '数量偏大，已与客户电话确认', '按协议价执行',
+    '账期内有未结款项，限额内放行', '新品首单，价格经区域经理批准', '与上月用量相符',
+]
+ITEM_NOTE_PHRASES = ['真空包装', '单独装箱', '切片加厚', '少盐', '加冰袋', '标签贴中文', '按500克分装', '不要碎块']
+
+
+class PayloadGenerator:
+    def __init__(self, config=PAYLOAD_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        method = config['sampler']
+        self.draw_region = make_sampler(uniform(REGIONS), method).draw
+        self.draw_district = {city: make_sampler(uniform(districts), method).draw for _, city, districts in REGIONS}
+        self.draw_road = make_sampler(uniform(ROAD_NAMES), method).draw
+        self.draw_road_suffix = make_sampler(uniform(ROAD_SUFFIXES), method).draw
+        self.draw_place = make_sampler(uniform(PLACES), method).draw
+        self.draw_reviewer = make_sampler(uniform(REVIEWER_IDS), method).draw
+        self.pools = {}      # 列 → [SQL字面量]
+        self.pool_bytes = {}  # 列 → array('I') 每个字面量的 UTF-8 字节数（不含引号）
+        self.stats = {}      # 列 → [非NULL行数, 总字节数, 最大字节数, 总行数]
+        for column, spec in config['columns'].items():
+            texts = [self._text(spec['kind'], self._length(spec)) for _ in range(config['pool_size'])]
+            self.pools[column] = [sql_str(text) for text in texts]
+            self.pool_bytes[column] = array('I', (len(text.encode('utf-8')) for text in texts))
+            self.stats[column] = [0, 0, 0, 0]
+        self.customer_address = array('I')  # 客户（按 id 顺序）→ 地址池下标
+
+    # ---------- 文本构造 ----------
+
+    def _length(self, spec):
+        length = int(round(spec['median'] * math.exp(self.rng.gauss(0, spec['sigma']))))
+        return min(spec['max'], max(spec['min'], length))
+
+    def _text(self, kind, length):
+        """按片段拼接到不超过 length 个字符（在片段边界截断；首个片段即超长时保留该片段）"""
+        rng = self.rng
+        if kind == 'address':
+            province, city, _ = self.draw_region(rng)
+            pieces = [province, city] if province != city else [city]
+            pieces += [self.draw_district[city](rng),
+                       f"{self.draw_road(rng)}{self.draw_road_suffix(rng)}{rng.randint(1, 999)}号",
+                       self.draw_place(rng), f"{rng.randint(1, 30)}栋", f"{rng.randint(1, 6)}单元",
+                       f"{rng.randint(1, 30)}{rng.randint(1, 20):02d}室"]
+            notes = itertools.cycle(rng.sample(ADDRESS_NOTES, len(ADDRESS_NOTES)))
+            pieces = itertools.chain(pieces, (f"（{note}）" for note in notes))
+            separator = ''
+        else:
+            phrases = {'note': NOTE_PHRASES, 'review': REVIEW_PHRASES, 'item_note': ITEM_NOTE_PHRASES}[kind]
+            # 打乱后循环取用：短文本不重复，超长备注才会整轮重复
+            pieces = itertools.cycle(rng.sample(phrases, len(phrases)))
+            separator = '，'
+        text = ''
+        for piece in pieces:
+            candidate = text + separator + piece if text else piece
+            if len(candidate) > length:
+                return text or piece
+            text = candidate
+
+    # ---------- 逐行取值 ----------
+
+    def _pick(self, column, index=None, source=None):
+        """按 fill 抽样取 column 的值；给定 index 时直接取 source 列（默认同列）池中的该项"""
+        stat = self.stats[column]
+        stat[3] += 1
+        source = source or column
+        if index is None:
+            if self.rng.random() >= self.config['columns'][column]['fill']:
+                return 'NULL'
+            index = self.rng.randrange(len(self.pools[source]))
+        nbytes = self.pool_bytes[source][index]
+        stat[0] += 1
+        stat[1] += nbytes
+        if nbytes > stat[2]:
+            stat[2] = nbytes
+        return self.pools[source][index]
+
+    def customer(self, customer_id):
+        """(address, remark)；客户 id 从 1 起连续"""
+        index = self.rng.randrange(len(self.pools['customers.address']))
+        self.customer_address.append(index)
+        return self._pick('customers.address', index), self._pick('customers.remark')
+
+    def skip_customer(self):
+        """样本外客户：消耗与 customer() 相同的随机数，不取文本、不计入统计"""
+        self.customer_address.append(self.rng.randrange(len(self.pools['customers.address'])))
+        if self.rng.random() < self.config['columns']['customers.remark']['fill']:
+            self.rng.randrange(len(self.pools['customers.remark']))
+
+    def order(self, customer_id, status, created_at):
+        """(delivery_address, remark, reviewed_by, reviewed_at, review_comment) 的 SQL 字面量；
+        审核人、审核时间（下单后 review_delay_minutes，与变更流相同）和审核意见只出现在已审核的订单"""
+        column = 'orders.delivery_address'
+        if self.rng.random() >= self.config['columns'][column]['fill']:
+            self.stats[column][3] += 1
+            delivery_address = 'NULL'
+        elif self.rng.random() < self.config['same_address_rate']:
+            delivery_address = self._pick(column, self.customer_address[customer_id - 1], 'customers.address')
+        else:
+            delivery_address = self._pick(column, self.rng.randrange(len(self.pools[column])))
+        remark = self._pick('orders.remark')
+        if status == 'PENDING_REVIEW':
+            return delivery_address, remark, 'NULL', 'NULL', 'NULL'
+        review_comment = self._pick('orders.review_comment')
+        delay = datetime.timedelta(minutes=self.rng.randint(*MUTATION_CONFIG['review_delay_minutes']))
+        reviewed_at = datetime.datetime.fromisoformat(created_at) + delay
+        return (delivery_address, remark, str(self.draw_reviewer(self.rng)),
+                f"'{reviewed_at.strftime('%Y-%m-%d %H:%M:%S')}'", review_comment)
+
+    def item(self):
+        return (self._pick('order_items.remark'),)
+
+    def report(self):
+        """每列：填充率、平均/最大字节数（UTF-8，不含引号）"""
+        lines = []
+        for column, (filled, total, largest, rows) in self.stats.items():
+            if rows:
+                lines.append(f"{column}：填充率{filled / rows:.0%}，平均{total / filled if filled else 0:.0f}字节，"
+                             f"最长{largest}字节，合计{total / 1024 ** 2:,.2f}MB")
+        return lines
+
+
+def configure_payloads(config, scale=1.0, overrides=()):
+    """--payload-scale 按比例放大各列长度；--payload-column 表.列=填充率:中位长度:最大长度 覆盖单列"""
+    columns = {column: dict(spec) for column, spec in config['columns'].items()}
+    for spec in columns.values():
+        spec['median'] = max(1, int(round(spec['median'] * scale)))
+        spec['max'] = max(spec['min'], int(round(spec['max'] * scale)))
+    for override in overrides:
+        column, _, values = override.partition('=')
+        if column not in columns:
+            raise ValueError(f"未知的负载列：{column}（可选：{', '.join(columns)}）")
+        try:
+            fill, median, largest = values.split(':')
+            spec = columns[column]
+            spec['fill'], spec['median'], spec['max'] = float(fill), int(median), int(largest)
+        except ValueError:
+            raise ValueError(f"负载列格式应为 表.列=填充率:中位长度:最大长度，实际：{override}") from None
+        spec['min'] = min(spec['min'], spec['max'])
+    return dict(config, columns=columns)
@@ -0,0 +1,115 @@
+"""
+在册客户登记表：定长数值列（array 模块），不保存任何字符串
+
+原先每个客户一个 dict（id/category/org_id/rep/since/churn/frequency/amount_factor）外加
+customer_map 里的 (名称, 类别) 元组，千万级客户时是数 GB 的小对象。这里每个字段一列：
+- ids / org_ids / reps（0 表示尚未分配代表）：int32
+- category_codes：int8，下标对应 categories
+- since / churn：date.toordinal()，0 表示无
+- frequency / amount_factor：float64
+合计每个在册客户 38 字节；另有按 id 下标的类别编码（含已流失客户，1 字节/个），
+名称、编码等确定性字符串在写出行时由 id 与类别现算（见 customer_name）。
+"""
+
+import datetime
+import heapq
+import zlib
+from array import array
+
+# 类别 → (名称前缀, 联系人前缀)
+CATEGORY_LABELS = {
+    'WET_MARKET': ('菜市场', '摊主'),
+    'SUPERMARKET': ('商超', '采购经理'),
+}
+DEFAULT_LABELS = ('批发商', '负责人')
+
+
+def customer_name(customer_id, category):
+    return f"{CATEGORY_LABELS.get(category, DEFAULT_LABELS)[0]}-{customer_id:04d}"
+
+
+def customer_contact(customer_id, category):
+    return f"{CATEGORY_LABELS.get(category, DEFAULT_LABELS)[1]}{customer_id}"
+
+
+def sample_customers(ids, fraction, seed):
+    """确定性客户抽样：按 crc32(种子:id) 取最小的 max(1, round(len(ids)×fraction)) 个 id
+
+    按类别分别调用即为分层抽样（每类至少 1 个）；同一种子下小比例样本总是包含在大比例样本中。
+    """
+    ids = list(ids)
+    k = max(1, int(round(len(ids) * fraction)))
+    return set(heapq.nsmallest(k, ids, key=lambda customer_id: zlib.crc32(f"{seed}:{customer_id}".encode())))
+
+
+def _ordinal(date):
+    return date.toordinal() if date else 0
+
+
+def _date(ordinal):
+    return datetime.date.fromordinal(ordinal) if ordinal else None
+
+
+class CustomerRegistry:
+    def __init__(self, categories):
+        self.categories = list(categories)
+        self._codes = {category: code for code, category in enumerate(self.categories)}
+        self.ids = array('i')
+        self.category_codes = array('b')
+        self.org_ids = array('i')
+        self.reps = array('i')
+        self.since = array('i')
+        self.churn = array('i')
+        self.frequency = array('d')
+        self.amount_factor = array('d')
+        self.category_by_id = bytearray(1)  # 下标为 customer_id，0 号不用
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, customer_id, category, org_id, since=None, frequency=1.0, amount_factor=1.0):
+        code = self._codes[category]
+        self.ids.append(customer_id)
+        self.category_codes.append(code)
+        self.org_ids.append(org_id)
+        self.reps.append(0)
+        self.since.append(_ordinal(since))
+        self.churn.append(0)
+        self.frequency.append(frequency)
+        self.amount_factor.append(amount_factor)
+        if customer_id >= len(self.category_by_id):
+            self.category_by_id.extend(bytes(customer_id + 1 - len(self.category_by_id)))
+        self.category_by_id[customer_id] = code
+
+    def category(self, n):
+        """第 n 个在册客户的类别"""
+        return self.categories[self.category_codes[n]]
+
+    def dates(self, n):
+        """第 n 个在册客户的 (获客日期, 流失日期)，无则为 None"""
+        return _date(self.since[n]), _date(self.churn[n])
+
+    def set_churn(self, n, date):
+        self.churn[n] = _ordinal(date)
+
+    def count(self, category):
+        return self.category_codes.count(self._codes[category])
+
+    def name(self, customer_id):
+        """按 id 现算客户名称（含已流失客户）"""
+        return customer_name(customer_id, self.categories[self.category_by_id[customer_id]])
+
+    def drop_churned(self):
+        """移除已设置流失日期的客户，返回移除数"""
+        keep = [n for n, churn in enumerate(self.churn) if not churn]
+        dropped = len(self.ids) - len(keep)
+        if dropped:
+            for field in ('ids', 'category_codes', 'org_ids', 'reps', 'since', 'churn', 'frequency', 'amount_factor'):
+                column = getattr(self, field)
+                setattr(self, field, array(column.typecode, (column[n] for n in keep)))
+        return dropped
+
+    def nbytes(self):
+        columns = (self.ids, self.category_codes, self.org_ids, self.reps, self.since, self.churn,
+                   self.frequency, self.amount_factor)
+        return sum(len(c) * c.itemsize for c in columns) + len(self.category_by_id)
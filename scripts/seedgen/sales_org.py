@@ -0,0 +1,252 @@
+"""
+多层销售组织生成：大区 → 团队（城市）→ 战区（辖区）→ 销售代表
+
+对齐 backend/src/modules/rbac/entities/organization.entity.ts 与 user.entity.ts：
+- organizations: id, name, code, parent_id, level(1总公司/2大区/3城市/4战区), ancestor_path, status, sort_order
+- users: id, org_id, username, real_name, email, phone, job_position, roles, status
+  （大区总监挂大区、经理挂城市、代表挂战区，RBAC 按 ancestor_path 子树过滤）
+另外生成：
+- customer_owner_history：客户归属变更历史（CREATE TABLE IF NOT EXISTS）
+- sales_targets（drizzle/schema.ts）：代表 × 月份目标，实际营收按生成的订单回填
+
+组织与人员 id 从 id_offset 开始，清理时只删除这一段，不影响已有的管理员账号和组织。
+代表产能服从 lognormal 分布，客户按产能加权分配，形成真实的头部代表集中效应。
+"""
+
+import bisect
+import datetime
+import itertools
+import math
+import random
+
+from .sampling import make_sampler, uniform
+from .sql import sql_str
+
+SALES_ORG_CONFIG = {
+    'regions': 6,                # 大区数
+    'teams_per_region': 8,       # 每个大区的团队数（总监的管理幅度）
+    'reps_per_team': 10,         # 每个团队的代表数（经理的管理幅度 span of control）
+    'territories_per_team': 4,   # 每个团队的战区数
+    'rep_skew_sigma': 1.0,       # 代表产能 lognormal σ（越大越集中）
+    'territory_skew_sigma': 0.6, # 战区客户量 lognormal σ
+    'transfer_rate': 0.1,        # 每个客户每年发生一次归属转移的概率
+    'id_offset': 100000,         # organizations / users 的起始 id
+    'sampler': 'legacy',         # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 28,
+}
+
+REGION_NAMES = ['华东', '华南', '华北', '华中', '西南', '西北', '东北']
+SURNAMES = '王李张刘陈杨黄赵吴周徐孙马朱胡郭何高林罗郑梁谢宋唐许韩冯邓曹彭曾肖田董袁潘于蒋蔡余杜叶程苏魏吕丁任沈'
+GIVEN_NAMES = ['伟', '芳', '娜', '敏', '静', '丽', '强', '磊', '军', '洋', '勇', '艳', '杰', '娟', '涛', '明', '超', '秀兰', '霞', '平', '刚', '桂英']
+TRANSFER_REASONS = ['区域调整', '离职交接', '客户要求', '业绩再平衡']
+
+ORGANIZATION_COLUMNS = ['id', 'name', 'code', 'parent_id', 'level', 'ancestor_path', 'status', 'sort_order',
+                        'created_at', 'updated_at']
+USER_COLUMNS = ['id', 'org_id', 'username', 'real_name', 'email', 'phone', 'job_position', 'roles', 'status',
+                'created_at', 'updated_at']
+OWNER_HISTORY_COLUMNS = ['id', 'customer_id', 'sales_rep_id', 'territory_org_id', 'effective_from', 'effective_to',
+                         'transfer_reason', 'created_at']
+SALES_TARGET_COLUMNS = ['sales_rep_id', 'sales_rep_name', 'region_name', 'period', 'revenue_target',
+                        'collection_target', 'new_customer_target', 'revenue_actual', 'collection_actual',
+                        'new_customer_actual', 'created_at', 'updated_at']
+
+OWNER_HISTORY_DDL = """
+CREATE TABLE IF NOT EXISTS customer_owner_history (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  customer_id INT NOT NULL,
+  sales_rep_id INT NOT NULL,
+  territory_org_id INT NOT NULL,
+  effective_from DATE NOT NULL,
+  effective_to DATE DEFAULT NULL,
+  transfer_reason VARCHAR(50) DEFAULT NULL,
+  created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_customer_from (customer_id, effective_from),
+  INDEX idx_rep (sales_rep_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+
+def person_name(n):
+    """由序号确定性地生成中文姓名"""
+    return SURNAMES[n % len(SURNAMES)] + GIVEN_NAMES[(n // len(SURNAMES)) % len(GIVEN_NAMES)]
+
+
+class SalesOrganization:
+    """销售组织 + 客户归属时间线；主流程通过 owner_at() 决定订单的 created_by"""
+
+    def __init__(self, config=SALES_ORG_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.draw_transfer_reason = make_sampler(uniform(TRANSFER_REASONS), config['sampler']).draw
+        self.organizations = []   # dict(id, name, code, parent_id, level, path)
+        self.users = []           # dict(id, org_id, name, position)
+        self.reps = {}            # rep_id → dict(name, territory_id, team_id, region_name, weight)
+        self.territories = []     # dict(id, team_id, weight, rep_ids, rep_cum)
+        self.owners = {}          # customer_id → [(effective_from, rep_id, territory_id, reason)]
+        self.monthly_actual = {}  # (rep_id, 'YYYY-MM') → 实际营收（分）
+        self._build()
+
+    def _build(self):
+        cfg = self.config
+        rng = self.rng
+        ids = itertools.count(cfg['id_offset'])
+
+        def add_org(name, code, parent, level, sort_order):
+            org_id = next(ids)
+            path = (parent['path'] if parent else '/') + f"{org_id}/"
+            org = {'id': org_id, 'name': name, 'code': code, 'parent_id': parent['id'] if parent else None,
+                   'level': level, 'path': path, 'sort_order': sort_order}
+            self.organizations.append(org)
+            return org
+
+        def add_user(org, position):
+            user_id = next(ids)
+            user = {'id': user_id, 'org_id': org['id'], 'name': person_name(user_id), 'position': position}
+            self.users.append(user)
+            return user
+
+        company = add_org('千张销售总公司(压测)', 'PERF-HQ', None, 1, 0)
+        for r in range(cfg['regions']):
+            region_name = REGION_NAMES[r] if r < len(REGION_NAMES) else f"大区{r + 1}"
+            region = add_org(f"{region_name}大区", f"PERF-R{r + 1:02d}", company, 2, r)
+            add_user(region, 'SALES_DIRECTOR')
+            for t in range(cfg['teams_per_region']):
+                team = add_org(f"{region_name}-城市{t + 1:02d}", f"{region['code']}-T{t + 1:02d}", region, 3, t)
+                add_user(team, 'SALES_MANAGER')
+                zones = [
+                    add_org(f"{team['name']}-战区{z + 1}", f"{team['code']}-Z{z + 1}", team, 4, z)
+                    for z in range(cfg['territories_per_team'])
+                ]
+                territories = [
+                    {'id': zone['id'], 'team_id': team['id'], 'region_name': region_name,
+                     'weight': rng.lognormvariate(0, cfg['territory_skew_sigma']), 'rep_ids': [], 'rep_cum': []}
+                    for zone in zones
+                ]
+                for k in range(cfg['reps_per_team']):
+                    territory = territories[k % len(territories)]
+                    zone = zones[k % len(zones)]
+                    rep = add_user(zone, 'SALES_REP')
+                    self.reps[rep['id']] = {
+                        'name': rep['name'], 'territory_id': territory['id'], 'team_id': team['id'],
+                        'region_name': region_name, 'weight': rng.lognormvariate(0, cfg['rep_skew_sigma']),
+                    }
+                    territory['rep_ids'].append(rep['id'])
+                for territory in territories:
+                    if territory['rep_ids']:
+                        territory['rep_cum'] = list(itertools.accumulate(
+                            self.reps[rep_id]['weight'] for rep_id in territory['rep_ids']))
+                        self.territories.append(territory)
+
+        self._territory_cum = list(itertools.accumulate(t['weight'] for t in self.territories))
+
+    def _pick_territory(self):
+        x = self.rng.random() * self._territory_cum[-1]
+        return self.territories[bisect.bisect_right(self._territory_cum, x)]
+
+    def _pick_rep(self, territory, exclude=None):
+        rep_ids = territory['rep_ids']
+        if exclude is not None and len(rep_ids) > 1:
+            while True:
+                rep_id = self._pick_rep(territory)
+                if rep_id != exclude:
+                    return rep_id
+        x = self.rng.random() * territory['rep_cum'][-1]
+        return rep_ids[bisect.bisect_right(territory['rep_cum'], x)]
+
+    def assign_customer(self, customer_id, start_date, end_date):
+        """分配初始归属，并按 transfer_rate 生成年内归属转移"""
+        territory = self._pick_territory()
+        rep_id = self._pick_rep(territory)
+        timeline = [(start_date, rep_id, territory['id'], None)]
+        years = (end_date - start_date).days / 365.0
+        span_days = (end_date - start_date).days
+        # 泊松过程近似：期望转移次数 = transfer_rate × 年数
+        transfers = sorted(
+            start_date + datetime.timedelta(days=self.rng.randint(1, span_days))
+            for _ in range(self._poisson(self.config['transfer_rate'] * years))
+        )
+        for effective_from in transfers:
+            if effective_from <= timeline[-1][0]:
+                continue
+            new_rep_id = self._pick_rep(territory, exclude=rep_id)
+            reason = self.draw_transfer_reason(self.rng)
+            if new_rep_id == rep_id:
+                continue  # 战区只有一个代表时无人可转，不记录
+            rep_id = new_rep_id
+            timeline.append((effective_from, rep_id, territory['id'], reason))
+        self.owners[customer_id] = timeline
+
+    def _poisson(self, lam):
+        limit, k, p = math.exp(-lam), 0, 1.0
+        while True:
+            p *= self.rng.random()
+            if p <= limit:
+                return k
+            k += 1
+
+    def owner_at(self, customer_id, date):
+        """订单日期时的归属代表 id"""
+        rep_id = None
+        for effective_from, owner, _, _ in self.owners[customer_id]:
+            if effective_from > date:
+                break
+            rep_id = owner
+        return rep_id
+
+    def record_order(self, rep_id, month_key, amount_fen):
+        key = (rep_id, month_key)
+        self.monthly_actual[key] = self.monthly_actual.get(key, 0) + amount_fen
+
+    # ---------- SQL 输出 ----------
+
+    def organization_values(self, created_at):
+        return [
+            f"({o['id']}, {sql_str(o['name'])}, '{o['code']}', {o['parent_id'] if o['parent_id'] else 'NULL'}, "
+            f"{o['level']}, '{o['path']}', 'ACTIVE', {o['sort_order']}, '{created_at}', '{created_at}')"
+            for o in self.organizations
+        ]
+
+    def user_values(self, created_at):
+        roles = {'SALES_DIRECTOR': 'ADMIN,SALES', 'SALES_MANAGER': 'OPERATOR,SALES', 'SALES_REP': 'SALES'}
+        return [
+            f"({u['id']}, {u['org_id']}, 'perf_{u['id']}', '{u['name']}', 'perf_{u['id']}@seed.local', "
+            f"'139{u['id'] % 100000000:08d}', '{u['position']}', '{roles[u['position']]}', 'ACTIVE', "
+            f"'{created_at}', '{created_at}')"
+            for u in self.users
+        ]
+
+    def owner_history_values(self, created_at):
+        values = []
+        history_id = 1
+        for customer_id in sorted(self.owners):
+            timeline = self.owners[customer_id]
+            for n, (effective_from, rep_id, territory_id, reason) in enumerate(timeline):
+                if n + 1 < len(timeline):
+                    effective_to = f"'{timeline[n + 1][0] - datetime.timedelta(days=1)}'"
+                else:
+                    effective_to = 'NULL'
+                values.append(
+                    f"({history_id}, {customer_id}, {rep_id}, {territory_id}, '{effective_from}', {effective_to}, "
+                    f"{sql_str(reason) if reason else 'NULL'}, '{created_at}')"
+                )
+                history_id += 1
+        return values
+
+    def owner_history_keys(self):
+        """与 owner_history_values() 逐行对应的 customer_id（分片路由用）"""
+        return [customer_id for customer_id in sorted(self.owners) for _ in self.owners[customer_id]]
+
+    def sales_target_values(self, periods, created_at):
+        """代表 × 月份目标：目标 = 该代表全年实际月均 × (0.9~1.2)，实际按订单回填（元）"""
+        values = []
+        for rep_id, rep in self.reps.items():
+            actuals = [self.monthly_actual.get((rep_id, period), 0) for period in periods]
+            avg = sum(actuals) / len(periods)
+            for period, actual in zip(periods, actuals):
+                target = avg * self.rng.uniform(0.9, 1.2)
+                values.append(
+                    f"({rep_id}, '{rep['name']}', '{rep['region_name']}', '{period}', {target / 100:.2f}, "
+                    f"{target * 0.95 / 100:.2f}, {self.rng.randint(0, 3)}, {actual / 100:.2f}, "
+                    f"{actual * self.rng.uniform(0.85, 1.0) / 100:.2f}, 0, '{created_at}', '{created_at}')"
+                )
+        return values
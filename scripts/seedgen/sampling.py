@@ -0,0 +1,98 @@
+"""
+分类分布抽样：声明式权重表 → 预建抽样器
+
+权重表为 [(取值, 权重)]，两种实现接口相同（draw(rng) / draw_many(rng, k)）：
+- AliasSampler：Walker 别名表（Vose 建表 O(n)），每次抽样一次 rng.random()、一次比较，与类别数无关
+- LegacySampler：与原有写法逐位一致——等权表用 rng.choice，加权表按累积阈值逐个比较
+  （r < 0.80 / r < 0.95 …），默认使用以保持相同种子下的输出不变
+
+  STATUS = [('FULFILLED', 80), ('APPROVED', 15), ('PENDING_REVIEW', 5)]
+  sampler = make_sampler(STATUS, 'alias')
+  status = sampler.draw(random)
+  statuses = sampler.draw_many(random, 30)   # 与连续 30 次 draw 消耗相同的随机数，结果相同
+"""
+
+from bisect import bisect_right
+
+SAMPLER_METHODS = ('legacy', 'alias')
+
+
+def uniform(outcomes):
+    """等权权重表"""
+    return [(outcome, 1) for outcome in outcomes]
+
+
+class AliasSampler:
+    def __init__(self, table):
+        outcomes = [outcome for outcome, _ in table]
+        weights = [weight for _, weight in table]
+        if not outcomes or any(w < 0 for w in weights) or sum(weights) <= 0:
+            raise ValueError("权重表需至少一项且权重非负、总和大于0")
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # 剩余项因浮点误差略偏离 1.0，按 1.0 处理
+        self.outcomes = outcomes
+        self.prob = prob
+        self.alias = [outcomes[a] for a in alias]
+        self.n = n
+
+    def draw(self, rng):
+        u = rng.random() * self.n
+        i = int(u)
+        return self.outcomes[i] if u - i < self.prob[i] else self.alias[i]
+
+    def draw_many(self, rng, k):
+        n, outcomes, prob, alias, random = self.n, self.outcomes, self.prob, self.alias, rng.random
+        result = []
+        for _ in range(k):
+            u = random() * n
+            i = int(u)
+            result.append(outcomes[i] if u - i < prob[i] else alias[i])
+        return result
+
+
+class LegacySampler:
+    def __init__(self, table):
+        self.outcomes = [outcome for outcome, _ in table]
+        weights = [weight for _, weight in table]
+        self.equal = len(set(weights)) == 1
+        # 整数累积和再相除，80/15/5 得到的阈值与字面量 0.80、0.95 完全相同
+        total, running, self.thresholds = sum(weights), 0, []
+        for weight in weights[:-1]:
+            running += weight
+            self.thresholds.append(running / total)
+
+    def draw(self, rng):
+        if self.equal:
+            return rng.choice(self.outcomes)
+        r = rng.random()
+        for threshold, outcome in zip(self.thresholds, self.outcomes):
+            if r < threshold:
+                return outcome
+        return self.outcomes[-1]
+
+    def draw_many(self, rng, k):
+        if self.equal:
+            return [rng.choice(self.outcomes) for _ in range(k)]
+        # bisect_right 找到第一个大于 r 的阈值，与逐个比较 r < threshold 的结果相同
+        outcomes, thresholds, random = self.outcomes, self.thresholds, rng.random
+        return [outcomes[bisect_right(thresholds, random())] for _ in range(k)]
+
+
+def make_sampler(table, method='legacy'):
+    if method == 'alias':
+        return AliasSampler(table)
+    if method == 'legacy':
+        return LegacySampler(table)
+    raise ValueError(f"未知的抽样方法：{method}（可选 {', '.join(SAMPLER_METHODS)}）")
@@ -0,0 +1,143 @@
+"""
+命名场景：可复现的数据集定义，供性能测试按名称引用
+
+  python generate-600m-revenue-seed.py --scenario 600m-baseline --output /data/seed.sql
+  python generate-600m-revenue-seed.py --list-scenarios
+
+各个脚本副本里的 CUSTOMER_CONFIG / PRODUCTS 等常量并不相同，「6亿数据集」本身并不唯一。
+场景把影响数据内容的参数全部写死：随机种子、规模（客户倍率、年数）、分布（抽样方式、客户规模分布、
+需求时间分布）以及启用的阶段（未列出的阶段一律关闭），其余参数取各阶段 CONFIG 的默认值。
+命令行上显式给出的参数仍会覆盖场景值，但会提示「已偏离场景定义」：逐项比较全部参数与
+「解析器默认值 + 场景值」，只有输出方式类参数（OUTPUT_ARGS：--output / --shards / --split-dir / --ingest /
+指标 / 缓存等）不算偏离。
+
+场景定义变化时递增 version，输出文件头与统计报告中记录「场景名@version」。
+"""
+
+# 场景可以设定的阶段开关；场景未列出的开关按关闭处理
+STAGE_FLAGS = ('bom', 'inventory', 'sales_org', 'leads', 'demand_model', 'payloads')
+
+# 只决定输出方式、不改变数据内容的参数，覆盖它们不算偏离场景
+OUTPUT_ARGS = ('output', 'scenario', 'list_scenarios', 'shards', 'shard_function', 'split_dir', 'split_rows',
+               'ingest', 'ingest_workers', 'ingest_queue', 'shadow', 'delta_from', 'mutation_stream',
+               'mutation_rate', 'mutation_burst', 'stats_report', 'expectations', 'expectations_range',
+               'metrics_textfile', 'metrics_port', 'metrics_interval', 'cache', 'cache_dir', 'cache_size',
+               'scenario_baseline')
+
+SCENARIOS = {
+    'smoke': {
+        'version': 3,
+        'description': '冒烟：约 1/20 规模（34家客户、约2000笔订单），启用全部阶段，几秒内完成',
+        'args': {
+            'seed': 42,
+            'customer_scale': 0.05,
+            'years': 1,
+            'sampler': 'alias',
+            'customer_size_dist': None,
+            'bom': True,
+            'inventory': True,
+            'sales_org': True,
+            'leads': True,
+            'demand_model': True,
+        },
+    },
+    '600m-baseline': {
+        'version': 1,
+        'description': '基准：6亿年营收（684家客户、约4万笔订单/年），与不带参数运行的输出一致',
+        'args': {
+            'seed': 42,
+            'customer_scale': 1.0,
+            'years': 1,
+            'sampler': 'legacy',
+            'customer_size_dist': None,
+        },
+    },
+    '6b-peak-season': {
+        'version': 2,
+        'description': '旺季：60亿年营收（客户×10、约40万笔订单），季节/春节/促销需求曲线与日内时段分布',
+        'args': {
+            'seed': 42,
+            'customer_scale': 10.0,
+            'years': 1,
+            'sampler': 'alias',
+            'customer_size_dist': None,
+            'demand_model': True,
+        },
+    },
+    'hot-wholesaler': {
+        'version': 2,
+        'description': '热点客户：6亿年营收，Pareto(alpha=1.0) 客户规模，最大客户营收是中位客户的上千倍，Top 1%约占45%',
+        'args': {
+            'seed': 42,
+            'customer_scale': 1.0,
+            'years': 1,
+            'sampler': 'alias',
+            'customer_size_dist': 'pareto',
+            'customer_size_shape': 1.0,
+        },
+    },
+    'multi-tenant-200': {
+        'version': 3,
+        'description': '多租户：200个组织（3个头部大租户 + 长尾），客户×5（3420家、约20万笔订单）',
+        'args': {
+            'seed': 42,
+            'customer_scale': 5.0,
+            'years': 1,
+            'sampler': 'alias',
+            'customer_size_dist': None,
+            'tenants': 200,
+            'tenant_large': 3,
+        },
+    },
+}
+
+
+def scenario_defaults(name):
+    """场景 → argparse 默认值（未列出的阶段开关补为 False）"""
+    scenario = SCENARIOS[name]
+    defaults = {flag: False for flag in STAGE_FLAGS}
+    defaults.update(scenario['args'])
+    defaults['scenario'] = name
+    return defaults
+
+
+def scenario_baseline(parser_defaults, name):
+    """解析器默认值 + 场景值，去掉输出方式类参数：场景完整定义的数据内容参数"""
+    baseline = dict(parser_defaults, **scenario_defaults(name))
+    return {key: value for key, value in baseline.items() if key not in OUTPUT_ARGS}
+
+
+def deviations(args):
+    """命令行覆盖了哪些影响数据内容的参数，返回 [(参数名, 场景值, 实际值)]；
+    args.scenario_baseline 由 parse_args 按 scenario_baseline() 写入"""
+    if not getattr(args, 'scenario', None):
+        return []
+    expected = args.scenario_baseline
+    return [(key, value, getattr(args, key)) for key, value in expected.items() if getattr(args, key) != value]
+
+
+def scenario_label(args):
+    """「场景名@version」，有偏离时加「（已偏离）」；未使用场景返回 None"""
+    name = getattr(args, 'scenario', None)
+    if not name:
+        return None
+    label = f"{name}@{SCENARIOS[name]['version']}"
+    return label + "（已偏离场景定义）" if deviations(args) else label
+
+
+def describe():
+    lines = []
+    for name, scenario in SCENARIOS.items():
+        lines.append(f"{name}@{scenario['version']}：{scenario['description']}")
+        lines.append("   " + ' '.join(_flag(key, value) for key, value in scenario_defaults(name).items()
+                                      if key != 'scenario' and _flag(key, value)))
+    return lines
+
+
+def _flag(key, value):
+    flag = '--' + key.replace('_', '-')
+    if value is True:
+        return flag
+    if value is False or value is None:
+        return ''
+    return f"{flag} {value}"
@@ -0,0 +1,70 @@
+"""
+重新灌数的清理方式：DELETE（默认）或影子表 + 原子 RENAME 切换
+
+影子表模式：
+1. 每张要重灌的表建 <table>_shadow（CREATE TABLE ... LIKE，带全部索引）；
+   只清理部分行的表（如 users WHERE id >= offset）先把保留的行复制进影子表
+2. 全部 INSERT 写入影子表，灌数期间在线表保持原数据可查询
+3. 最后一条多表 RENAME TABLE 同时把在线表换成 <table>_old、影子表换成在线表，再 DROP 旧表
+整个切换是一次元数据操作，不产生逐行删除的 undo 与长时间锁表。
+
+MySQL 的 CREATE TABLE ... LIKE 不复制外键：影子表建好后按 FOREIGN_KEYS（对齐 Entity 的 @ManyToOne）
+逐条 ADD CONSTRAINT，被引用表也在重灌范围内时指向其影子表（RENAME 时 InnoDB 随表名更新引用）。
+约束名取 <table>_shadow_ibfk_N：RENAME TABLE 会把 <旧表名>_ibfk_N 形式的约束名随表名改写
+（切换后为 <table>_ibfk_N，旧表的变为 <table>_old_ibfk_N），下次重灌时影子表的约束名不会与在线表冲突。
+切换与删除旧表在 FOREIGN_KEY_CHECKS = 0 下执行：*_old 之间、以及未重灌的表仍可能引用它们。
+"""
+
+SHADOW_SUFFIX = '_shadow'
+OLD_SUFFIX = '_old'
+
+# 表 → [(列, 被引用表, 被引用列)]，对齐 order-item.entity.ts / organization.entity.ts 的 @ManyToOne
+FOREIGN_KEYS = {
+    'order_items': [('order_id', 'orders', 'id')],
+    'organizations': [('parent_id', 'organizations', 'id')],
+}
+
+
+class ReseedPlan:
+    def __init__(self, shadow=False):
+        self.shadow = shadow
+        self.tables = {}  # 表 → 删除条件列表（None 表示整表），按登记顺序
+
+    def delete(self, table, where=None):
+        """登记一张需要重灌的表；where 为要清理的行条件，None 表示整表"""
+        self.tables.setdefault(table, []).append(where)
+
+    def target(self, table):
+        """INSERT 的目标表名"""
+        if self.shadow and table in self.tables:
+            return table + SHADOW_SUFFIX
+        return table
+
+    def cleanup_statements(self):
+        if not self.shadow:
+            return [f"DELETE FROM {table} WHERE {where};" if where else f"DELETE FROM {table};"
+                    for table, wheres in self.tables.items() for where in wheres]
+        statements = []
+        for table, wheres in self.tables.items():
+            shadow = table + SHADOW_SUFFIX
+            statements.append(f"DROP TABLE IF EXISTS {shadow}, {table}{OLD_SUFFIX};")
+            statements.append(f"CREATE TABLE {shadow} LIKE {table};")
+            if None not in wheres:
+                keep = ' AND '.join(f"NOT ({where})" for where in wheres)
+                statements.append(f"INSERT INTO {shadow} SELECT * FROM {table} WHERE {keep};")
+        # 全部影子表建好后再加外键（被引用的影子表需已存在）
+        for table in self.tables:
+            shadow = table + SHADOW_SUFFIX
+            for n, (column, ref_table, ref_column) in enumerate(FOREIGN_KEYS.get(table, ()), 1):
+                statements.append(f"ALTER TABLE {shadow} ADD CONSTRAINT {shadow}_ibfk_{n} "
+                                  f"FOREIGN KEY ({column}) REFERENCES {self.target(ref_table)} ({ref_column});")
+        return statements
+
+    def swap_statements(self):
+        if not self.shadow or not self.tables:
+            return []
+        renames = ', '.join(f"{table} TO {table}{OLD_SUFFIX}, {table}{SHADOW_SUFFIX} TO {table}"
+                            for table in self.tables)
+        olds = ', '.join(f"{table}{OLD_SUFFIX}" for table in self.tables)
+        return ["SET FOREIGN_KEY_CHECKS = 0;", f"RENAME TABLE {renames};", f"DROP TABLE IF EXISTS {olds};",
+                "SET FOREIGN_KEY_CHECKS = 1;"]
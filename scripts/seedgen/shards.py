@@ -0,0 +1,119 @@
+"""
+按客户哈希分片输出（水平拆分实验）
+
+客户拥有的行（customers / orders / order_items / production_plans / delivery_records /
+customer_owner_history）按 customer_id 经分片函数路由到 N 个 SQL 文件之一；
+其余语句（清理、DDL、物料/库存/组织/线索等参考数据、验证查询）原样复制到每个分片。
+运行结束写出分片映射：<output>-shard-map.json（分片函数、各分片文件与行数）和
+<output>-shard-map.csv（customer_id → shard）。
+
+分片函数：
+- mod：customer_id % N
+- crc32：zlib.crc32(str(customer_id)) % N（与 MySQL CRC32(customer_id) % N 一致）
+- package.module:function：自定义函数 f(customer_id, shard_count) → 分片序号
+"""
+
+import csv
+import importlib
+import json
+import os
+import zlib
+
+from .sql import SqlOutput, append_inserts
+
+SHARD_FUNCTIONS = {
+    'mod': lambda key, count: key % count,
+    'crc32': lambda key, count: zlib.crc32(str(key).encode()) % count,
+}
+
+
+def load_shard_function(name):
+    if name in SHARD_FUNCTIONS:
+        return SHARD_FUNCTIONS[name]
+    module_name, sep, attr = name.partition(':')
+    if not sep:
+        raise ValueError(f"未知的分片函数：{name}（可选 {', '.join(SHARD_FUNCTIONS)} 或 package.module:function）")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def shard_paths(output_file, count):
+    base, ext = os.path.splitext(output_file)
+    return [f"{base}.shard{n:02d}{ext or '.sql'}" for n in range(count)]
+
+
+def expand_keys(spans, field):
+    """spans 为 [(key, 各表累计行数...)]，按 field 位置展开成逐行的 key 列表"""
+    keys, start = [], 0
+    for span in spans:
+        end = span[field]
+        keys.extend([span[0]] * (end - start))
+        start = end
+    return keys
+
+
+class ShardedOutput:
+    """与 SqlOutput 接口相同；append() 复制到所有分片，append_routed() 按 key 路由"""
+
+    def __init__(self, paths, function_name):
+        self.paths = paths
+        self.function_name = function_name
+        self.shard_function = load_shard_function(function_name)
+        self.shards = [SqlOutput(open(path, 'w', encoding='utf-8')) for path in paths]
+        self.routed_rows = [{} for _ in paths]   # 分片 → {表: 行数}
+        self.replicated_tables = set()
+        self.key_shards = {}                     # customer_id → 分片
+
+    def append(self, line):
+        for shard in self.shards:
+            shard.append(line)
+
+    def shard_of(self, key):
+        shard = self.key_shards.get(key)
+        if shard is None:
+            shard = self.shard_function(key, len(self.shards))
+            self.key_shards[key] = shard
+        return shard
+
+    def append_replicated(self, table, columns, values, batch_size):
+        self.replicated_tables.add(table)
+        for shard in self.shards:
+            append_inserts(shard, table, columns, values, batch_size)
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        buckets = [[] for _ in self.shards]
+        for key, value in zip(keys, values):
+            buckets[self.shard_of(key)].append(value)
+        for n, (shard, rows) in enumerate(zip(self.shards, buckets)):
+            counts = self.routed_rows[n]
+            counts[table] = counts.get(table, 0) + len(rows)
+            append_inserts(shard, table, columns, rows, batch_size)
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()
+
+    def write_map(self, output_file):
+        """写出分片映射，返回 (json路径, csv路径)"""
+        base = os.path.splitext(output_file)[0]
+        json_path, csv_path = base + '-shard-map.json', base + '-shard-map.csv'
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['customer_id', 'shard'])
+            writer.writerows(sorted(self.key_shards.items()))
+        customers = [0] * len(self.shards)
+        for shard in self.key_shards.values():
+            customers[shard] += 1
+        shard_map = {
+            'shard_key': 'customer_id',
+            'shard_function': self.function_name,
+            'shard_count': len(self.shards),
+            'customer_map': os.path.basename(csv_path),
+            'replicated_tables': sorted(self.replicated_tables),
+            'shards': [
+                {'shard': n, 'path': path, 'customers': customers[n], 'rows': counts}
+                for n, (path, counts) in enumerate(zip(self.paths, self.routed_rows))
+            ],
+        }
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(shard_map, f, ensure_ascii=False, indent=2)
+        return json_path, csv_path
@@ -0,0 +1,108 @@
+"""
+按表 / 按块拆分输出 + 依赖感知的加载清单（manifest.json）
+
+目录结构：
+- 000-prelude.sql：DDL 与清理语句（串行、最先执行）
+- NNN-<table>-CCCC.sql：每块最多 chunk_rows 行，文件头关闭外键/唯一性检查，可独立并发导入
+- 999-epilogue.sql：验证查询等收尾语句（全部数据块完成后执行）
+- manifest.json：每个文件的表名、行数、字节数，以及表级依赖（依赖表的全部数据块完成后才能开始）
+
+由 seedgen.loader 按清单用 N 个并发客户端会话导入。
+"""
+
+import json
+import os
+
+from .shadow import SHADOW_SUFFIX
+from .sql import SqlOutput, append_inserts
+
+# 表 → 必须先导入完成的表（逻辑上的父表，导入时外键检查已关闭，只用于保证顺序语义）
+# 按逻辑表名登记；影子表模式下的 <table>_shadow 按去掉后缀的表名查找依赖
+TABLE_DEPENDENCIES = {
+    'orders': ['customers'],
+    'order_items': ['orders'],
+    'delivery_records': ['orders'],
+    'customer_owner_history': ['customers', 'users'],
+    'users': ['organizations'],
+    'sales_targets': ['users'],
+    'bom_items': ['materials'],
+    'inventory_log': ['inventory'],
+    'inventory_daily_balance': ['inventory'],
+    'lead_status_history': ['leads'],
+    'lead_activities': ['leads'],
+}
+
+def logical_table(table):
+    """影子表名 → 在线表名（其他表名原样返回）"""
+    return table[:-len(SHADOW_SUFFIX)] if table.endswith(SHADOW_SUFFIX) else table
+
+
+CHUNK_HEADER = [
+    "SET NAMES utf8mb4;",
+    "SET FOREIGN_KEY_CHECKS = 0;",
+    "SET UNIQUE_CHECKS = 0;",
+    "",
+]
+
+
+class SplitOutput:
+    """与 SqlOutput 接口相同：普通语句写入 prelude（数据开始前）或 epilogue（数据开始后），INSERT 按表分块成文件"""
+
+    def __init__(self, directory, chunk_rows=100000):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.prelude = SqlOutput(open(os.path.join(directory, '000-prelude.sql'), 'w', encoding='utf-8'))
+        self.epilogue = SqlOutput(open(os.path.join(directory, '999-epilogue.sql'), 'w', encoding='utf-8'))
+        self.current = self.prelude
+        self.table_order = {}  # 表 → 首次出现的序号（文件名前缀）
+        self.chunks = {}       # 表 → 已写出的块数
+        self.files = []        # manifest 条目
+
+    def append(self, line):
+        self.current.append(line)
+
+    def append_replicated(self, table, columns, values, batch_size):
+        self.current = self.epilogue
+        if not values:
+            return
+        seq = self.table_order.setdefault(table, len(self.table_order) + 1)
+        for start in range(0, len(values), self.chunk_rows):
+            rows = values[start:start + self.chunk_rows]
+            chunk = self.chunks.get(table, 0) + 1
+            self.chunks[table] = chunk
+            name = f"{seq:03d}-{table}-{chunk:04d}.sql"
+            path = os.path.join(self.directory, name)
+            out = SqlOutput(open(path, 'w', encoding='utf-8'))
+            for line in CHUNK_HEADER:
+                out.append(line)
+            append_inserts(out, table, columns, rows, batch_size)
+            out.close()
+            self.files.append({'path': name, 'table': table, 'rows': len(rows), 'bytes': os.path.getsize(path)})
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        self.append_replicated(table, columns, values, batch_size)
+
+    def close(self):
+        self.prelude.close()
+        self.epilogue.close()
+
+    def write_manifest(self):
+        tables = list(self.table_order)
+        physical = {logical_table(table): table for table in tables}
+        manifest = {
+            'prelude': '000-prelude.sql',
+            'epilogue': '999-epilogue.sql',
+            'tables': [
+                {'table': table,
+                 'depends_on': [physical[dep] for dep in TABLE_DEPENDENCIES.get(logical_table(table), [])
+                                if dep in physical],
+                 'rows': sum(f['rows'] for f in self.files if f['table'] == table)}
+                for table in tables
+            ],
+            'files': self.files,
+        }
+        path = os.path.join(self.directory, 'manifest.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return path
@@ -0,0 +1,66 @@
+"""
+SQL 输出辅助函数
+"""
+
+import re
+
+# 行元组字面量中的单个值：字符串（含反斜杠转义）、NULL、数字
+ROW_TOKEN = re.compile(r"'(?:[^'\\]|\\.)*'|NULL|-?\d+(?:\.\d+)?")
+
+
+def sql_str(value):
+    """转义为 MySQL 字符串字面量"""
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def split_row(text):
+    """把 "(1, 'a', NULL)" 拆成值字面量列表 ['1', "'a'", 'NULL']"""
+    return ROW_TOKEN.findall(text)
+
+
+def append_inserts(output, table, columns, values, batch_size=1000, keys=None):
+    """把 values（已格式化的元组字符串）按批追加为多行 INSERT 语句
+
+    output 实现了 append_routed / append_replicated（分片、拆分、直接入库、差异比对等输出端）时交给输出端处理：
+    带 keys（与 values 等长的 customer_id）的行走 append_routed，其余走 append_replicated。
+    """
+    if hasattr(output, 'append_routed'):
+        if keys is None:
+            output.append_replicated(table, columns, values, batch_size)
+        else:
+            output.append_routed(table, columns, values, batch_size, keys)
+        return
+    header = f"INSERT INTO {table} ({', '.join(columns)}) VALUES"
+    for i in range(0, len(values), batch_size):
+        batch = values[i:i+batch_size]
+        output.append(header)
+        output.append(",\n".join(batch) + ";")
+        output.append("")
+
+
+class SqlOutput:
+    """行缓冲的 SQL 输出，接口与 list.append 相同；缓冲满后写入文件，行间以换行连接（文件末尾不补换行）"""
+
+    def __init__(self, f, buffer_lines=256):
+        self.f = f
+        self.buffer_lines = buffer_lines
+        self.lines = []
+        self.started = False
+
+    def append(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self):
+        if not self.lines:
+            return
+        if self.started:
+            self.f.write("\n")
+        self.f.write("\n".join(self.lines))
+        self.started = True
+        self.lines = []
+
+    def close(self):
+        self.flush()
+        self.f.close()
@@ -0,0 +1,127 @@
+"""
+生成过程中的单遍统计报告（JSON），不必导入数据库再跑验证查询
+
+订单循环每生成一笔订单调用一次 DistributionReport.add_order()，内存只与类别/月份/代表数和
+分位数草图的桶数有关，与订单量无关：
+- 按客户类别、月份、代表（created_by）的订单数与金额合计
+- 订单金额的 P50/P95/P99：对数分桶草图（相对误差 ≤ relative_accuracy，同 DDSketch），
+  金额跨度从 500 元到数十万元也只有几百个桶
+- 每单商品数的分布与分位数（取值很少，精确计数）
+- 订单状态占比、质检结果占比
+"""
+
+import json
+import math
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """正数的对数分桶分位数草图：桶 i 覆盖 (gamma^(i-1), gamma^i]，返回值的相对误差不超过 relative_accuracy"""
+
+    def __init__(self, relative_accuracy=0.005):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # 桶的中点（几何意义上），再夹到观测到的最小/最大值之间
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        result = {'count': self.count, 'sum': self.total, 'min': self.min, 'max': self.max,
+                  'mean': round(self.total / self.count, 2) if self.count else None}
+        for q in QUANTILES:
+            value = self.quantile(q)
+            result[f"p{round(q * 100)}"] = round(value, 2) if value is not None else None
+        return result
+
+
+def _mix(counts):
+    total = sum(counts.values())
+    return {key: {'count': n, 'share': round(n / total, 6) if total else 0} for key, n in sorted(counts.items())}
+
+
+def _group(groups):
+    return {str(key): {'orders': n, 'amount_fen': amount} for key, (n, amount) in sorted(groups.items())}
+
+
+class DistributionReport:
+    def __init__(self, relative_accuracy=0.005):
+        self.amount = QuantileSketch(relative_accuracy)
+        self.items = {}
+        self.by_category = {}
+        self.by_month = {}
+        self.by_rep = {}
+        self.status = {}
+        self.quality = {}
+        self.customers = {}
+
+    def add_customer(self, category):
+        self.customers[category] = self.customers.get(category, 0) + 1
+
+    def add_order(self, category, month_key, rep_id, amount_fen, item_count, status):
+        self.amount.add(amount_fen)
+        self.items[item_count] = self.items.get(item_count, 0) + 1
+        for groups, key in ((self.by_category, category), (self.by_month, month_key), (self.by_rep, rep_id)):
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [1, amount_fen]
+            else:
+                group[0] += 1
+                group[1] += amount_fen
+        self.status[status] = self.status.get(status, 0) + 1
+
+    def add_quality_result(self, result):
+        self.quality[result] = self.quality.get(result, 0) + 1
+
+    def items_summary(self):
+        total = sum(self.items.values())
+        result = {'distribution': _mix(self.items)}
+        for q in QUANTILES:
+            rank, seen = q * (total - 1), 0
+            for value in sorted(self.items):
+                seen += self.items[value]
+                if seen > rank:
+                    result[f"p{round(q * 100)}"] = value
+                    break
+        return result
+
+    def to_dict(self, meta=None):
+        return {
+            'meta': meta or {},
+            'customers': self.customers,
+            'order_amount_fen': self.amount.summary(),
+            'order_amount_relative_accuracy': round((self.amount.gamma - 1) / (self.amount.gamma + 1), 6),
+            'items_per_order': self.items_summary(),
+            'status_mix': _mix(self.status),
+            'quality_result_mix': _mix(self.quality),
+            'by_category': _group(self.by_category),
+            'by_month': _group(self.by_month),
+            'by_rep': _group(self.by_rep),
+        }
+
+    def write(self, path, meta=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(meta), f, ensure_ascii=False, indent=2)
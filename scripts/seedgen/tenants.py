@@ -0,0 +1,91 @@
+"""
+多租户生成：N 个组织（org_id）分摊客户，少数大租户 + 长尾小租户
+
+- 第 1 个租户沿用主流程的 ORG_ID（已有的组织与账号，不生成组织行），销售代表沿用 SALES_REPS
+- 其余租户的 org_id 从 id_offset 开始，生成 organizations 一级节点（总公司）和各自的销售代表 users
+- 每个客户独立按租户权重抽样归属，客户 id / 订单 id 在各租户之间自然交错，
+  用于检验 (org_id, ...) 复合索引与按租户缓存在数百个租户下的选择性
+"""
+
+import bisect
+import itertools
+import random
+
+from .sales_org import person_name
+from .sampling import make_sampler, uniform
+
+TENANT_CONFIG = {
+    'tenants': 1,
+    'large_tenants': 3,          # 头部大租户数（含 ORG_ID）
+    'large_share': 0.5,          # 头部大租户合计的客户占比
+    'tail_alpha': 1.2,           # 长尾租户规模 Pareto alpha
+    'customers_per_rep': 100,    # 每个销售代表负责的客户数（决定各租户代表人数）
+    'id_offset': 200000,         # 新租户 organizations / users 的起始 id
+    'sampler': 'legacy',         # 分类抽样方式（seedgen.sampling），随 --sampler
+    'seed': 34,
+}
+
+
+class TenantModel:
+    def __init__(self, primary_org_id, primary_reps, total_customers, config=TENANT_CONFIG):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.primary_org_id = primary_org_id
+        self.tenants = []  # dict(org_id, name, code, weight, rep_ids)
+        self.users = []    # dict(id, org_id, name)
+        self._build(primary_reps, total_customers)
+
+    def _build(self, primary_reps, total_customers):
+        cfg = self.config
+        rng = self.rng
+        count = cfg['tenants']
+        large = min(count, cfg['large_tenants'])
+        # 头部租户按 1 : 1/2 : 1/3 ... 分 large_share，长尾按 Pareto 分其余份额
+        head = [1.0 / (k + 1) for k in range(large)]
+        tail = sorted((rng.paretovariate(cfg['tail_alpha']) for _ in range(count - large)), reverse=True)
+        head_share = cfg['large_share'] if tail else 1.0
+        weights = [w / sum(head) * head_share for w in head]
+        if tail:
+            weights += [w / sum(tail) * (1 - head_share) for w in tail]
+
+        ids = itertools.count(cfg['id_offset'])
+        for n, weight in enumerate(weights):
+            if n == 0:
+                tenant = {'org_id': self.primary_org_id, 'name': None, 'code': None, 'weight': weight,
+                          'rep_ids': [r['id'] for r in primary_reps]}
+            else:
+                org_id = next(ids)
+                tenant = {'org_id': org_id, 'name': f"租户-{n + 1:04d}(压测)", 'code': f"PERF-TENANT-{n + 1:04d}",
+                          'weight': weight, 'rep_ids': []}
+                reps = max(1, int(round(total_customers * weight / cfg['customers_per_rep'])))
+                for _ in range(reps):
+                    user_id = next(ids)
+                    self.users.append({'id': user_id, 'org_id': org_id, 'name': person_name(user_id)})
+                    tenant['rep_ids'].append(user_id)
+            self.tenants.append(tenant)
+        self._cum = list(itertools.accumulate(t['weight'] for t in self.tenants))
+        self._draw_rep = {t['org_id']: make_sampler(uniform(t['rep_ids']), cfg['sampler']).draw for t in self.tenants}
+
+    def pick(self):
+        """按租户权重抽样，返回 org_id"""
+        x = self.rng.random() * self._cum[-1]
+        return self.tenants[min(bisect.bisect_right(self._cum, x), len(self.tenants) - 1)]['org_id']
+
+    def pick_rep(self, org_id):
+        return self._draw_rep[org_id](self.rng)
+
+    # ---------- SQL 输出（列与 seedgen.sales_org 的 ORGANIZATION_COLUMNS / USER_COLUMNS 一致） ----------
+
+    def organization_values(self, created_at):
+        return [
+            f"({t['org_id']}, '{t['name']}', '{t['code']}', NULL, 1, '/{t['org_id']}/', 'ACTIVE', {n}, "
+            f"'{created_at}', '{created_at}')"
+            for n, t in enumerate(self.tenants) if t['name']
+        ]
+
+    def user_values(self, created_at):
+        return [
+            f"({u['id']}, {u['org_id']}, 'perf_{u['id']}', '{u['name']}', 'perf_{u['id']}@seed.local', "
+            f"'139{u['id'] % 100000000:08d}', 'SALES_REP', 'SALES', 'ACTIVE', '{created_at}', '{created_at}')"
+            for u in self.users
+        ]
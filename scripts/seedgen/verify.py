@@ -0,0 +1,272 @@
+"""
+导入后的快速校验：生成时写出期望文件，导入后按主键区间在数据库端算校验和比对
+
+生成端（--expectations PATH）：ExpectationRecorder 包在输出端外面，每张表按主键分区间
+（key // range_size）累计：
+- 行数
+- 顺序无关摘要：SUM(CRC32(CONCAT_WS('|', 列...)))，NULL 按 CONCAT_WS 的规则跳过
+  各列按 COLUMN_TYPES 中的声明类型先规范化再参与摘要（数据库的文本化方式与生成端写出的字面量不同：
+  DATETIME(6) 带 .000000 后缀，DECIMAL(15,2) 把 12 存成 12.00）：
+  DATETIME / DATE 用 DATE_FORMAT 统一格式，DECIMAL(p,s) 乘 10^s 后取整（CAST ... AS SIGNED INTEGER）
+- 关键聚合：AGGREGATE_COLUMNS 中各列的 SUM
+
+校验端：
+  python -m seedgen.verify seed-expectations.json --db pymysql:host=127.0.0.1,user=root,password=xxx,database=qianzhang_sales
+  python -m seedgen.verify seed-expectations.json --db sqlite3:/tmp/seed.db
+每个区间一条 SELECT COUNT(*), SUM(CRC32(...)) ... WHERE key BETWEEN lo AND hi（走主键范围扫描），
+只有两列结果回到客户端；不一致时给出具体的表和主键区间。
+sqlite3 没有 CRC32/CONCAT_WS/DATE_FORMAT，连接后注册同义函数。
+"""
+
+import argparse
+import datetime
+import json
+import sys
+import zlib
+from decimal import ROUND_HALF_UP, Decimal
+
+from .ingest import parse_driver_spec, parse_row
+from .sql import append_inserts
+
+# 表 → 参与求和校验的整数列
+AGGREGATE_COLUMNS = {
+    'orders': ['total_amount'],
+    'order_items': ['quantity', 'subtotal'],
+    'production_plans': ['planned_quantity', 'actual_quantity'],
+    'inventory_log': ['quantity'],
+}
+
+# 表 → 列的声明类型（DDL / drizzle schema / backend entity）：'datetime'、'date'、'decimal:<小数位数>'；
+# 未列出的列为整数或字符串，按原样参与摘要。COMMON_COLUMN_TYPES 适用于所有表
+COMMON_COLUMN_TYPES = {'created_at': 'datetime', 'updated_at': 'datetime'}
+COLUMN_TYPES = {
+    'orders': {'order_date': 'date', 'reviewed_at': 'datetime', 'fulfilled_at': 'datetime'},
+    'production_plans': {'production_date': 'date', 'expiry_date': 'date'},
+    'delivery_records': {'departure_time': 'datetime', 'arrival_time': 'datetime', 'temperature': 'decimal:1'},
+    'inventory_daily_balance': {'balance_date': 'date'},
+    'materials': {'stock_qty': 'decimal:3', 'safety_stock': 'decimal:3', 'unit_cost': 'decimal:4'},
+    'bom_items': {'qty_per_unit': 'decimal:4', 'waste_rate': 'decimal:4'},
+    'customer_owner_history': {'effective_from': 'date', 'effective_to': 'date'},
+    'sales_targets': {'revenue_target': 'decimal:2', 'collection_target': 'decimal:2',
+                      'revenue_actual': 'decimal:2', 'collection_actual': 'decimal:2'},
+    'lead_status_history': {'changed_at': 'datetime'},
+    'lead_activities': {'activity_at': 'datetime'},
+}
+
+# 影子表模式下 INSERT 写入 <table>_shadow，切换后即为 <table>
+SHADOW_SUFFIX = '_shadow'
+
+
+def column_types(table, columns):
+    """{列: 声明类型}，只含需要规范化的列"""
+    declared = dict(COMMON_COLUMN_TYPES, **COLUMN_TYPES.get(table, {}))
+    return {c: declared[c] for c in columns if c in declared}
+
+
+def normalize(value, kind):
+    """生成端的取值按声明类型规范化，结果与 column_sql(列, kind) 在数据库端的取值相同"""
+    if value is None or kind is None:
+        return value
+    if kind == 'datetime':
+        return str(value)[:19]
+    if kind == 'date':
+        return str(value)[:10]
+    scale = int(kind.partition(':')[2])
+    return int(Decimal(str(value)).scaleb(scale).to_integral_value(ROUND_HALF_UP))
+
+
+def column_sql(column, kind):
+    """校验端的列表达式：与 normalize 对应"""
+    if kind == 'datetime':
+        return f"DATE_FORMAT({column}, '%Y-%m-%d %H:%i:%s')"
+    if kind == 'date':
+        return f"DATE_FORMAT({column}, '%Y-%m-%d')"
+    if kind:
+        return f"CAST(ROUND({column} * {10 ** int(kind.partition(':')[2])}) AS SIGNED INTEGER)"
+    return column
+
+
+def row_digest(values, kinds=None):
+    """与 CRC32(CONCAT_WS('|', column_sql(列, 类型)...)) 相同；kinds 为各列的声明类型（None 表示原样）"""
+    if kinds is not None:
+        values = [normalize(v, k) for v, k in zip(values, kinds)]
+    return zlib.crc32('|'.join(str(v) for v in values if v is not None).encode('utf-8'))
+
+
+class _TableExpectation:
+    def __init__(self, table, columns, range_size):
+        self.columns = list(columns)
+        self.key = 'id' if 'id' in columns else columns[0]
+        self.key_index = self.columns.index(self.key)
+        self.range_size = range_size
+        self.types = column_types(table, self.columns)   # 按声明类型规范化的列，不看取值
+        self.normalized = [(self.columns.index(c), kind) for c, kind in self.types.items()]
+        self.ranges = {}         # 区间序号 → [行数, 摘要和]
+        self.sums = {c: 0 for c in AGGREGATE_COLUMNS.get(table, []) if c in self.columns}
+        self.rows = 0
+        self.min_key = self.max_key = None
+
+    def add(self, values):
+        parsed = [parse_row(v) for v in values]
+        normalized, key_index, size = self.normalized, self.key_index, self.range_size
+        sum_indexes = [(c, self.columns.index(c)) for c in self.sums]
+        for row in parsed:
+            key = row[key_index]
+            bucket = self.ranges.get(key // size)
+            if bucket is None:
+                bucket = self.ranges[key // size] = [0, 0]
+            bucket[0] += 1
+            if normalized:
+                hashed = list(row)
+                for i, kind in normalized:
+                    hashed[i] = normalize(hashed[i], kind)
+            else:
+                hashed = row
+            bucket[1] += row_digest(hashed)
+            for column, i in sum_indexes:
+                self.sums[column] += row[i] or 0
+            if self.min_key is None or key < self.min_key:
+                self.min_key = key
+            if self.max_key is None or key > self.max_key:
+                self.max_key = key
+        self.rows += len(parsed)
+
+    def to_dict(self):
+        size = self.range_size
+        return {
+            'key': self.key,
+            'hash_columns': self.columns,
+            'column_types': self.types,
+            'rows': self.rows,
+            'min_key': self.min_key,
+            'max_key': self.max_key,
+            'aggregates': self.sums,
+            'ranges': [[n * size, (n + 1) * size - 1, count, digest]
+                       for n, (count, digest) in sorted(self.ranges.items())],
+        }
+
+
+class ExpectationRecorder:
+    """包装输出端：转交 INSERT 的同时按表、按主键区间累计期望值"""
+
+    def __init__(self, output, range_size=10000):
+        self.output = output
+        self.range_size = range_size
+        self.tables = {}
+
+    def __getattr__(self, name):
+        return getattr(self.output, name)
+
+    def append(self, line):
+        self.output.append(line)
+
+    def _record(self, table, columns, values):
+        if not values:
+            return
+        table = table[:-len(SHADOW_SUFFIX)] if table.endswith(SHADOW_SUFFIX) else table
+        expectation = self.tables.get(table)
+        if expectation is None:
+            expectation = self.tables[table] = _TableExpectation(table, columns, self.range_size)
+        expectation.add(values)
+
+    def append_replicated(self, table, columns, values, batch_size):
+        self._record(table, columns, values)
+        append_inserts(self.output, table, columns, values, batch_size)
+
+    def append_routed(self, table, columns, values, batch_size, keys):
+        self._record(table, columns, values)
+        append_inserts(self.output, table, columns, values, batch_size, keys)
+
+    def close(self):
+        self.output.close()
+
+    def write(self, path, meta=None):
+        data = {
+            'meta': meta or {},
+            'range_size': self.range_size,
+            'digest': "SUM(CRC32(CONCAT_WS('|', hash_columns 按 column_types 规范化...)))",
+            'tables': {table: e.to_dict() for table, e in self.tables.items()},
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+
+
+# ---------- 校验端 ----------
+
+def _sqlite_functions(conn):
+    conn.create_function('CRC32', 1, lambda text: None if text is None else zlib.crc32(str(text).encode('utf-8')),
+                         deterministic=True)
+    conn.create_function('CONCAT_WS', -1, lambda sep, *values: sep.join(str(v) for v in values if v is not None),
+                         deterministic=True)
+    conn.create_function('DATE_FORMAT', 2, _date_format, deterministic=True)
+
+
+def _date_format(value, fmt):
+    """MySQL DATE_FORMAT 的子集（%Y %m %d %H %i %s），sqlite 中日期时间以文本存储"""
+    if value is None:
+        return None
+    return datetime.datetime.fromisoformat(str(value)).strftime(fmt.replace('%i', '%M').replace('%s', '%S'))
+
+
+def _scalar_row(cursor, sql):
+    cursor.execute(sql)
+    return [int(v) if v is not None else 0 for v in cursor.fetchone()]
+
+
+def verify(expectations, conn, log=print):
+    """逐表逐区间比对，返回不一致项列表 [(表, 说明)]"""
+    failures = []
+    cursor = conn.cursor()
+    for table, spec in expectations['tables'].items():
+        key = spec['key']
+        types = spec.get('column_types', {})
+        digest_sql = f"SUM(CRC32(CONCAT_WS('|', {', '.join(column_sql(c, types.get(c)) for c in spec['hash_columns'])})))"
+        table_failures = 0
+        for lo, hi, expected_count, expected_digest in spec['ranges']:
+            count, digest = _scalar_row(cursor, f"SELECT COUNT(*), {digest_sql} FROM {table} WHERE {key} BETWEEN {lo} AND {hi}")
+            if count != expected_count or digest != expected_digest:
+                table_failures += 1
+                detail = f"{key} {lo}–{hi}：行数 期望{expected_count} 实际{count}" + \
+                         ("" if count != expected_count else "，行数相同但内容摘要不一致")
+                failures.append((table, detail))
+                log(f"[不一致] {table} {detail}")
+        if spec['aggregates'] and spec['min_key'] is not None:
+            columns = list(spec['aggregates'])
+            actual = _scalar_row(cursor, f"SELECT {', '.join(f'SUM({c})' for c in columns)} FROM {table} "
+                                         f"WHERE {key} BETWEEN {spec['min_key']} AND {spec['max_key']}")
+            for column, value in zip(columns, actual):
+                if value != spec['aggregates'][column]:
+                    table_failures += 1
+                    failures.append((table, f"SUM({column}) 期望{spec['aggregates'][column]} 实际{value}"))
+                    log(f"[不一致] {table} SUM({column})：期望{spec['aggregates'][column]} 实际{value}")
+        if not table_failures:
+            log(f"[一致] {table}：{spec['rows']}行，{len(spec['ranges'])}个区间")
+    cursor.close()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='按期望文件校验已导入的种子数据（区间校验和，不拉取整表）')
+    parser.add_argument('expectations', help='generate-600m-revenue-seed.py --expectations 写出的JSON')
+    parser.add_argument('--db', required=True, metavar='DRIVER:DSN',
+                        help='DB-API 2.0 驱动与连接参数，如 sqlite3:/tmp/seed.db 或 pymysql:host=...,database=qianzhang_sales')
+    args = parser.parse_args(argv)
+    with open(args.expectations, encoding='utf-8') as f:
+        expectations = json.load(f)
+    module, connect_args, connect_kwargs = parse_driver_spec(args.db)
+    conn = module.connect(*connect_args, **connect_kwargs)
+    try:
+        if module.__name__ == 'sqlite3':
+            _sqlite_functions(conn)
+        failures = verify(expectations, conn)
+    finally:
+        conn.close()
+    if failures:
+        print(f"校验失败：{len(failures)}处不一致", file=sys.stderr)
+        return 1
+    print("校验通过")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
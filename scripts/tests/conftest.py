@@ -0,0 +1,77 @@
+"""
+种子生成脚本与 seedgen 包的测试（在 scripts/ 下运行：python -m pytest -q tests）
+
+生成脚本文件名带连字符，不能直接 import：端到端用例以子进程运行脚本，
+需要 parse_args 等函数的用例通过 generator 夹具按路径加载。
+"""
+
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(SCRIPTS_DIR, 'generate-600m-revenue-seed.py')
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+# 文件头里唯一随运行时间变化的一行
+GENERATED_AT = re.compile('^-- 生成时间：.*\n'.encode(), re.M)
+INSERT_HEADER = re.compile(r"INSERT INTO `?(\w+)`? \(([^)]*)\) VALUES")
+
+
+def strip_timestamp(data):
+    return GENERATED_AT.sub(b'', data, count=1)
+
+
+def read_tables(path):
+    """SQL 文件 → {表: (列名列表, [行元组])}；每行一个 VALUES 元组（sql.append_inserts 的写法）"""
+    from seedgen.ingest import parse_row
+    tables = {}
+    rows = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            header = INSERT_HEADER.match(line)
+            if header:
+                columns = [c.strip().strip('`') for c in header.group(2).split(',')]
+                rows = tables.setdefault(header.group(1), (columns, []))[1]
+            elif rows is not None and line.startswith('('):
+                rows.append(parse_row(line.rstrip('\n').rstrip(',;')))
+            else:
+                rows = None
+    return tables
+
+
+def column(tables, table, name):
+    """表中某列的全部取值"""
+    columns, rows = tables[table]
+    index = columns.index(name)
+    return [row[index] for row in rows]
+
+
+@pytest.fixture(scope='session')
+def generator():
+    spec = importlib.util.spec_from_file_location('generate_seed', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate(directory, *argv, name='seed.sql'):
+    """在 directory 下运行生成脚本，返回 --output 路径；产物缓存放在 directory 下，不读写用户的缓存目录"""
+    output = os.path.join(str(directory), name)
+    env = dict(os.environ, XDG_CACHE_HOME=os.path.join(str(directory), '.cache'))
+    subprocess.run([sys.executable, SCRIPT, '--output', output, *argv], cwd=directory, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    return output
+
+
+@pytest.fixture
+def run_generator(tmp_path):
+    """run_generator(*参数, name='seed.sql') → 在临时目录运行生成脚本，返回 --output 路径"""
+    def run(*argv, name='seed.sql'):
+        return generate(tmp_path, *argv, name=name)
+    return run
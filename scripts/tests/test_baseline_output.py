@@ -0,0 +1,25 @@
+"""不带参数运行的输出与拆分前的原始脚本逐字节一致（去掉生成时间行）"""
+
+import hashlib
+
+from conftest import strip_timestamp
+
+# 原始单文件脚本（baseline 提交）默认输出去掉生成时间行后的 SHA-256
+BASELINE_SHA256 = '7b6d1105f4559c208e8b0a799263f19256f295e79f3ef064752e3222dda2df41'
+
+
+def _digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(strip_timestamp(f.read())).hexdigest()
+
+
+def test_default_output_matches_baseline(run_generator):
+    assert _digest(run_generator()) == BASELINE_SHA256
+
+
+def test_baseline_scenario_only_adds_header(run_generator):
+    with open(run_generator('--scenario', '600m-baseline'), 'rb') as f:
+        data = strip_timestamp(f.read())
+    header = '-- 场景：600m-baseline@1\n'.encode()
+    assert header in data
+    assert hashlib.sha256(data.replace(header, b'', 1)).hexdigest() == BASELINE_SHA256
@@ -0,0 +1,69 @@
+"""多层BOM：树只从成品展开到原料、层数不超过配置；MRP 需求与订单历史的产品数量一致"""
+
+import csv
+import os
+from collections import Counter
+
+import pytest
+from conftest import column, generate, read_tables
+
+DEPTH, FINISHED_GOODS = 3, 10
+ARGS = ('--customer-scale', '0.05', '--bom', '--bom-depth', str(DEPTH), '--bom-finished-goods', str(FINISHED_GOODS))
+
+
+def _finished_goods(products):
+    """成品编码 → 产品 id：PRODUCTS 本身 + 依次挂在各基础产品下的派生规格（bom.build_finished_goods）"""
+    goods = {p['sku']: p['id'] for p in products}
+    goods.update({f"QZ-FG-{n:06d}": products[(n - 1) % len(products)]['id']
+                  for n in range(len(products) + 1, FINISHED_GOODS + 1)})
+    return goods
+
+
+@pytest.fixture(scope='module')
+def seed(tmp_path_factory):
+    """(表, MRP 需求行)"""
+    path = generate(tmp_path_factory.mktemp('bom'), *ARGS)
+    with open(os.path.splitext(path)[0] + '-mrp-demand.csv', encoding='utf-8') as f:
+        demand = list(csv.DictReader(f))
+    return read_tables(path), demand
+
+
+def test_tree_expands_from_finished_goods_to_raw_materials(seed, generator):
+    tables, _ = seed
+    codes = dict(zip(column(tables, 'materials', 'id'), column(tables, 'materials', 'material_code')))
+    children = {}
+    for parent, material_id in zip(column(tables, 'bom_items', 'product_code'), column(tables, 'bom_items', 'material_id')):
+        children.setdefault(parent, []).append(codes[material_id])
+    assert all(len(kids) == len(set(kids)) for kids in children.values())
+
+    finished = set(_finished_goods(generator.PRODUCTS))
+    # 半成品都有自己的BOM行，原料都没有
+    assert set(children) == finished | {code for code in codes.values() if code.startswith('SF-')}
+    # 逐层展开：前 DEPTH - 1 层全是半成品，第 DEPTH 层全是原料，之后不再展开；所有半成品都可达
+    reached, frontier = set(), finished
+    for level in range(1, DEPTH + 1):
+        frontier = {kid for parent in frontier for kid in children.get(parent, ())}
+        assert frontier and all(kid.startswith('RM-' if level == DEPTH else 'SF-') for kid in frontier), level
+        reached |= frontier
+    assert not any(children.get(kid) for kid in frontier)
+    assert {code for code in codes.values() if code.startswith('SF-')} <= reached
+
+
+def test_demand_matches_ordered_quantities(seed, generator):
+    tables, demand = seed
+    product_of = _finished_goods(generator.PRODUCTS)
+    goods_per_product = Counter(product_of.values())
+
+    months = dict(zip(column(tables, 'orders', 'id'), (d[:7] for d in column(tables, 'orders', 'order_date'))))
+    ordered = Counter()
+    for order_id, product_id, quantity in zip(column(tables, 'order_items', 'order_id'),
+                                              column(tables, 'order_items', 'product_id'),
+                                              column(tables, 'order_items', 'quantity')):
+        ordered[(product_id, months[order_id])] += quantity
+    required = Counter()
+    for row in demand:
+        required[(product_of[row['product_code']], row['period'])] += int(row['required_qty'])
+    assert required.keys() == ordered.keys()
+    for key, quantity in ordered.items():
+        # 按权重分摊到同一产品的各成品，每个成品四舍五入误差不超过 0.5
+        assert abs(required[key] - quantity) <= goods_per_product[key[0]] / 2, key
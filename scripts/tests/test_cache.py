@@ -0,0 +1,74 @@
+"""产物缓存：键随参数 / 种子 / 源码变化，命中时字节一致，超出上限按 mtime 淘汰最久未用的产物"""
+
+import argparse
+import os
+import time
+
+from conftest import generate
+
+from seedgen.cache import ArtifactCache, cache_key
+
+
+def _args(**overrides):
+    values = dict(seed=42, customer_scale=1.0, years=1, output='seed.sql', cache=True, metrics_port=None)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def _source(tmp_path, text):
+    path = tmp_path / 'generate.py'
+    path.write_text(text, encoding='utf-8')
+    return [str(path)]
+
+
+def test_key_follows_config_seed_and_code(tmp_path):
+    sources = _source(tmp_path, "CUSTOMERS = 684\n")
+    key = cache_key(_args(), sources)
+    assert cache_key(_args(), sources) == key
+    assert cache_key(_args(customer_scale=2.0), sources) != key
+    assert cache_key(_args(seed=7), sources) != key
+    assert cache_key(_args(), _source(tmp_path, "CUSTOMERS = 685\n")) != key
+
+
+def test_key_ignores_output_options(tmp_path):
+    sources = _source(tmp_path, "CUSTOMERS = 684\n")
+    assert cache_key(_args(output='/elsewhere.sql', cache=False, metrics_port=9100), sources) == \
+        cache_key(_args(), sources)
+
+
+def test_hit_returns_identical_bytes(tmp_path):
+    cache = ArtifactCache(str(tmp_path / 'cache'))
+    output = tmp_path / 'seed.sql'
+    data = "INSERT INTO customers (id, name) VALUES\n(1, '菜市场-0001');\n".encode() * 1000
+    output.write_bytes(data)
+    assert cache.fetch('k1', str(tmp_path / 'miss.sql')) is None
+    path, evicted = cache.store('k1', str(output), {'key': 'k1'})
+    assert evicted == 0 and os.path.exists(path[:-len('.sql.gz')] + '.json')
+    restored = tmp_path / 'restored.sql'
+    assert cache.fetch('k1', str(restored)) == path
+    assert restored.read_bytes() == data
+
+
+def test_evicts_least_recently_used(tmp_path):
+    source = tmp_path / 'seed.sql'
+    source.write_bytes(os.urandom(4096))     # 不可压缩，每个产物约 4KB
+    cache = ArtifactCache(str(tmp_path / 'cache'), max_bytes=10 * 1024)
+    for n, key in enumerate(('used', 'old')):
+        path, _ = cache.store(key, str(source))
+        os.utime(path, (1000 + n, 1000 + n))
+    # 'used' 写入得更早，但读取刷新了 mtime：第三个产物超出上限时淘汰的是 'old'
+    cache.fetch('used', str(tmp_path / 'out.sql'))
+    path, evicted = cache.store('new', str(source))
+    assert evicted == 1
+    remaining = sorted(name for name in os.listdir(cache.directory) if name.endswith('.sql.gz'))
+    assert remaining == ['new.sql.gz', 'used.sql.gz']
+
+
+def test_plain_runs_reuse_the_cached_artifact(tmp_path):
+    args = ('--customer-scale', '0.05')
+    first = open(generate(tmp_path, *args, name='first.sql'), 'rb').read()
+    cached = os.listdir(tmp_path / '.cache' / 'qianzhang-seed')
+    assert any(name.endswith('.sql.gz') for name in cached)
+    time.sleep(1.1)  # 重新生成时文件头的生成时间会变化；命中缓存时与首次完全相同
+    assert open(generate(tmp_path, *args, name='second.sql'), 'rb').read() == first
+    assert open(generate(tmp_path, *args, '--no-cache', name='third.sql'), 'rb').read() != first
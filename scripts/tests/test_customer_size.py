@@ -0,0 +1,65 @@
+"""客户规模长尾：乘数在类内归一化，各类订单数与营收仍对齐目标，同类客户之间出现数量级差距"""
+
+import random
+from collections import Counter
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.customer_size import CUSTOMER_SIZE_CONFIG, CustomerSizeModel
+
+ARGS = ('--customer-scale', '0.5')
+
+
+@pytest.mark.parametrize('distribution', ['pareto', 'lognormal'])
+def test_factors_are_normalized_per_category(distribution):
+    model = CustomerSizeModel(dict(CUSTOMER_SIZE_CONFIG, distribution=distribution))
+    factors = model.factors(500, 'WET_MARKET')
+    assert sum(f for f, _ in factors) / 500 == pytest.approx(1)
+    assert sum(f * g for f, g in factors) / 500 == pytest.approx(1)
+    # 之后的小批新客户沿用首批的归一化常数，不再各自归一化
+    assert model.factors(1, 'WET_MARKET') != [(1.0, 1.0)]
+
+
+def test_orders_in_month_rounds_to_the_expectation():
+    model = CustomerSizeModel()
+    model.rng = random.Random(1)
+    assert sum(model.orders_in_month(4, 0.3) for _ in range(100000)) / 100000 == pytest.approx(1.2, rel=0.01)
+
+
+def _by_category(tables):
+    """{类别: (订单数, 营收, {客户: 营收})}"""
+    columns, rows = tables['customers']
+    category = {row[0]: row[columns.index('category')] for row in rows}
+    columns, rows = tables['orders']
+    customer, amount = columns.index('customer_id'), columns.index('total_amount')
+    result = {name: [0, 0, Counter()] for name in set(category.values())}
+    for row in rows:
+        totals = result[category[row[customer]]]
+        totals[0] += 1
+        totals[1] += row[amount]
+        totals[2][row[customer]] += row[amount]
+    return result
+
+
+@pytest.fixture(scope='module')
+def plain(tmp_path_factory):
+    return _by_category(read_tables(generate(tmp_path_factory.mktemp('plain'), *ARGS)))
+
+
+@pytest.mark.parametrize('distribution', ['pareto', 'lognormal'])
+def test_category_totals_hold_and_customers_skew(tmp_path, plain, distribution):
+    sized = _by_category(read_tables(generate(tmp_path, *ARGS, '--customer-size-dist', distribution)))
+    assert sized.keys() == plain.keys()
+    for name, (orders, revenue, _) in sized.items():
+        assert orders == pytest.approx(plain[name][0], rel=0.03), name
+        assert revenue == pytest.approx(plain[name][1], rel=0.03), name
+    # 客户最多的类别：头部客户营收是中位客户的数十倍，默认生成时两者相差无几
+    name = max(plain, key=lambda n: len(plain[n][2]))
+    assert _skew(sized[name][2]) > 10 > 2 > _skew(plain[name][2])
+
+
+def _skew(revenues):
+    """最大客户营收 / 中位客户营收"""
+    revenues = sorted(revenues.values())
+    return revenues[-1] / revenues[len(revenues) // 2]
@@ -0,0 +1,72 @@
+"""需求模型：日期按日权重、时刻按客户类型的小时权重抽样；启用后每个客户的订单数不变"""
+
+import datetime
+import random
+from collections import Counter
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.demand import DEMAND_CONFIG, INTRADAY_PROFILES, SPRING_FESTIVAL, WEEKDAY_MULTIPLIERS, DemandModel
+
+ARGS = ('--customer-scale', '0.2')
+
+
+def test_dates_follow_day_weights():
+    model = DemandModel()
+    days, _, cum = model._year_table(2025)
+    weights = [cum[0]] + [b - a for a, b in zip(cum, cum[1:])]
+    rng, draws = random.Random(1), 400000
+    counts = Counter(model.sample_date(rng, 2025)[0] for _ in range(draws))
+    for day, weight in zip(days, weights):
+        expected = draws * weight / cum[-1]
+        # 单日期望约 1000 次，泊松标准差约 32
+        assert abs(counts[day] - expected) < 6 * expected ** 0.5, day
+
+
+def test_festival_and_weekday_shape():
+    model = DemandModel()
+    festival = SPRING_FESTIVAL[2025]
+    eve, closed = festival - datetime.timedelta(days=1), festival + datetime.timedelta(days=1)
+    # 与四周前的同一星期几比较：星期系数相同，季节曲线在峰值附近变化很小
+    assert model.day_weight(eve) / model.day_weight(eve - datetime.timedelta(days=28)) == pytest.approx(
+        DEMAND_CONFIG['festival_pre_peak'], rel=0.05)
+    assert model.day_weight(closed) < 0.5 * model.day_weight(closed + datetime.timedelta(days=28))
+    # 季节曲线谷底（7月中旬）附近一周内的变化可以忽略，各天只差星期系数
+    monday = datetime.date(2025, 7, 14)
+    for offset, multiplier in enumerate(WEEKDAY_MULTIPLIERS):
+        day = monday + datetime.timedelta(days=offset)
+        assert model.day_weight(day) / model.day_weight(monday) == pytest.approx(
+            multiplier / WEEKDAY_MULTIPLIERS[0], rel=0.01)
+
+
+@pytest.fixture(scope='module')
+def runs(tmp_path_factory):
+    """(按需求模型生成的表, 默认生成的表)"""
+    directory = tmp_path_factory.mktemp('demand')
+    return (read_tables(generate(directory, *ARGS, '--demand-model', name='demand.sql')),
+            read_tables(generate(directory, *ARGS, name='plain.sql')))
+
+
+def _orders(tables):
+    columns, rows = tables['orders']
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def test_orders_per_customer_unchanged(runs):
+    modelled, plain = runs
+    assert Counter(o['customer_id'] for o in _orders(modelled)) == Counter(o['customer_id'] for o in _orders(plain))
+
+
+def test_order_hours_follow_the_category_profile(runs):
+    tables = runs[0]
+    columns, rows = tables['customers']
+    category = {row[0]: row[columns.index('category')] for row in rows}
+    hours = {}
+    for order in _orders(tables):
+        assert order['created_at'][:10] == order['order_date'][:10]
+        hours.setdefault(category[order['customer_id']], Counter())[int(order['created_at'][11:13])] += 1
+    for name, counts in hours.items():
+        profile = INTRADAY_PROFILES[name]
+        assert all(profile[hour] for hour in counts), name
+        assert counts.most_common(1)[0][0] == profile.index(max(profile)), name
@@ -0,0 +1,89 @@
+"""多年历史：第 1 年与单年生成一致；id 与单号跨年连续不重复；单价与单笔金额按增长曲线逐年上调；获客日前不下单"""
+
+from collections import Counter
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.growth import GROWTH_CONFIG
+
+ARGS = ('--customer-scale', '0.3')
+YEARS = 3
+
+
+@pytest.fixture(scope='module')
+def runs(tmp_path_factory):
+    """(多年生成的表, 单年生成的表)"""
+    directory = tmp_path_factory.mktemp('growth')
+    return (read_tables(generate(directory, *ARGS, '--years', str(YEARS), name='years.sql')),
+            read_tables(generate(directory, *ARGS, name='single.sql')))
+
+
+def _rows(tables, table):
+    columns, rows = tables[table]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def _year(row, column):
+    return int(row[column][:4])
+
+
+def test_first_year_matches_single_year(runs):
+    years, single = runs
+    first = min(_year(row, 'order_date') for row in _rows(single, 'orders'))
+    for table in ('orders', 'order_items'):
+        columns, rows = single[table]
+        assert years[table][0] == columns
+        assert years[table][1][:len(rows)] == rows, table
+    assert {_year(row, 'order_date') for row in _rows(years, 'orders')} == set(range(first, first + YEARS))
+
+
+def test_ids_and_numbers_are_unique_across_years(runs):
+    tables = runs[0]
+    for table in ('customers', 'orders', 'order_items', 'production_plans', 'delivery_records'):
+        ids = [row[0] for row in tables[table][1]]
+        assert ids == list(range(1, len(ids) + 1)), table
+    for table, column in (('orders', 'order_no'), ('customers', 'customer_code'), ('production_plans', 'batch_no')):
+        values = [row[column] for row in _rows(tables, table)]
+        assert len(set(values)) == len(values), (table, column)
+
+
+def test_prices_and_amounts_follow_the_growth_curve(runs):
+    tables = runs[0]
+    orders = {row['id']: row for row in _rows(tables, 'orders')}
+    first = min(_year(row, 'order_date') for row in orders.values())
+    prices = {}
+    for item in _rows(tables, 'order_items'):
+        prices.setdefault((item['product_id'], _year(orders[item['order_id']], 'order_date') - first), set()).add(
+            item['unit_price'])
+    inflation = 1 + GROWTH_CONFIG['price_inflation']
+    for (product_id, year_index), seen in prices.items():
+        assert len(seen) == 1
+        base = prices[(product_id, 0)]
+        assert seen == {round(next(iter(base)) * inflation ** year_index)}, (product_id, year_index)
+
+    # 按类别比较单笔均值（新增客户会改变各类别的订单占比）
+    category = {row['id']: row['category'] for row in _rows(tables, 'customers')}
+    count, total = Counter(), Counter()
+    for order in orders.values():
+        key = (category[order['customer_id']], _year(order, 'order_date') - first)
+        count[key] += 1
+        total[key] += order['total_amount']
+    growth = (1 + GROWTH_CONFIG['volume_growth']) * inflation
+    for name, year_index in count:
+        ratio = (total[(name, year_index)] / count[(name, year_index)]) / (total[(name, 0)] / count[(name, 0)])
+        assert ratio == pytest.approx(growth ** year_index, rel=0.03), (name, year_index)
+
+
+def test_customers_order_only_after_acquisition(runs):
+    tables = runs[0]
+    customers = {row['id']: row for row in _rows(tables, 'customers')}
+    first = min(_year(row, 'created_at') for row in customers.values())
+    acquired = {c for c, row in customers.items() if _year(row, 'created_at') > first}
+    assert acquired
+    for order in _rows(tables, 'orders'):
+        assert order['order_date'][:10] >= customers[order['customer_id']]['created_at'][:10]
+    # 每年新增约为年初在册客户的 acquisition_rate
+    new = Counter(_year(customers[c], 'created_at') for c in acquired)
+    initial = len(customers) - len(acquired)
+    assert new[first + 1] == pytest.approx(initial * GROWTH_CONFIG['acquisition_rate'], rel=0.35)
@@ -0,0 +1,124 @@
+"""直接入库：sqlite3 中的数据与 --output 的 SQL 文件一致；队列满时生产者阻塞；消费者出错传到生产者"""
+
+import sqlite3
+import sys
+import threading
+import types
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.ingest import IngestOutput
+
+ARGS = ('--scenario', 'smoke', '--payloads')
+COLUMNS = ['id', 'name']
+
+
+@pytest.fixture(scope='module')
+def ingested(tmp_path_factory):
+    """(SQL 文件解析结果, sqlite 数据库)，参数相同"""
+    directory = tmp_path_factory.mktemp('ingest')
+    tables = read_tables(generate(directory, *ARGS))
+    database = str(directory / 'seed.db')
+    generate(directory, *ARGS, '--ingest', f'sqlite3:{database}', '--ingest-workers', '3', '--ingest-queue', '2',
+             name='unused.sql')
+    return tables, database
+
+
+def test_row_counts_match_the_sql_file(ingested):
+    tables, database = ingested
+    with sqlite3.connect(database) as conn:
+        for table, (_, rows) in tables.items():
+            assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == len(rows), table
+
+
+def test_rows_match_the_sql_file(ingested):
+    tables, database = ingested
+    columns, rows = tables['orders']
+    with sqlite3.connect(database) as conn:
+        loaded = conn.execute(f"SELECT {', '.join(columns)} FROM orders").fetchall()
+    assert sorted(loaded) == sorted(rows)
+
+
+class FakeDriver(types.ModuleType):
+    """DB-API 替身：executemany 在 gate 打开前阻塞，表名为 broken 时抛错"""
+    paramstyle = 'qmark'
+
+    def __init__(self):
+        super().__init__('fakedb')
+        self.gate = threading.Event()
+        self.rows = []
+
+    def connect(self, *args, **kwargs):
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=()):
+        pass
+
+    def executemany(self, sql, rows):
+        if 'broken' in sql:
+            raise ValueError('写入失败')
+        self.driver.gate.wait()
+        self.driver.rows.extend(rows)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setitem(sys.modules, 'fakedb', driver)
+    return driver
+
+
+def _produce(output, table, count):
+    """在线程里写入 count 个单行批次，返回 (线程, 异常列表)"""
+    errors = []
+
+    def run():
+        try:
+            output.append_replicated(table, COLUMNS, [f"({n}, 'x')" for n in range(count)], 1)
+        except Exception as e:
+            errors.append(e)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, errors
+
+
+def test_full_queue_blocks_the_producer(driver):
+    output = IngestOutput('fakedb:seed', workers=1, queue_batches=2, batch_rows=1)
+    thread, errors = _produce(output, 'orders', 10)
+    # 消费者卡在第 1 批，队列放满 2 批后生产者阻塞
+    thread.join(0.3)
+    assert thread.is_alive() and output.queue.qsize() == 2
+    driver.gate.set()
+    thread.join(5)
+    assert not thread.is_alive() and not errors
+    output.flush()
+    output.close()
+    assert output.blocked_seconds > 0 and output.max_depth == 2
+    assert sorted(driver.rows) == [(n, 'x') for n in range(10)]
+
+
+def test_consumer_error_reaches_the_producer(driver):
+    driver.gate.set()
+    output = IngestOutput('fakedb:seed', workers=1, queue_batches=1, batch_rows=1)
+    # 批次远多于队列容量：消费者出错后仍须排空队列，生产者才能醒来并看到错误
+    thread, errors = _produce(output, 'broken', 50)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert [str(e) for e in errors] == ['入库失败：写入失败']
+    with pytest.raises(RuntimeError, match='入库失败'):
+        output.close()
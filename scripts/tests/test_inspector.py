@@ -0,0 +1,45 @@
+"""SQL 文件检查：行数、主键范围、日期范围、营收与逐行解析的结果一致"""
+
+import pytest
+from conftest import column, generate, read_tables
+
+from seedgen import inspector
+
+
+@pytest.fixture(scope='module')
+def seed(tmp_path_factory):
+    path = generate(tmp_path_factory.mktemp('inspector'), '--customer-scale', '0.05', '--payloads')
+    return path, read_tables(path)
+
+
+def test_summary_matches_parsed_rows(seed):
+    path, tables = seed
+    result = inspector.scan(path)
+    assert {t['table'] for t in result['tables']} == set(tables)
+    for summary in result['tables']:
+        columns, rows = tables[summary['table']]
+        keys = [row[0] for row in rows]
+        assert summary['rows'] == len(rows), summary['table']
+        assert summary['key_range'] == [min(keys), max(keys)], summary['table']
+        if summary.get('date_column'):
+            dates = [v[:10] for v in column(tables, summary['table'], summary['date_column']) if v]
+            assert summary['date_range'] == [min(dates), max(dates)], summary['table']
+    orders = next(t for t in result['tables'] if t['table'] == 'orders')
+    assert orders['revenue_fen'] == sum(column(tables, 'orders', 'total_amount'))
+    assert orders['amount_unit'] == '分（整数）'
+    assert result['schema_version'].startswith('v3')
+
+
+def test_fast_mode_keeps_counts_and_keys(seed):
+    path, _ = seed
+    full = {t['table']: t for t in inspector.scan(path)['tables']}
+    for summary in inspector.scan(path, fast=True)['tables']:
+        reference = full[summary['table']]
+        assert (summary['rows'], summary['key_range']) == (reference['rows'], reference['key_range'])
+        assert summary.get('revenue_fen') is None
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.sql'
+    path.write_bytes(b'')
+    assert inspector.scan(str(path))['tables'] == []
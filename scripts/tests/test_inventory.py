@@ -0,0 +1,66 @@
+"""库存流水：余额逐条连续且不为负；出库与已履行订单项、生产入库与生产计划一一对应；日终结存与流水一致"""
+
+from collections import Counter
+
+import pytest
+from conftest import column, generate, read_tables
+
+SIGN = {'IN': 1, 'OUT': -1}
+BALANCE_COLUMNS = {'IN': 'in_qty', 'OUT': 'out_qty', 'ADJUST': 'adjust_qty'}
+# 两年：覆盖逐年 flush 时余额与 id 的延续
+ARGS = ('--customer-scale', '0.05', '--inventory', '--years', '2', '--inventory-count-interval', '5')
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    return read_tables(generate(tmp_path_factory.mktemp('inventory'), *ARGS))
+
+
+def _rows(tables, table):
+    columns, rows = tables[table]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def test_ledger_is_continuous_and_never_negative(tables):
+    log = _rows(tables, 'inventory_log')
+    assert [row['id'] for row in log] == list(range(1, len(log) + 1))
+    assert [row['created_at'] for row in log] == sorted(row['created_at'] for row in log)
+    stock = {}
+    for row in log:
+        assert row['before_stock'] == stock.get(row['product_id'], 0), row['id']
+        assert row['after_stock'] == row['before_stock'] + row['quantity'] >= 0, row['id']
+        assert row['type'] == 'ADJUST' or row['quantity'] * SIGN[row['type']] > 0, row['id']
+        stock[row['product_id']] = row['after_stock']
+    inventory = {row['product_id']: row['total_stock'] for row in _rows(tables, 'inventory')}
+    assert inventory == {product_id: stock.get(product_id, 0) for product_id in inventory}
+    assert Counter(row['type'] for row in log).keys() == {'IN', 'OUT', 'ADJUST'}
+
+
+def test_movements_match_orders_and_production(tables):
+    log = _rows(tables, 'inventory_log')
+    fulfilled = {row['id'] for row in _rows(tables, 'orders') if row['status'] == 'FULFILLED'}
+    shipped = Counter((row['order_id'], row['product_id'], row['quantity']) for row in _rows(tables, 'order_items')
+                      if row['order_id'] in fulfilled)
+    assert Counter((row['order_id'], row['product_id'], -row['quantity']) for row in log if row['type'] == 'OUT') == shipped
+    produced = sum(column(tables, 'production_plans', 'actual_quantity'))
+    assert sum(row['quantity'] for row in log if row['type'] == 'IN' and row['remark'].startswith('生产入库')) == produced
+
+
+def test_daily_balance_follows_the_ledger(tables):
+    log = _rows(tables, 'inventory_log')
+    moved = Counter()
+    for row in log:
+        # 入库、出库按数量记正数，盘点差异带符号
+        quantity = row['quantity'] * SIGN.get(row['type'], 1)
+        moved[(row['product_id'], row['created_at'][:10], BALANCE_COLUMNS[row['type']])] += quantity
+    closing = {}
+    dates = set()
+    for row in _rows(tables, 'inventory_daily_balance'):
+        key = (row['product_id'], row['balance_date'])
+        dates.add(row['balance_date'])
+        for kind in BALANCE_COLUMNS.values():
+            assert row[kind] == moved[(*key, kind)], (key, kind)
+        previous = closing.get(row['product_id'], 0)
+        assert row['closing_stock'] == previous + row['in_qty'] - row['out_qty'] + row['adjust_qty'], key
+        closing[row['product_id']] = row['closing_stock']
+    assert len(dates) >= 2 * 365
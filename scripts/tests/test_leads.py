@@ -0,0 +1,59 @@
+"""线索漏斗：状态按 NEW → CONTACTED → QUALIFIED → CONVERTED 顺序流转、时间不倒退；转化线索与客户一一对应"""
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.leads import FUNNEL
+
+ARGS = ('--customer-scale', '0.1', '--leads', '--leads-total', '3000')
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    return read_tables(generate(tmp_path_factory.mktemp('leads'), *ARGS))
+
+
+def _rows(tables, table):
+    columns, rows = tables[table]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def test_status_history_follows_the_funnel(tables):
+    leads = {row['id']: row for row in _rows(tables, 'leads')}
+    history = {}
+    for row in _rows(tables, 'lead_status_history'):
+        history.setdefault(row['lead_id'], []).append(row)
+    assert history.keys() == leads.keys()
+    for lead_id, steps in history.items():
+        path = [step['to_status'] for step in steps]
+        lost = path[-1] == 'LOST'
+        assert path[:len(path) - lost] == FUNNEL[:len(path) - lost], lead_id
+        assert [step['from_status'] for step in steps] == [None] + path[:-1]
+        stamps = [step['changed_at'] for step in steps]
+        assert stamps == sorted(stamps)
+        lead = leads[lead_id]
+        assert (lead['status'], lead['created_at'], lead['updated_at']) == (path[-1], stamps[0], stamps[-1])
+        assert all(step['changed_by'] == lead['assigned_to'] for step in steps[1:])
+
+
+def test_conversions_match_customers(tables):
+    customers = {row['id']: row for row in _rows(tables, 'customers')}
+    leads = {row['id']: row for row in _rows(tables, 'leads')}
+    converted = [row for row in _rows(tables, 'lead_status_history') if row['to_status'] == 'CONVERTED']
+    assert converted and len({row['customer_id'] for row in converted}) == len(converted)
+    for row in converted:
+        customer = customers[row['customer_id']]
+        assert customer['created_at'] == row['changed_at']
+        assert leads[row['lead_id']]['company_name'] == customer['name']
+    assert all(row['customer_id'] is None for row in _rows(tables, 'lead_status_history')
+               if row['to_status'] != 'CONVERTED')
+
+
+def test_activities_fall_inside_the_lead_lifetime(tables):
+    leads = {row['id']: row for row in _rows(tables, 'leads')}
+    activities = _rows(tables, 'lead_activities')
+    assert activities
+    for row in activities:
+        lead = leads[row['lead_id']]
+        assert lead['created_at'] <= row['activity_at'] <= lead['updated_at']
+        assert row['operator_id'] == lead['assigned_to']
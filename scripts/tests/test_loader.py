@@ -0,0 +1,107 @@
+"""拆分输出 + 并发加载：数据块只在依赖表全部完成后开始，prelude / epilogue 分别最先、最后执行"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+from conftest import generate
+
+from seedgen import loader
+
+
+def _split(directory, *extra):
+    generate(directory, '--scenario', 'smoke', '--split-dir', str(directory / 'split'), '--split-rows', '500', *extra)
+    return str(directory / 'split' / 'manifest.json')
+
+
+@pytest.fixture(scope='module', params=[(), ('--shadow',)], ids=['plain', 'shadow'])
+def manifest(request, tmp_path_factory):
+    return _split(tmp_path_factory.mktemp('split'), *request.param)
+
+
+def _recording_client():
+    """fake_client 外包一层，记录每个文件的开始 / 结束顺序"""
+    fake = loader.fake_client()
+    events, lock = [], threading.Lock()
+
+    def run(path):
+        with lock:
+            events.append(('start', os.path.basename(path)))
+        fake(path)
+        time.sleep(0.001)
+        with lock:
+            events.append(('end', os.path.basename(path)))
+    return run, events
+
+
+def test_chunks_wait_for_their_dependencies(manifest):
+    with open(manifest, encoding='utf-8') as f:
+        spec = json.load(f)
+    run, events = _recording_client()
+    loaded = loader.load(manifest, run, workers=4, log=lambda line: None)
+
+    table_of = {os.path.basename(entry['path']): entry['table'] for entry in spec['files']}
+    depends = {t['table']: t['depends_on'] for t in spec['tables']}
+    assert events[0] == ('start', spec['prelude']) and events[-1] == ('end', spec['epilogue'])
+    finished = {table: 0 for table in depends}
+    total = {table: sum(1 for t in table_of.values() if t == table) for table in depends}
+    for kind, name in events[2:-2]:
+        table = table_of[name]
+        if kind == 'start':
+            assert all(finished[dep] == total[dep] for dep in depends[table]), f"{name} 在依赖完成前开始"
+        else:
+            finished[table] += 1
+    assert finished == total
+    assert loaded == {t['table']: t['rows'] for t in spec['tables'] if t['rows']}
+
+
+def test_shadow_manifest_depends_on_shadow_tables(tmp_path):
+    with open(_split(tmp_path, '--shadow'), encoding='utf-8') as f:
+        spec = json.load(f)
+    depends = {t['table']: t['depends_on'] for t in spec['tables']}
+    assert depends['orders_shadow'] == ['customers_shadow']
+    assert depends['order_items_shadow'] == ['orders_shadow']
+    assert all(dep.endswith('_shadow') for deps in depends.values() for dep in deps)
+
+
+def test_unsatisfiable_dependencies_are_reported(manifest, tmp_path):
+    with open(manifest, encoding='utf-8') as f:
+        spec = json.load(f)
+    directory = os.path.dirname(manifest)
+    for entry in spec['files']:
+        entry['path'] = os.path.join(directory, entry['path'])
+    for name in ('prelude', 'epilogue'):
+        spec[name] = os.path.join(directory, spec[name])
+    first, second = spec['tables'][0], spec['tables'][1]
+    first['depends_on'], second['depends_on'] = [second['table']], [first['table']]
+    cyclic = tmp_path / 'manifest.json'
+    cyclic.write_text(json.dumps(spec), encoding='utf-8')
+    with pytest.raises(RuntimeError, match='依赖无法满足'):
+        loader.load(str(cyclic), loader.fake_client(), log=lambda line: None)
+
+
+def test_failed_chunk_stops_dependents(manifest):
+    with open(manifest, encoding='utf-8') as f:
+        spec = json.load(f)
+    customers = next(t['table'] for t in spec['tables'] if t['table'].startswith('customers'))
+    failing = next(os.path.basename(e['path']) for e in spec['files'] if e['table'] == customers)
+    run, events = _recording_client()
+
+    def broken(path):
+        if os.path.basename(path) == failing:
+            raise RuntimeError('导入失败')
+        run(path)
+
+    with pytest.raises(RuntimeError, match='导入失败'):
+        loader.load(manifest, broken, workers=2, log=lambda line: None)
+    started = {name for kind, name in events if kind == 'start'}
+    orders = {os.path.basename(e['path']) for e in spec['files'] if e['table'].startswith('orders')}
+    assert not started & orders
+    assert spec['epilogue'] not in started
+
+
+def test_fake_command_line(manifest, capsys):
+    assert loader.main([manifest, '--fake', '--workers', '3']) == 0
+    assert '导入完成' in capsys.readouterr().out
@@ -0,0 +1,103 @@
+"""进度指标：textfile 与 HTTP 输出的指标名、标签集合、ETA，以及生成结束时与 SQL 文件一致的行数"""
+
+import io
+import os
+import re
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.metrics import METRIC_HELP, MeteredOutput, ProgressMetrics
+from seedgen.sql import SqlOutput
+
+SAMPLE = re.compile(r'^(\w+)\{([^}]*)\} (\S+)$')
+LABEL = re.compile(r'(\w+)="([^"]*)"')
+TABLE_METRICS = {'seed_rows_generated_total', 'seed_rows_written_total'}
+
+
+def _parse(text):
+    """Prometheus 文本 → {(指标名, ((标签, 值), ...)): 数值}；同时检查 HELP / TYPE 与样本一一对应"""
+    samples, declared = {}, []
+    for line in text.splitlines():
+        if line.startswith('# TYPE '):
+            declared.append(line.split()[2])
+        elif not line.startswith('#'):
+            name, labels, value = SAMPLE.match(line).groups()
+            assert name == declared[-1]
+            samples[(name, tuple(sorted(LABEL.findall(labels))))] = float(value)
+    assert declared == [name for name, _, _ in METRIC_HELP]
+    return samples
+
+
+def _values(samples, name):
+    return {dict(labels).get('table'): value for (metric, labels), value in samples.items() if metric == name}
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    textfile = str(tmp_path / 'seed.prom')
+    metrics = ProgressMetrics('seed.sql', textfile, port=0, interval=0)
+    buffer = io.StringIO()
+    output = MeteredOutput(SqlOutput(buffer), metrics)
+    output.append_replicated('customers', ['id', 'name'], ["(1, 'a')", "(2, '乙')"], 1000)
+    output.append_routed('orders', ['id', 'customer_id'], [f"({n}, 1)" for n in range(1, 6)], 2, None)
+    output.flush()
+    yield metrics, textfile, buffer.getvalue()
+    metrics.close()
+
+
+def test_label_sets(metrics):
+    progress, _, written = metrics
+    samples = _parse(progress.render())
+    for name, labels in samples:
+        keys = [key for key, _ in labels]
+        assert keys == (['run', 'table'] if name in TABLE_METRICS else ['run']), name
+        assert dict(labels)['run'] == 'seed.sql'
+    assert _values(samples, 'seed_rows_generated_total') == {'customers': 2, 'orders': 5}
+    assert _values(samples, 'seed_rows_written_total') == {'customers': 2, 'orders': 5}
+    # 与 SqlOutput 实际写出的字节数一致（文件末尾不补换行）
+    assert _values(samples, 'seed_bytes_total')[None] == len(written.encode('utf-8')) + 1
+
+
+def test_eta_and_done(metrics):
+    progress, _, _ = metrics
+    progress.started = time.time() - 100
+    progress.set_progress(0.25)
+    samples = _parse(progress.render())
+    assert _values(samples, 'seed_progress_ratio')[None] == 0.25
+    assert _values(samples, 'seed_eta_seconds')[None] == pytest.approx(300, abs=1)
+    assert _values(samples, 'seed_done')[None] == 0
+    progress.finish()
+    samples = _parse(progress.render())
+    assert [_values(samples, name)[None] for name in ('seed_progress_ratio', 'seed_eta_seconds', 'seed_done')] == \
+        [1, 0, 1]
+
+
+def test_textfile_and_http_agree(metrics):
+    progress, textfile, _ = metrics
+    progress.finish()
+    with open(textfile, encoding='utf-8') as f:
+        exported = _parse(f.read())
+    assert not [name for name in os.listdir(os.path.dirname(textfile)) if name.endswith('.tmp')]
+    url = f"http://127.0.0.1:{progress.server.server_address[1]}"
+    with urllib.request.urlopen(f"{url}/metrics") as response:
+        assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+        served = _parse(response.read().decode('utf-8'))
+    assert served.keys() == exported.keys()
+    rate = {key for key in served if key[0] == 'seed_rows_per_second'}
+    assert {k: v for k, v in served.items() if k not in rate} == {k: v for k, v in exported.items() if k not in rate}
+    with pytest.raises(urllib.error.HTTPError):
+        urllib.request.urlopen(f"{url}/other")
+
+
+def test_final_textfile_matches_the_sql_file(tmp_path):
+    textfile = str(tmp_path / 'seed.prom')
+    tables = read_tables(generate(tmp_path, '--customer-scale', '0.05', '--metrics-textfile', textfile))
+    with open(textfile, encoding='utf-8') as f:
+        samples = _parse(f.read())
+    assert _values(samples, 'seed_rows_written_total') == {table: len(rows) for table, (_, rows) in tables.items()}
+    assert _values(samples, 'seed_done') == {None: 1}
+    assert {dict(labels)['run'] for _, labels in samples} == {'seed.sql'}
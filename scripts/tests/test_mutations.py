@@ -0,0 +1,104 @@
+"""订单变更流：溢写 + 归并后按业务时间非递减输出、语句不丢不重；令牌桶限制输出速率"""
+
+import datetime
+import io
+import random
+import re
+
+import pytest
+
+from seedgen.mutations import MUTATION_CONFIG, MutationStream, TokenBucket
+
+ITEM_COLUMNS = ['id', 'order_id', 'product_id', 'quantity']
+DELIVERY_COLUMNS = ['id', 'order_id', 'driver']
+STATUS = ['PENDING_REVIEW', 'APPROVED', 'FULFILLED']
+# 测试数据里各表行的第一列都取订单号
+ORDER_ID = re.compile(r"VALUES \((\d+)|WHERE id = (\d+)")
+LINE = re.compile(r"/\* (\d{4}-\d\d-\d\d \d\d:\d\d:\d\d) \*/ (\w+ \w+ \w+)")
+
+
+def _replay(spool_events, orders=600):
+    """按年生成订单（年内乱序加入），每年结束推进水位线；返回 (输出, 写出语句数, 各订单最终状态)"""
+    out = io.StringIO()
+    stream = MutationStream(dict(MUTATION_CONFIG, spool_events=spool_events), out)
+    rng = random.Random(5)
+    finals = {}
+    order_id = 0
+    for year in (2023, 2024, 2025):
+        for _ in range(orders // 3):
+            order_id += 1
+            created = datetime.datetime(year, 1, 1) + datetime.timedelta(minutes=rng.randrange(365 * 24 * 60))
+            status = finals[order_id] = rng.choice(STATUS)
+            stream.add_order(order_id, 1, f"SO{order_id:06d}", 1, 100, f"{created:%Y-%m-%d}", 2,
+                             f"{created:%Y-%m-%d %H:%M:%S}", [f"({order_id}, {order_id}, 1, 3)"], ITEM_COLUMNS,
+                             status, f"({order_id}, {order_id}, '司机张三')", DELIVERY_COLUMNS)
+        stream.advance(datetime.date(year + 1, 1, 1))
+    return out.getvalue(), stream.close(), finals
+
+
+@pytest.fixture(scope='module')
+def spilled():
+    return _replay(spool_events=50)
+
+
+def test_spilled_output_is_time_ordered(spilled):
+    text, written, _ = spilled
+    lines = text.splitlines()
+    assert len(lines) == written
+    stamps = [LINE.match(line).group(1) for line in lines]
+    assert stamps == sorted(stamps)
+
+
+def test_spilled_output_is_complete(spilled):
+    text, _, finals = spilled
+    seen = {}
+    for line in text.splitlines():
+        order_id = int(next(g for g in ORDER_ID.search(line).groups() if g))
+        kind = LINE.match(line).group(2)
+        if kind.startswith('UPDATE'):
+            kind = re.search(r"status = '(\w+)'", line).group(1)
+        seen.setdefault(order_id, []).append(kind)
+    expected = {
+        'PENDING_REVIEW': ['INSERT INTO orders', 'INSERT INTO order_items'],
+        'APPROVED': ['INSERT INTO orders', 'INSERT INTO order_items', 'APPROVED'],
+        'FULFILLED': ['INSERT INTO orders', 'INSERT INTO order_items', 'APPROVED', 'FULFILLED',
+                      'INSERT INTO delivery_records'],
+    }
+    assert seen == {order_id: expected[status] for order_id, status in finals.items()}
+
+
+def test_spilling_does_not_change_the_output(spilled):
+    assert _replay(spool_events=10 ** 9)[0] == spilled[0]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.parametrize('rate, capacity', [(100, None), (50, 10), (0.5, 1)])
+def test_token_bucket_limits_throughput(rate, capacity):
+    clock = FakeClock()
+    bucket = TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep)
+    burst = bucket.capacity
+    for _ in range(int(burst)):
+        bucket.acquire()
+    # 突发容量内不等待，之后每个令牌等 1 / rate 秒
+    assert clock.now == 0
+    for _ in range(200):
+        bucket.acquire()
+    assert clock.now == pytest.approx(200 / rate)
+
+
+def test_token_bucket_unlimited():
+    clock = FakeClock()
+    bucket = TokenBucket(0, clock=clock, sleep=clock.sleep)
+    for _ in range(10000):
+        bucket.acquire()
+    assert clock.now == 0
@@ -0,0 +1,51 @@
+"""宽行负载：审核三列同时有值或同时为空，文本长度不超过各列上限，交货地址大多沿用客户地址"""
+
+import datetime
+
+import pytest
+from conftest import column, generate, read_tables
+
+from seedgen.mutations import MUTATION_CONFIG, REVIEWER_IDS
+from seedgen.payloads import PAYLOAD_CONFIG
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('payloads')
+    return read_tables(generate(directory, '--payloads', '--customer-scale', '0.05'))
+
+
+def test_review_fields_are_filled_together(tables):
+    columns, rows = tables['orders']
+    status, created_at, reviewed_by, reviewed_at, comment = (
+        columns.index(c) for c in ('status', 'created_at', 'reviewed_by', 'reviewed_at', 'review_comment'))
+    low, high = MUTATION_CONFIG['review_delay_minutes']
+    for row in rows:
+        if row[status] == 'PENDING_REVIEW':
+            assert row[reviewed_by] is None and row[reviewed_at] is None and row[comment] is None
+        else:
+            assert row[reviewed_by] in REVIEWER_IDS
+            delay = _parse(row[reviewed_at]) - _parse(row[created_at])
+            assert datetime.timedelta(minutes=low) <= delay <= datetime.timedelta(minutes=high)
+    assert any(row[comment] for row in rows) and any(row[comment] is None and row[reviewed_by] for row in rows)
+
+
+def _parse(text):
+    return datetime.datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
+
+
+def test_text_lengths_stay_within_limits(tables):
+    for name, spec in PAYLOAD_CONFIG['columns'].items():
+        table, field = name.split('.')
+        texts = [v for v in column(tables, table, field) if v is not None]
+        assert texts, name
+        # 在片段边界截断，只有首个片段即超长时才会超出 max
+        assert all(len(text) <= spec['max'] or '，' not in text for text in texts), name
+
+
+def test_delivery_address_mostly_reuses_customer_address(tables):
+    addresses = dict(zip(column(tables, 'customers', 'id'), column(tables, 'customers', 'address')))
+    pairs = [(addresses[c], a) for c, a in zip(column(tables, 'orders', 'customer_id'),
+                                               column(tables, 'orders', 'delivery_address')) if a is not None]
+    same = sum(1 for customer, delivery in pairs if customer == delivery) / len(pairs)
+    assert abs(same - PAYLOAD_CONFIG['same_address_rate']) < 0.05
@@ -0,0 +1,74 @@
+"""销售组织：组织树与人员、归属历史、订单 created_by、销售目标的外键都能对上"""
+
+from collections import Counter
+
+import pytest
+from conftest import generate, read_tables
+
+SPAN, REGIONS = 4, 3
+ARGS = ('--customer-scale', '0.1', '--sales-org', '--org-span', str(SPAN), '--org-regions', str(REGIONS), '--years', '2')
+LEVEL_OF = {'SALES_DIRECTOR': 2, 'SALES_MANAGER': 3, 'SALES_REP': 4}
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    return read_tables(generate(tmp_path_factory.mktemp('sales_org'), *ARGS))
+
+
+def _rows(tables, table):
+    columns, rows = tables[table]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def test_organization_tree(tables):
+    orgs = {row['id']: row for row in _rows(tables, 'organizations')}
+    roots = [org for org in orgs.values() if org['parent_id'] is None]
+    assert len(roots) == 1 and roots[0]['ancestor_path'] == f"/{roots[0]['id']}/"
+    for org in orgs.values():
+        if org['parent_id'] is None:
+            continue
+        parent = orgs[org['parent_id']]
+        assert org['level'] == parent['level'] + 1
+        assert org['ancestor_path'] == f"{parent['ancestor_path']}{org['id']}/"
+    assert Counter(org['level'] for org in orgs.values())[2] == REGIONS
+
+
+def test_users_sit_at_their_level(tables):
+    orgs = {row['id']: row for row in _rows(tables, 'organizations')}
+    users = _rows(tables, 'users')
+    for user in users:
+        assert orgs[user['org_id']]['level'] == LEVEL_OF[user['job_position']], user['id']
+    # 经理的管理幅度：每个城市团队下（各战区合计）正好 SPAN 个代表
+    teams = Counter(orgs[user['org_id']]['parent_id'] for user in users if user['job_position'] == 'SALES_REP')
+    assert set(teams.values()) == {SPAN}
+
+
+def test_owner_history_references_resolve(tables):
+    customers = {row['id'] for row in _rows(tables, 'customers')}
+    reps = {row['id']: row['org_id'] for row in _rows(tables, 'users') if row['job_position'] == 'SALES_REP'}
+    timelines = {}
+    for row in _rows(tables, 'customer_owner_history'):
+        assert row['customer_id'] in customers
+        assert reps[row['sales_rep_id']] == row['territory_org_id']
+        timelines.setdefault(row['customer_id'], []).append(row)
+    assert timelines.keys() == customers
+    for timeline in timelines.values():
+        assert timeline[-1]['effective_to'] is None
+        for current, following in zip(timeline, timeline[1:]):
+            assert current['effective_to'] < following['effective_from']
+            assert current['sales_rep_id'] != following['sales_rep_id']
+
+
+def test_orders_and_targets_follow_ownership(tables):
+    timelines = {}
+    for row in _rows(tables, 'customer_owner_history'):
+        timelines.setdefault(row['customer_id'], []).append((row['effective_from'], row['sales_rep_id']))
+    actual = Counter()
+    for order in _rows(tables, 'orders'):
+        owner = [rep for since, rep in timelines[order['customer_id']] if since <= order['order_date'][:10]][-1]
+        assert order['created_by'] == owner, order['id']
+        actual[(owner, order['order_date'][:7])] += order['total_amount']
+    targets = _rows(tables, 'sales_targets')
+    assert {(row['sales_rep_id'], row['period']) for row in targets if row['revenue_actual']} == set(actual)
+    for row in targets:
+        assert round(row['revenue_actual'] * 100) == actual[(row['sales_rep_id'], row['period'])]
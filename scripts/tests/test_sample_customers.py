@@ -0,0 +1,59 @@
+"""客户抽样：样本客户行与全量一致，所有引用闭合在样本内，小样本包含于大样本"""
+
+import pytest
+from conftest import column, generate, read_tables
+
+from seedgen.registry import sample_customers
+
+ARGS = ('--customer-scale', '0.2', '--sales-org', '--leads', '--payloads')
+FRACTION = 0.1
+
+
+@pytest.fixture(scope='module')
+def sampled(tmp_path_factory):
+    """(全量输出, 抽样输出)，其余参数相同"""
+    directory = tmp_path_factory.mktemp('sample')
+    full = read_tables(generate(directory, *ARGS, name='full.sql'))
+    sample = read_tables(generate(directory, *ARGS, '--sample-customers', str(FRACTION), name='sample.sql'))
+    return full, sample
+
+
+def test_sample_customer_rows_match_full_output(sampled):
+    full, sample = sampled
+    assert set(sample['customers'][1]) <= set(full['customers'][1])
+    # 按类别分层抽样，每类至少 1 家
+    categories = column(full, 'customers', 'category')
+    ids = column(full, 'customers', 'id')
+    expected = set()
+    for category in set(categories):
+        members = [c for c, cat in zip(ids, categories) if cat == category]
+        expected |= sample_customers(members, FRACTION, 42)
+    assert set(column(sample, 'customers', 'id')) == expected
+    # 与客户无关的参考数据不受抽样影响
+    for table in ('organizations', 'users'):
+        assert sample[table] == full[table]
+
+
+def test_references_stay_inside_the_sample(sampled):
+    _, sample = sampled
+    customers = set(column(sample, 'customers', 'id'))
+    assert set(column(sample, 'orders', 'customer_id')) <= customers
+    assert set(column(sample, 'customer_owner_history', 'customer_id')) <= customers
+    assert {c for c in column(sample, 'lead_status_history', 'customer_id') if c is not None} <= customers
+    orders = set(column(sample, 'orders', 'id'))
+    assert set(column(sample, 'order_items', 'order_id')) <= orders
+    assert set(column(sample, 'delivery_records', 'order_id')) <= orders
+    leads = set(column(sample, 'leads', 'id'))
+    assert set(column(sample, 'lead_status_history', 'lead_id')) <= leads
+    assert set(column(sample, 'lead_activities', 'lead_id')) <= leads
+
+
+def test_smaller_samples_are_nested():
+    ids = range(1, 5001)
+    previous = set()
+    for fraction in (0.001, 0.01, 0.1, 0.5, 1.0):
+        current = sample_customers(ids, fraction, 42)
+        assert len(current) == max(1, round(len(ids) * fraction))
+        assert previous <= current
+        previous = current
+    assert sample_customers(ids, 0.1, 42) != sample_customers(ids, 0.1, 43)
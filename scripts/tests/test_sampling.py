@@ -0,0 +1,71 @@
+"""legacy 抽样器与原写法逐位一致；alias 抽样器与 legacy 抽样器的分布一致"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from seedgen.sampling import make_sampler, uniform
+
+STATUS = [('FULFILLED', 80), ('APPROVED', 15), ('PENDING_REVIEW', 5)]
+# 类别多、权重悬殊，含零权重项
+SKEWED = [(n, w) for n, w in enumerate([500, 200, 100, 50, 50, 30, 20, 20, 10, 10, 5, 3, 2, 0])]
+
+
+def _frequencies(sampler, draws, seed):
+    rng = random.Random(seed)
+    counts = Counter(sampler.draw(rng) for _ in range(draws))
+    return {outcome: count / draws for outcome, count in counts.items()}
+
+
+def test_legacy_weighted_matches_threshold_scan():
+    sampler = make_sampler(STATUS, 'legacy')
+    rng, reference = random.Random(7), random.Random(7)
+    for _ in range(10000):
+        r = reference.random()
+        expected = 'FULFILLED' if r < 0.80 else 'APPROVED' if r < 0.95 else 'PENDING_REVIEW'
+        assert sampler.draw(rng) == expected
+
+
+def test_legacy_uniform_matches_choice():
+    outcomes = ['司机张三', '司机李四', '司机王五', '司机赵六']
+    sampler = make_sampler(uniform(outcomes), 'legacy')
+    rng, reference = random.Random(7), random.Random(7)
+    assert [sampler.draw(rng) for _ in range(1000)] == [reference.choice(outcomes) for _ in range(1000)]
+
+
+@pytest.mark.parametrize('table', [STATUS, SKEWED, uniform(range(7))])
+def test_alias_distribution_matches_legacy(table):
+    draws = 200000
+    legacy = _frequencies(make_sampler(table, 'legacy'), draws, 1)
+    alias = _frequencies(make_sampler(table, 'alias'), draws, 2)
+    total = sum(weight for _, weight in table)
+    for outcome, weight in table:
+        expected = weight / total
+        # 20 万次抽样，单项频率的标准差不超过 0.0012
+        assert abs(alias.get(outcome, 0) - expected) < 0.006
+        assert abs(legacy.get(outcome, 0) - expected) < 0.006
+
+
+def test_alias_never_draws_zero_weight():
+    sampler = make_sampler(SKEWED, 'alias')
+    rng = random.Random(3)
+    assert all(sampler.draw(rng) != 13 for _ in range(100000))
+
+
+def test_invalid_tables_rejected():
+    with pytest.raises(ValueError):
+        make_sampler([], 'alias')
+    with pytest.raises(ValueError):
+        make_sampler([('a', 0), ('b', 0)], 'alias')
+    with pytest.raises(ValueError):
+        make_sampler(STATUS, 'cdf')
+
+
+@pytest.mark.parametrize('method', ['legacy', 'alias'])
+@pytest.mark.parametrize('table', [STATUS, SKEWED, uniform(range(7))])
+def test_draw_many_equals_repeated_draw(method, table):
+    sampler = make_sampler(table, method)
+    rng, reference = random.Random(11), random.Random(11)
+    assert sampler.draw_many(rng, 5000) == [sampler.draw(reference) for _ in range(5000)]
+    assert rng.random() == reference.random()
@@ -0,0 +1,72 @@
+"""命名场景：覆盖任何影响数据内容的参数都算偏离，输出方式类参数不算"""
+
+import pytest
+
+from seedgen.scenarios import OUTPUT_ARGS, SCENARIOS, deviations, scenario_label
+
+CONTENT_OVERRIDES = [
+    (['--tenants', '3'], 'tenants'),
+    (['--payload-scale', '2'], 'payload_scale'),
+    (['--payload-column', 'orders.remark=0.8:200:4000'], 'payload_column'),
+    (['--volume-growth', '0.2'], 'volume_growth'),
+    (['--price-inflation', '0.05'], 'price_inflation'),
+    (['--acquisition-rate', '0.3'], 'acquisition_rate'),
+    (['--churn-rate', '0.2'], 'churn_rate'),
+    (['--bom-depth', '5'], 'bom_depth'),
+    (['--bom-raw-materials', '50'], 'bom_raw_materials'),
+    (['--org-regions', '3'], 'org_regions'),
+    (['--org-span', '4'], 'org_span'),
+    (['--leads-total', '900'], 'leads_total'),
+    (['--leads-conversion-rate', '0.1'], 'leads_conversion_rate'),
+    (['--customer-size-shape', '1.5'], 'customer_size_shape'),
+    (['--sample-customers', '0.1'], 'sample_customers'),
+    (['--inventory-count-interval', '14'], 'inventory_count_interval'),
+    (['--seed', '7'], 'seed'),
+    (['--years', '2'], 'years'),
+    (['--payloads'], 'payloads'),
+]
+OUTPUT_OVERRIDES = [
+    ['--output', 'other.sql'],
+    ['--shards', '4', '--shard-function', 'mod'],
+    ['--split-dir', 'out', '--split-rows', '1000'],
+    ['--ingest', 'sqlite3:/tmp/seed.db', '--ingest-workers', '2'],
+    ['--expectations', 'e.json', '--stats-report', 's.json'],
+    ['--metrics-port', '9100', '--no-cache', '--cache-size', '1'],
+]
+
+
+@pytest.mark.parametrize('name', list(SCENARIOS))
+def test_scenario_alone_has_no_deviations(generator, name):
+    args = generator.parse_args(['--scenario', name])
+    assert deviations(args) == []
+    assert scenario_label(args) == f"{name}@{SCENARIOS[name]['version']}"
+
+
+@pytest.mark.parametrize('argv', OUTPUT_OVERRIDES)
+def test_output_arguments_do_not_deviate(generator, argv):
+    assert deviations(generator.parse_args(['--scenario', 'smoke', *argv])) == []
+
+
+@pytest.mark.parametrize('argv, key', CONTENT_OVERRIDES)
+def test_content_arguments_deviate(generator, argv, key):
+    args = generator.parse_args(['--scenario', '600m-baseline', *argv])
+    assert [deviation[0] for deviation in deviations(args)] == [key]
+    assert scenario_label(args).endswith('（已偏离场景定义）')
+
+
+def test_repeating_the_scenario_value_is_not_a_deviation(generator):
+    assert deviations(generator.parse_args(['--scenario', 'hot-wholesaler', '--customer-size-dist', 'pareto',
+                                            '--customer-size-shape', '1.0', '--seed', '42'])) == []
+
+
+def test_every_argument_is_compared_or_output_only(generator):
+    """新增参数必须要么参与偏离比较，要么显式列入 OUTPUT_ARGS"""
+    args = generator.parse_args(['--scenario', 'smoke'])
+    compared = set(args.scenario_baseline)
+    assert compared.isdisjoint(OUTPUT_ARGS)
+    assert compared | set(OUTPUT_ARGS) >= set(vars(args))
+
+
+def test_no_scenario(generator):
+    args = generator.parse_args(['--tenants', '3'])
+    assert deviations(args) == [] and scenario_label(args) is None
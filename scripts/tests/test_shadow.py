@@ -0,0 +1,81 @@
+"""影子表重灌：INSERT 只写入 *_shadow，在线表不被 DELETE；部分清理的表先复制保留行；外键指向影子表；
+最后一条多表 RENAME 原子切换全部表；写入的数据与默认 DELETE 模式逐行相同"""
+
+import re
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.shadow import FOREIGN_KEYS, SHADOW_SUFFIX, ReseedPlan
+
+ARGS = ('--customer-scale', '0.05', '--sales-org', '--tenants', '3')
+
+
+def _plan(shadow):
+    plan = ReseedPlan(shadow=shadow)
+    plan.delete('order_items')
+    plan.delete('orders')
+    plan.delete('users', 'id >= 200000')
+    plan.delete('organizations', 'id >= 200000')
+    return plan
+
+
+def test_delete_mode_is_unchanged():
+    plan = _plan(shadow=False)
+    assert plan.target('orders') == 'orders'
+    assert plan.cleanup_statements() == ['DELETE FROM order_items;', 'DELETE FROM orders;',
+                                         'DELETE FROM users WHERE id >= 200000;',
+                                         'DELETE FROM organizations WHERE id >= 200000;']
+    assert plan.swap_statements() == []
+
+
+def test_shadow_plan():
+    plan = _plan(shadow=True)
+    assert plan.target('orders') == 'orders' + SHADOW_SUFFIX
+    assert plan.target('products') == 'products'  # 未登记的表照常写入在线表
+    statements = plan.cleanup_statements()
+    assert not any(s.startswith('DELETE') for s in statements)
+    assert 'INSERT INTO users_shadow SELECT * FROM users WHERE NOT (id >= 200000);' in statements
+    assert not any(s.startswith('INSERT INTO orders_shadow') for s in statements)
+    # 外键在全部影子表建好之后添加，且指向被引用表的影子表
+    alters = [i for i, s in enumerate(statements) if s.startswith('ALTER TABLE')]
+    creates = [i for i, s in enumerate(statements) if s.startswith('CREATE TABLE')]
+    assert len(alters) == sum(len(FOREIGN_KEYS[t]) for t in ('order_items', 'organizations'))
+    assert max(creates) < min(alters)
+    assert ('ALTER TABLE order_items_shadow ADD CONSTRAINT order_items_shadow_ibfk_1 '
+            'FOREIGN KEY (order_id) REFERENCES orders_shadow (id);') in statements
+    renames = [s for s in plan.swap_statements() if s.startswith('RENAME')]
+    assert len(renames) == 1
+    for table in plan.tables:
+        assert f"{table} TO {table}_old, {table}{SHADOW_SUFFIX} TO {table}" in renames[0]
+
+
+@pytest.fixture(scope='module')
+def runs(tmp_path_factory):
+    """(影子表模式的 SQL 文本, 影子表模式的表, 默认模式的表)"""
+    directory = tmp_path_factory.mktemp('shadow')
+    path = generate(directory, *ARGS, '--shadow', name='shadow.sql')
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    return (text, read_tables(path),
+            read_tables(generate(directory, *ARGS, name='plain.sql')))
+
+
+def test_inserts_go_to_shadow_tables_only(runs):
+    text, shadow, _ = runs
+    assert not re.search(r'^DELETE FROM', text, re.M)
+    assert all(table.endswith(SHADOW_SUFFIX) for table in shadow)
+    # 每张写入的影子表都先建表，再在唯一一条 RENAME 中换成在线表
+    rename = re.findall(r'^RENAME TABLE .*;$', text, re.M)
+    assert len(rename) == 1
+    last_insert = max(m.start() for m in re.finditer(r'^INSERT INTO \w+ \(', text, re.M))
+    assert text.index(rename[0]) > last_insert
+    for table in shadow:
+        online = table[:-len(SHADOW_SUFFIX)]
+        assert text.index(f"CREATE TABLE {table} LIKE {online};") < text.index(f"INSERT INTO {table} (")
+        assert f"{table} TO {online}" in rename[0]
+
+
+def test_shadow_rows_match_delete_mode(runs):
+    _, shadow, plain = runs
+    assert {table[:-len(SHADOW_SUFFIX)]: data for table, data in shadow.items()} == plain
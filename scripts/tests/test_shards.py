@@ -0,0 +1,63 @@
+"""分片输出：客户拥有的行按 customer_id 路由且不丢不重，参考数据复制到每个分片"""
+
+import csv
+import json
+import zlib
+from collections import Counter
+
+import pytest
+from conftest import column, generate, read_tables
+
+from seedgen.shards import shard_paths
+
+ARGS = ('--customer-scale', '0.2', '--sales-org')
+SHARDS = 3
+ROUTED = ('customers', 'orders', 'order_items', 'production_plans', 'delivery_records', 'customer_owner_history')
+REPLICATED = ('organizations', 'users', 'sales_targets')
+
+
+@pytest.fixture(scope='module')
+def sharded(tmp_path_factory):
+    """(不分片输出, [各分片], 分片输出路径)，参数相同"""
+    directory = tmp_path_factory.mktemp('shards')
+    single = read_tables(generate(directory, *ARGS, name='single.sql'))
+    output = generate(directory, *ARGS, '--shards', str(SHARDS), '--shard-function', 'crc32')
+    return single, [read_tables(path) for path in shard_paths(output, SHARDS)], output
+
+
+def test_routed_rows_partition_the_unsharded_output(sharded):
+    single, shards, _ = sharded
+    for table in ROUTED:
+        merged = Counter(row for shard in shards for row in shard[table][1])
+        assert merged == Counter(single[table][1]), table
+    for table in REPLICATED:
+        for shard in shards:
+            assert shard[table] == single[table], table
+
+
+def test_rows_follow_their_customer(sharded):
+    _, shards, output = sharded
+    for n, shard in enumerate(shards):
+        customers = set(column(shard, 'customers', 'id'))
+        assert all(zlib.crc32(str(c).encode()) % SHARDS == n for c in customers)
+        assert set(column(shard, 'orders', 'customer_id')) <= customers
+        assert set(column(shard, 'customer_owner_history', 'customer_id')) <= customers
+        orders = set(column(shard, 'orders', 'id'))
+        assert set(column(shard, 'order_items', 'order_id')) <= orders
+        assert set(column(shard, 'delivery_records', 'order_id')) <= orders
+
+    base = output[:-len('.sql')]
+    with open(base + '-shard-map.csv', encoding='utf-8') as f:
+        mapping = {int(row['customer_id']): int(row['shard']) for row in csv.DictReader(f)}
+    with open(base + '-shard-map.json', encoding='utf-8') as f:
+        shard_map = json.load(f)
+    for n, shard in enumerate(shards):
+        assert {c for c, s in mapping.items() if s == n} == set(column(shard, 'customers', 'id'))
+        assert shard_map['shards'][n]['customers'] == len(shard['customers'][1])
+        assert shard_map['shards'][n]['rows']['orders'] == len(shard['orders'][1])
+
+
+def test_mutation_stream_is_rejected(generator, capsys):
+    with pytest.raises(SystemExit):
+        generator.parse_args(['--shards', '2', '--mutation-stream', 'stream.sql'])
+    assert '--mutation-stream' in capsys.readouterr().err
@@ -0,0 +1,70 @@
+"""统计报告：分位数草图的相对误差不超过声明值；报告中的计数与合计与 SQL 文件一致"""
+
+import json
+import math
+import random
+from collections import Counter
+
+import pytest
+from conftest import column, generate, read_tables
+
+from seedgen.stats import QUANTILES, QuantileSketch
+
+
+def _exact(values, q):
+    """草图的分位数定义：排序后第 floor(q * (n - 1)) 个值"""
+    return sorted(values)[math.floor(q * (len(values) - 1))]
+
+
+@pytest.mark.parametrize('accuracy', [0.05, 0.01, 0.005])
+@pytest.mark.parametrize('distribution', ['lognormal', 'pareto', 'integers'])
+def test_quantile_error_within_bound(accuracy, distribution):
+    rng = random.Random(3)
+    draw = {
+        'lognormal': lambda: rng.lognormvariate(11, 1.2),
+        'pareto': lambda: 50000 * rng.paretovariate(1.1),
+        'integers': lambda: rng.randint(50000, 5000000),
+    }[distribution]
+    values = [draw() for _ in range(20000)]
+    sketch = QuantileSketch(accuracy)
+    for value in values:
+        sketch.add(value)
+    for q in (0.01, 0.1, *QUANTILES, 0.999):
+        exact = _exact(values, q)
+        assert abs(sketch.quantile(q) - exact) <= accuracy * exact * (1 + 1e-9), q
+    assert (sketch.count, sketch.min, sketch.max) == (len(values), min(values), max(values))
+
+
+def test_single_value_and_empty():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None and sketch.summary()['mean'] is None
+    sketch.add(123456)
+    assert all(sketch.quantile(q) == 123456 for q in QUANTILES)
+
+
+@pytest.fixture(scope='module')
+def report(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('stats')
+    path = str(directory / 'stats.json')
+    tables = read_tables(generate(directory, '--customer-scale', '0.1', '--stats-report', path))
+    with open(path, encoding='utf-8') as f:
+        return json.load(f), tables
+
+
+def test_report_matches_the_sql_file(report):
+    data, tables = report
+    amounts = column(tables, 'orders', 'total_amount')
+    summary = data['order_amount_fen']
+    assert (summary['count'], summary['sum']) == (len(amounts), sum(amounts)) == \
+        (data['meta']['orders'], data['meta']['revenue_fen'])
+    bound = data['order_amount_relative_accuracy']
+    for q in QUANTILES:
+        exact = _exact(amounts, q)
+        # 报告里的分位数保留两位小数
+        assert abs(summary[f"p{round(q * 100)}"] - exact) <= bound * exact + 0.01
+    statuses = Counter(column(tables, 'orders', 'status'))
+    assert {status: mix['count'] for status, mix in data['status_mix'].items()} == statuses
+    items = Counter(Counter(column(tables, 'order_items', 'order_id')).values())
+    assert {int(n): mix['count'] for n, mix in data['items_per_order']['distribution'].items()} == items
+    assert sum(month['orders'] for month in data['by_month'].values()) == len(amounts)
+    assert sum(rep['amount_fen'] for rep in data['by_rep'].values()) == sum(amounts)
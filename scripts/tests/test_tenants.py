@@ -0,0 +1,53 @@
+"""多租户：订单与客户、下单代表属于同一租户；租户组织与代表都有对应行；客户 id 在租户之间交错"""
+
+from collections import Counter
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen.tenants import TENANT_CONFIG
+
+TENANTS = 20
+ARGS = ('--customer-scale', '0.5', '--tenants', str(TENANTS))
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    return read_tables(generate(tmp_path_factory.mktemp('tenants'), *ARGS))
+
+
+def _rows(tables, table):
+    columns, rows = tables[table]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def _customers_per_tenant(tables):
+    return Counter(row['org_id'] for row in _rows(tables, 'customers'))
+
+
+def test_orders_stay_inside_their_tenant(tables, generator):
+    customers = {row['id']: row['org_id'] for row in _rows(tables, 'customers')}
+    reps = {row['id']: row['org_id'] for row in _rows(tables, 'users')}
+    reps.update({rep['id']: generator.ORG_ID for rep in generator.SALES_REPS})
+    for order in _rows(tables, 'orders'):
+        assert order['org_id'] == customers[order['customer_id']] == reps[order['created_by']], order['id']
+
+
+def test_tenant_rows_exist(tables, generator):
+    orgs = {row['id'] for row in _rows(tables, 'organizations')}
+    assert len(orgs) == TENANTS - 1 and generator.ORG_ID not in orgs
+    assert all(org >= TENANT_CONFIG['id_offset'] for org in orgs)
+    assert {row['org_id'] for row in _rows(tables, 'users')} == orgs
+    assert set(_customers_per_tenant(tables)) <= orgs | {generator.ORG_ID}
+
+
+def test_large_tenants_and_interleaving(tables, generator):
+    counts = _customers_per_tenant(tables)
+    head = counts.most_common(TENANT_CONFIG['large_tenants'])
+    assert head[0][0] == generator.ORG_ID
+    share = sum(n for _, n in head) / sum(counts.values())
+    assert share == pytest.approx(TENANT_CONFIG['large_share'], abs=0.1)
+    # 相邻客户 id 的租户经常变化，而不是每个租户占一段连续 id
+    owners = [row['org_id'] for row in _rows(tables, 'customers')]
+    switches = sum(1 for a, b in zip(owners, owners[1:]) if a != b)
+    assert switches > len(owners) / 2
@@ -0,0 +1,91 @@
+"""期望文件 + 区间校验和：生成 → 导入 sqlite3 → 校验的往返，以及按声明类型规范化"""
+
+import re
+import sqlite3
+
+import pytest
+from conftest import generate, read_tables
+
+from seedgen import verify
+
+ARGS = ('--scenario', 'smoke', '--payloads', '--tenants', '5')
+DATETIME = re.compile(r'^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d$')
+DATE = re.compile(r'^\d{4}-\d\d-\d\d$')
+
+
+@pytest.fixture(scope='module')
+def loaded(tmp_path_factory):
+    """(期望文件, sqlite 数据库)"""
+    directory = tmp_path_factory.mktemp('verify')
+    expectations, database = str(directory / 'expectations.json'), str(directory / 'seed.db')
+    generate(directory, *ARGS, '--expectations', expectations, '--ingest', f'sqlite3:{database}')
+    return expectations, database
+
+
+@pytest.fixture
+def database(loaded, tmp_path):
+    """导入结果的副本，用例可以随意改写"""
+    copy = str(tmp_path / 'seed.db')
+    with sqlite3.connect(loaded[1]) as source, sqlite3.connect(copy) as target:
+        source.backup(target)
+    return copy
+
+
+def _verify(expectations, database):
+    return verify.main([expectations, '--db', f'sqlite3:{database}'])
+
+
+def test_round_trip(loaded, database):
+    assert _verify(loaded[0], database) == 0
+
+
+def test_database_text_forms_are_normalized(loaded, database):
+    # MySQL 的 DATETIME(6) 带微秒后缀，DECIMAL 按声明的小数位补零
+    with sqlite3.connect(database) as conn:
+        conn.execute("UPDATE customers SET created_at = created_at || '.000000'")
+        conn.execute("UPDATE orders SET order_date = order_date || ' 00:00:00'")
+        conn.execute("UPDATE delivery_records SET temperature = printf('%.1f', temperature)")
+        conn.execute("UPDATE materials SET unit_cost = printf('%.6f', unit_cost)")
+        conn.execute("UPDATE sales_targets SET revenue_target = CAST(revenue_target AS INTEGER) "
+                     "WHERE revenue_target = CAST(revenue_target AS INTEGER)")
+    assert _verify(loaded[0], database) == 0
+
+
+@pytest.mark.parametrize('statement', [
+    "UPDATE materials SET stock_qty = stock_qty + 0.001 WHERE id = 3",
+    "UPDATE leads SET updated_at = '2025-01-01 00:00:01' WHERE id = 5",
+    "UPDATE order_items SET quantity = quantity + 1 WHERE id = 10",
+    "DELETE FROM lead_activities WHERE id = 7",
+])
+def test_changes_are_detected(loaded, database, capsys, statement):
+    with sqlite3.connect(database) as conn:
+        conn.execute(statement)
+    assert _verify(loaded[0], database) == 1
+    table = statement.split()[1] if statement.startswith('UPDATE') else statement.split()[2]
+    assert f"[不一致] {table}" in capsys.readouterr().out
+
+
+def test_every_typed_column_is_declared(tmp_path):
+    """生成的日期 / 时间 / 小数列都在 COLUMN_TYPES 中声明，摘要不依赖取值的文本形式"""
+    for table, (columns, rows) in read_tables(generate(tmp_path, *ARGS)).items():
+        declared = verify.column_types(table, columns)
+        for i, name in enumerate(columns):
+            values = [row[i] for row in rows if row[i] is not None]
+            if any(isinstance(v, float) for v in values):
+                assert declared.get(name, '').startswith('decimal:'), f"{table}.{name}"
+            elif values and all(isinstance(v, str) and DATETIME.match(v) for v in values):
+                assert declared.get(name) == 'datetime', f"{table}.{name}"
+            elif values and all(isinstance(v, str) and DATE.match(v) for v in values):
+                assert declared.get(name) == 'date', f"{table}.{name}"
+
+
+def test_row_digest_matches_column_sql():
+    conn = sqlite3.connect(':memory:')
+    verify._sqlite_functions(conn)
+    conn.execute("CREATE TABLE t (a, b, c, d, e)")
+    conn.execute("INSERT INTO t VALUES (1, '2025-03-04 05:06:07.000000', '2025-03-04', '12.30', NULL)")
+    kinds = [None, 'datetime', 'date', 'decimal:2', 'decimal:1']
+    expressions = ', '.join(verify.column_sql(c, k) for c, k in zip('abcde', kinds))
+    (digest,) = conn.execute(f"SELECT CRC32(CONCAT_WS('|', {expressions})) FROM t").fetchone()
+    assert digest == verify.row_digest([1, '2025-03-04 05:06:07', '2025-03-04', 12.3, None], kinds)
+    assert verify.normalize(12, 'decimal:2') == verify.normalize('12.00', 'decimal:2') == 1200